@@ -0,0 +1,82 @@
+"""
+History ingest of a month of loss trees for every line.
+
+Ingests the sample loss tree pages as 31 days x 3 shifts for ten lines into
+an in-memory store, then queries the weekly KPIs, top reasons and category
+downtime. The BDE/PF categories of ``loss_tree_shift_6.html`` are checked
+against the page: one "Breakdown" stop of 81.2 min, no truncated section
+rows. Run from the repository root:
+
+    python -m benchmarks.bench_history
+"""
+
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.core.history import HistoryStore
+from src.core.python_spa.losstree import extract_typed_loss_tree
+
+LINES = [f"{n}" for n in range(17, 27)]
+DAYS = 31
+SHIFTS = 3
+FIRST_DAY = date(2025, 7, 1)
+BUDGET_S = 2.0
+
+# The BDE and PF categories of loss_tree_shift_6.html
+SHIFT_6_CATEGORIES = {
+    "bde": [("Breakdown", 1.0, 81.2)],
+    "pf": [("Waiting for material(s", 0.0, 14.2)],
+}
+
+
+def check_shift_6() -> None:
+    with open("assets/loss_tree_shift_6.html", encoding="utf-8") as f:
+        tree = extract_typed_loss_tree(f.read())
+    store = HistoryStore()
+    store.ingest("21", "Maker", tree, day=FIRST_DAY, shift=1)
+    for kind, expected in SHIFT_6_CATEGORIES.items():
+        found = [
+            (row["category"], row["stops"], round(row["downtime"], 1))
+            for row in store.category_downtime(kind, "21", "Maker")
+        ]
+        if found != expected:
+            raise SystemExit(f"{kind} categories {found}, expected {expected}")
+
+
+def main() -> None:
+    check_shift_6()
+    trees = [
+        extract_typed_loss_tree(path.read_text(encoding="utf-8"))
+        for path in sorted(Path("assets").glob("loss_tree_shift_*.html"))
+    ]
+    store = HistoryStore()
+
+    start = time.perf_counter()
+    pages = 0
+    for line in LINES:
+        for day in range(DAYS):
+            for shift in range(1, SHIFTS + 1):
+                tree = trees[pages % len(trees)]
+                store.ingest(
+                    line, "Maker", tree, day=FIRST_DAY + timedelta(day), shift=shift
+                )
+                pages += 1
+    ingested = time.perf_counter()
+    weeks = store.weekly_kpis()
+    reasons = store.top_reasons(LINES[0], "Maker", FIRST_DAY)
+    categories = store.category_downtime("pf")
+    done = time.perf_counter()
+
+    total = done - start
+    print(f"{pages} pages, {len(weeks)} line weeks")
+    print(f"ingest  {(ingested - start) * 1000:7.1f} ms")
+    print(f"queries {(done - ingested) * 1000:7.1f} ms")
+    print(f"total   {total * 1000:7.1f} ms (budget {BUDGET_S * 1000:.0f} ms)")
+    print(f"{len(reasons)} top reasons, {len(categories)} pf categories")
+    if total > BUDGET_S:
+        raise SystemExit("over budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Event-loop responsiveness while a page is parsed.
+
+A 10 ms ticker runs on the asyncio loop (as the Tk loop does under
+async_tkinter_loop) while the sample loss-tree pages are parsed inline,
+in a thread and in a process. The worst tick delay is what the user sees
+as a frozen window. Run from the repository root:
+
+    python -m benchmarks.bench_loop_lag
+"""
+
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+from src.core.python_spa.losstree import extract_loss_tree
+from src.core.worker import ParseWorker
+
+TICK = 0.010
+PAGES = sorted(Path("assets").glob("loss_tree_shift_*.html"))
+
+
+async def ticker(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def measure(mode: str, htmls: list) -> None:
+    lags: list = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(TICK * 3)
+
+    worker = None
+    if mode != "inline":
+        worker = ParseWorker(use_processes=mode == "process")
+        await worker.run("warmup", len, "")
+
+    start = time.perf_counter()
+    for html in htmls:
+        if worker is None:
+            extract_loss_tree(html)
+            await asyncio.sleep(0)
+        else:
+            await worker.run("bench", extract_loss_tree, html)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await tick_task
+    if worker is not None:
+        worker.shutdown()
+    print(
+        f"{mode:<8} parse {elapsed * 1e3:7.0f} ms"
+        f"  max lag {max(lags) * 1e3:6.1f} ms"
+        f"  median lag {statistics.median(lags) * 1e3:5.1f} ms"
+    )
+
+
+def main() -> None:
+    htmls = [page.read_text() for page in PAGES]
+    for mode in ("inline", "thread", "process"):
+        asyncio.run(measure(mode, htmls))
+
+
+if __name__ == "__main__":
+    main()
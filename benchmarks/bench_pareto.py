@@ -0,0 +1,71 @@
+"""
+Pareto aggregation of a month of stop tables for every line.
+
+Stacks 31 days x 3 shifts of the sample equipment page for ten lines, with
+the descriptions shuffled per page so groups do not line up trivially, and
+ranks the top reasons per line and per shift. Run from the repository root:
+
+    python -m benchmarks.bench_pareto
+"""
+
+import time
+
+import numpy as np
+
+from src.core.pareto import pareto, stack_stop_tables
+from src.core.python_spa.stop_stats import StopStatsColumns, extract_stop_columns
+
+LINES = [f"{n}" for n in range(17, 27)]
+DAYS = 31
+SHIFTS = 3
+BUDGET_S = 1.0
+
+
+def month_of_tables(sample: StopStatsColumns):
+    rng = np.random.default_rng(0)
+    for line in LINES:
+        for day in range(1, DAYS + 1):
+            for shift in range(1, SHIFTS + 1):
+                order = rng.permutation(len(sample))
+                table = StopStatsColumns(
+                    machine=sample.machine,
+                    description=sample.description[order],
+                    stops=rng.integers(0, 12, len(sample)),
+                    downtime_min=rng.random(len(sample)) * 30,
+                    oee_percent=sample.oee_percent,
+                    rejects_percent=sample.rejects_percent,
+                    stops_per_shift=sample.stops_per_shift,
+                )
+                yield (
+                    {"line": line, "date": f"2025-07-{day:02d}", "shift": shift},
+                    table,
+                )
+
+
+def main() -> None:
+    with open("assets/period_equipment_data.html", encoding="utf-8") as f:
+        sample = extract_stop_columns(f.read())
+    tables = list(month_of_tables(sample))
+
+    start = time.perf_counter()
+    frame = stack_stop_tables(tables)
+    stacked = time.perf_counter()
+    by_line = pareto(frame, partition_by=("line",), top=10)
+    by_shift = pareto(
+        frame, partition_by=("line", "shift"), metric="downtime_min", top=10
+    )
+    overall = pareto(frame, reason_by=("description",), top=20)
+    done = time.perf_counter()
+
+    total = done - start
+    print(f"{len(tables)} pages, {len(frame)} rows")
+    print(f"stack   {(stacked - start) * 1000:7.1f} ms")
+    print(f"pareto  {(done - stacked) * 1000:7.1f} ms (3 rankings)")
+    print(f"total   {total * 1000:7.1f} ms (budget {BUDGET_S * 1000:.0f} ms)")
+    print(f"groups: {len(by_line)} by line, {len(by_shift)} by shift, {len(overall)}")
+    if total > BUDGET_S:
+        raise SystemExit("over budget")
+
+
+if __name__ == "__main__":
+    main()
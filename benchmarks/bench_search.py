@@ -0,0 +1,79 @@
+"""
+Full-text search over three years of saved reports.
+
+Indexes the sample report block with the stop list of the sample equipment
+page (a random third of it per report) for ten lines, three shifts a day,
+then times typical queries. Run from the repository root:
+
+    python -m benchmarks.bench_search
+"""
+
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.core.python_spa.stop_stats import extract_stop_columns
+from src.core.search import ReportDoc, ReportIndex
+
+LINES = [f"LU{n}" for n in range(17, 27)]
+DAYS = 3 * 365
+SHIFTS = 3
+QUERIES = [
+    ("rod break", {}),
+    ("standby", {"line": "LU21"}),
+    ('"upstream machine"', {"date_from": "2025-01-01"}),
+    ("foil*", {"shift": "Shift 2"}),
+    ("no speed focke", {"line": "LU18", "shift": "Shift 3"}),
+]
+BUDGET_MS = 20.0
+
+REPORT = (
+    "`+------+--------+--------+---+`\n"
+    "`| P_18 | TARGET | ACTUAL |   |`\n"
+    "`| STOP | 3      | 12     | 🔴 |`\n"
+    "`| PR   | 65     | 79.1   | 🟢 |`\n"
+    "`+------+--------+--------+---+`\n"
+)
+
+
+def main() -> None:
+    with open("assets/period_equipment_data.html", encoding="utf-8") as f:
+        sample = extract_stop_columns(f.read())
+    stops = [f"{m} {d}" for m, d in zip(sample.machine, sample.description)]
+    rng = np.random.default_rng(0)
+
+    index = ReportIndex()
+    start = time.perf_counter()
+    for day in range(DAYS):
+        day_text = (date(2023, 1, 1) + timedelta(days=day)).isoformat()
+        for shift in range(1, SHIFTS + 1):
+            for line in LINES:
+                keep = rng.random(len(stops)) < 1 / 3
+                index.add(
+                    ReportDoc(
+                        date=day_text,
+                        shift=f"Shift {shift}",
+                        line=line,
+                        user="operator",
+                        text=REPORT,
+                        stops=[s for s, k in zip(stops, keep) if k],
+                    )
+                )
+    built = time.perf_counter()
+    print(f"{len(index)} reports indexed in {built - start:.2f} s")
+
+    worst = 0.0
+    for query, filters in QUERIES:
+        start = time.perf_counter()
+        hits = index.search(query, **filters)
+        elapsed = (time.perf_counter() - start) * 1000
+        worst = max(worst, elapsed)
+        print(f"{elapsed:7.2f} ms  {len(hits):4d} hits  {query} {filters}")
+    print(f"worst {worst:.2f} ms (budget {BUDGET_MS:.0f} ms)")
+    if worst > BUDGET_MS:
+        raise SystemExit("over budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Startup profile and time-to-first-window budget for the desktop app.
+
+1. Runs ``python -X importtime`` on the GUI module and lists the slowest
+   imports (cumulative), which is what delays the first window.
+2. Starts ``main.py`` with ``MPNS_STARTUP_PROFILE=exit`` a few times and
+   compares the median time-to-first-window with ``STARTUP_BUDGET_MS``.
+
+Exits with status 1 when the budget is exceeded. Run from the repository root:
+
+    python -m benchmarks.bench_startup
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+STARTUP_BUDGET_MS = 1500
+RUNS = 5
+TOP = 15
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+_FIRST_WINDOW = re.compile(r"time-to-first-window-ms: (\d+)")
+
+
+def import_profile(module: str = "src.gui.views") -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((int(cumulative_us), int(self_us), len(indent) // 2, name))
+    if not rows:
+        print(result.stderr.strip() or "no -X importtime output")
+        return
+
+    total_ms = next((row[0] for row in rows if row[3] == module), 0) / 1000
+    print(f"import {module}: {total_ms:.0f} ms")
+    print(f"{'cumulative':>12} {'self':>8}  module")
+    for cumulative_us, self_us, _, name in sorted(rows, reverse=True)[:TOP]:
+        print(f"{cumulative_us / 1000:10.1f}ms {self_us / 1000:6.1f}ms  {name}")
+
+
+def first_window_ms() -> int | None:
+    env = dict(os.environ, MPNS_STARTUP_PROFILE="exit")
+    result = subprocess.run(
+        [sys.executable, "main.py"], capture_output=True, text=True, env=env
+    )
+    match = _FIRST_WINDOW.search(result.stderr)
+    if not match:
+        print(result.stderr.strip().splitlines()[-1:] or ["main.py failed"])
+        return None
+    return int(match.group(1))
+
+
+def main() -> int:
+    import_profile()
+    print()
+
+    timings = [ms for ms in (first_window_ms() for _ in range(RUNS)) if ms]
+    if not timings:
+        print("time-to-first-window: not measured (no display?)")
+        return 0
+    median = statistics.median(timings)
+    print(
+        f"time-to-first-window: median {median:.0f} ms over {len(timings)} runs"
+        f" (budget {STARTUP_BUDGET_MS} ms)"
+    )
+    return 1 if median > STARTUP_BUDGET_MS else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
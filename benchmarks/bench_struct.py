@@ -0,0 +1,104 @@
+"""
+Construction, serialization and memory cost of the result objects.
+
+Compares the slots-based ``spa_struct`` classes with the pydantic models they
+replaced. Run from the repository root:
+
+    python -m benchmarks.bench_struct
+"""
+
+import timeit
+import tracemalloc
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.core.python_spa.spa_struct import Losses, UnplannedStopReason
+
+N = 10_000
+
+ROW = dict(
+    description="MAX roll. block jam",
+    stops="9",
+    ramp_up="-",
+    downtime="14.0",
+    uptime_loss="3.53",
+    mtbf="35.1",
+    mttr="1.6",
+    rejects_percent="0.010",
+    stops_per_shift="9",
+    causing_equipment="Maker - Code:12",
+)
+LOSSES = dict(stops="5", downtime="29.6", uptime_loss="6.16", mtbf="73.3", mttr="5.9")
+
+
+class PydanticLosses(BaseModel):
+    time: Optional[str] = None
+    stops: Optional[str] = None
+    downtime: Optional[str] = None
+    uptime_loss: Optional[str] = None
+    mtbf: Optional[str] = None
+    mttr: Optional[str] = None
+    details: Optional[str] = None
+
+
+class PydanticUnplannedStopReason(BaseModel):
+    description: Optional[str] = None
+    stops: Optional[str] = None
+    ramp_up: Optional[str] = None
+    downtime: Optional[str] = None
+    uptime_loss: Optional[str] = None
+    mtbf: Optional[str] = None
+    mttr: Optional[str] = None
+    rejects_percent: Optional[str] = None
+    stops_per_shift: Optional[str] = None
+    causing_equipment: Optional[str] = None
+
+
+def build(reason_cls, losses_cls):
+    return [(reason_cls(**ROW), losses_cls(**LOSSES)) for _ in range(N)]
+
+
+def peak_memory(reason_cls, losses_cls) -> int:
+    tracemalloc.start()
+    objects = build(reason_cls, losses_cls)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return peak
+
+
+def report(name, reason_cls, losses_cls, dump) -> None:
+    objects = build(reason_cls, losses_cls)
+    construct = min(
+        timeit.repeat(lambda: build(reason_cls, losses_cls), number=1, repeat=5)
+    )
+    serialize = min(
+        timeit.repeat(lambda: [dump(r) for r, _ in objects], number=1, repeat=5)
+    )
+    memory = peak_memory(reason_cls, losses_cls)
+    print(
+        f"{name:<10} construct {construct * 1e3:8.2f} ms"
+        f"  to_dict {serialize * 1e3:8.2f} ms"
+        f"  peak {memory / 1024:8.0f} KiB  ({N} rows)"
+    )
+
+
+def main() -> None:
+    report(
+        "pydantic",
+        PydanticUnplannedStopReason,
+        PydanticLosses,
+        lambda obj: obj.model_dump(),
+    )
+    report("slots", UnplannedStopReason, Losses, lambda obj: obj.to_dict())
+    report(
+        "validated",
+        lambda **row: UnplannedStopReason.model_validate(row),
+        lambda **row: Losses.model_validate(row),
+        lambda obj: obj.to_dict(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
-from async_tkinter_loop import async_mainloop
+import time
 
-from src import View
+_START = time.perf_counter()
+
+from async_tkinter_loop import async_mainloop  # noqa: E402
+
+from src import View  # noqa: E402
+from src.utils.helpers import report_startup_time  # noqa: E402
 
 
 def main():
     app = View()
+    report_startup_time(app, _START)
     async_mainloop(app)
 
 
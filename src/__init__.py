@@ -1,2 +1,10 @@
-from .gui.views import View
 from .utils.helpers import resource_path
+
+
+def __getattr__(name):
+    # Importing the GUI pulls in tkinter/ttkbootstrap; only do it for View
+    if name == "View":
+        from .gui.views import View
+
+        return View
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
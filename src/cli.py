@@ -0,0 +1,636 @@
+"""
+Headless report generation, e.g. for cron on a server::
+
+    python cli.py --lines LU18 LU21 --dates 2025-07-13 --shifts 1 2 3 --output reports --qr
+
+With ``--rollup`` the shift loss trees of each line are also combined into
+one day (or week, for several dates) block, from the pages already fetched,
+and ``--delta N`` lists the N biggest stop reason changes between consecutive
+shifts of each line. ``--anomalies`` learns the usual stops of every reason
+over the fetched shifts, in order, and flags the unusual ones in each report.
+``--history`` stores every fetched shift in a local SQLite file and prints
+the daily KPIs and the top reasons of the week from its roll-ups.
+
+Run it through cli.py next to main.py so config.ini, DB.xlsx and the Target
+folder are read from the same folder as the GUI uses.
+
+Produces the same target-vs-actual blocks as the Result button, the stop
+reason table of Get Data and optionally the QR code PNG, without importing
+tkinter or ttkbootstrap.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from src.core.history import HistoryStore, week_of
+from src.core.logic import (
+    read_equipment_columns,
+    read_loss_tree,
+    read_typed_loss_tree,
+    typed_actual,
+)
+from src.core.planner import (
+    DEFAULT_FIELDS,
+    EquipmentQuery,
+    ShiftViews,
+    plan_equipment_queries,
+)
+from src.core.python_spa.stop_stats import STOP_COLUMN_HEADERS, StopStatsColumns
+from src.core.python_spa.typed_struct import TypedLossTree
+from src.core.report import format_result, format_stop_table, report_title
+from src.core.rolling import parse_window
+from src.core.scheduler import shift_bounds
+from src.core.worker import ParseWorker
+from src.utils.constants import (
+    ANOMALY_MIN_SHIFTS,
+    FUNCTIONAL_LOCATIONS,
+    HEADERS,
+    HISTORY_FILE,
+)
+from src.utils.csvhandle import TARGETS
+from src.utils.helpers import get_url, read_config
+
+WORKER_KEY = "cli"
+
+
+@dataclass(slots=True)
+class ReportJob:
+    link_up: str
+    date: str
+    shift: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.date}_shift{self.shift}_LU{self.link_up}"
+
+
+@dataclass(slots=True)
+class Report:
+    summary: str
+    """Date, shift and target-vs-actual blocks; what the QR code encodes."""
+    time_period: str
+    stop_frame: Any
+    stop_columns: StopStatsColumns
+    loss_trees: Dict[str, TypedLossTree] = field(default_factory=dict)
+    """Typed loss tree per functional location, kept for ``--rollup``/``--windows``."""
+    flags: str = ""
+    """Unusual stops found by ``--anomalies``."""
+
+    @property
+    def stop_table(self) -> str:
+        return f"{self.time_period}\n{format_stop_table(self.stop_frame)}\n"
+
+    @property
+    def text(self) -> str:
+        return f"{self.summary}{self.flags}{self.stop_table}"
+
+
+@dataclass(slots=True)
+class RunStats:
+    reports: int = 0
+    failed: int = 0
+    pages: int = 0
+    bytes: int = 0
+    fetch_ms: List[float] = field(default_factory=list)
+    parse_ms: List[float] = field(default_factory=list)
+
+    def summary(self, elapsed: float) -> str:
+        rate = self.reports / elapsed if elapsed else 0.0
+        return (
+            f"{self.reports} reports ({self.failed} failed) in {elapsed:.2f} s, "
+            f"{rate:.1f} reports/s, {self.pages} pages, {self.bytes / 1e6:.1f} MB\n"
+            f"fetch {_percentiles(self.fetch_ms)}, parse {_percentiles(self.parse_ms)}"
+        )
+
+
+def _percentiles(samples: Sequence[float]) -> str:
+    if not samples:
+        return "-"
+    if len(samples) == 1:
+        return f"p50 {samples[0]:.0f} ms"
+    cuts = statistics.quantiles(samples, n=20)
+    return f"p50 {cuts[9]:.0f} ms, p95 {cuts[18]:.0f} ms"
+
+
+async def _fetch(
+    client: httpx.AsyncClient, url: str, stats: RunStats
+) -> httpx.Response:
+    from src.utils.constants import NTLM_AUTH
+
+    start = time.perf_counter()
+    response = await client.get(
+        url, follow_redirects=True, headers=HEADERS, auth=NTLM_AUTH
+    )
+    response.raise_for_status()
+    stats.fetch_ms.append((time.perf_counter() - start) * 1000)
+    stats.pages += 1
+    stats.bytes += len(response.content)
+    return response
+
+
+async def _parse(
+    worker: ParseWorker,
+    stats: RunStats,
+    reader: Callable[..., Awaitable[Any]],
+    response: httpx.Response,
+) -> Any:
+    start = time.perf_counter()
+    result = await reader(response, worker, WORKER_KEY)
+    stats.parse_ms.append((time.perf_counter() - start) * 1000)
+    return result
+
+
+def _targets(link_up: str, func_location: str, shift: str):
+    try:
+        return TARGETS.get(func_location, link_up, shift)
+    except Exception as e:
+        print(
+            f"warning: no targets for {func_location} LU{link_up}: {e}", file=sys.stderr
+        )
+        return None
+
+
+class StopTables:
+    """
+    Equipment pages fetched as planned by ``plan_equipment_queries``.
+
+    A page covering several shifts is fetched once for the line and shared
+    by the reports of all those shifts.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        worker: ParseWorker,
+        config,
+        stats: RunStats,
+        queries: Sequence[EquipmentQuery],
+    ) -> None:
+        self.client = client
+        self.worker = worker
+        self.config = config
+        self.stats = stats
+        self._query_of = {
+            (query.date, shift): query for query in queries for shift in query.shifts
+        }
+        self._tasks: Dict[Tuple[str, EquipmentQuery], asyncio.Future] = {}
+
+    def get(self, link_up: str, date: str, shift: str) -> Awaitable[ShiftViews]:
+        query = self._query_of[(date, int(shift))]
+        task = self._tasks.get((link_up, query))
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(link_up, query))
+            self._tasks[(link_up, query)] = task
+        return task
+
+    async def _fetch(self, link_up: str, query: EquipmentQuery) -> ShiftViews:
+        url = query.url(self.config, link_up)
+        response = await _fetch(self.client, url, self.stats)
+        time_period, columns = await _parse(
+            self.worker, self.stats, read_equipment_columns, response
+        )
+        return query.views(time_period, columns)
+
+
+async def build_report(
+    job: ReportJob,
+    client: httpx.AsyncClient,
+    worker: ParseWorker,
+    config,
+    locations: Sequence[str],
+    stop_tables: StopTables,
+    fields: Sequence[str],
+    stats: RunStats,
+    keep_trees: bool = False,
+) -> Report:
+    """Fetch every page of one line and shift concurrently and format the report."""
+    urls = [
+        get_url(
+            config,
+            "norm_period_loss_tree",
+            job.link_up,
+            job.date,
+            job.shift,
+            location[0:4],
+        )
+        for location in locations
+    ]
+    views, *loss_trees = await asyncio.gather(
+        stop_tables.get(job.link_up, job.date, job.shift),
+        *(_fetch(client, url, stats) for url in urls),
+    )
+
+    time_period, columns = views[int(job.shift)]
+    df = columns.to_frame(fields)
+    reader = read_typed_loss_tree if keep_trees else read_loss_tree
+    results = await asyncio.gather(
+        *(_parse(worker, stats, reader, response) for response in loss_trees)
+    )
+    trees = dict(zip(locations, results)) if keep_trees else {}
+    if keep_trees:
+        results = [(typed_actual(tree), None) for tree in results]
+
+    report = "".join(
+        format_result(
+            report_title(location, job.link_up),
+            actual,
+            _targets(job.link_up, location, job.shift),
+        )
+        for location, (actual, _) in zip(locations, results)
+    )
+    return Report(
+        summary=f"{job.date}, Shift {job.shift}\n{report}",
+        time_period=time_period,
+        stop_frame=df,
+        stop_columns=columns,
+        loss_trees=trees,
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    config = read_config()
+    link_ups = args.lines or config.get("DEFAULT", "link_up").split(",")
+    jobs = [
+        ReportJob(link_up.lstrip("LU"), date, str(shift))
+        for date in args.dates
+        for shift in args.shifts
+        for link_up in link_ups
+    ]
+    queries = plan_equipment_queries(args.dates, args.shifts, args.stop_fields)
+    if args.output:
+        args.output.mkdir(parents=True, exist_ok=True)
+
+    TARGETS.preload()
+    stats = RunStats()
+    worker = ParseWorker(max_workers=args.workers, use_processes=args.processes)
+    limit = asyncio.Semaphore(args.concurrency)
+    limits = httpx.Limits(
+        max_connections=args.concurrency * (1 + len(args.locations)),
+        max_keepalive_connections=args.concurrency * (1 + len(args.locations)),
+    )
+
+    async def produce(job: ReportJob, client: httpx.AsyncClient) -> None:
+        async with limit:
+            try:
+                report = await build_report(
+                    job,
+                    client,
+                    worker,
+                    config,
+                    args.locations,
+                    stop_tables,
+                    args.stop_fields,
+                    stats,
+                    keep_trees=args.rollup or bool(args.windows) or bool(args.history),
+                )
+                if history is not None:
+                    for location, tree in report.loss_trees.items():
+                        history.ingest(
+                            job.link_up,
+                            location,
+                            tree,
+                            day=job.date,
+                            shift=int(job.shift),
+                        )
+                if args.anomalies:
+                    # Written once every shift before it has been learned
+                    held.append((job, report))
+                else:
+                    await _write(job, report, args.output, args.qr, worker)
+            except Exception as e:
+                stats.failed += 1
+                print(f"{job.name}: {e}", file=sys.stderr)
+                return
+            stats.reports += 1
+            labels = {"line": job.link_up, "date": job.date, "shift": job.shift}
+            stop_tables_done.append((labels, report.stop_columns))
+            start = shift_bounds(date.fromisoformat(job.date), int(job.shift)).start
+            for location, tree in report.loss_trees.items():
+                loss_trees_done.setdefault((job.link_up, location), []).append(
+                    (start, tree)
+                )
+
+    held: List[Tuple[ReportJob, Report]] = []
+    stop_tables_done = []
+    loss_trees_done: Dict[Tuple[str, str], List[Tuple[datetime, TypedLossTree]]] = {}
+    history = HistoryStore(args.history) if args.history else None
+    start = time.perf_counter()
+    try:
+        async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+            stop_tables = StopTables(client, worker, config, stats, queries)
+            await asyncio.gather(*(produce(job, client) for job in jobs))
+        if held:
+            await _write_flagged(held, args, worker)
+    finally:
+        worker.shutdown()
+        if history is not None:
+            _write_history(history, jobs, args)
+            history.close()
+    if args.pareto:
+        _write_pareto(stop_tables_done, args)
+    if args.rollup:
+        _write_rollup(loss_trees_done, args)
+    if args.windows:
+        _write_windows(loss_trees_done, args)
+    if args.delta:
+        _write_deltas(stop_tables_done, args)
+    print(stats.summary(time.perf_counter() - start), file=sys.stderr)
+    return 1 if stats.failed else 0
+
+
+def _write_pareto(tables, args: argparse.Namespace) -> None:
+    from tabulate import tabulate
+
+    from src.core.pareto import pareto, stack_stop_tables
+
+    table = pareto(
+        stack_stop_tables(tables),
+        partition_by=args.pareto_by,
+        metric=args.pareto_metric,
+        top=args.pareto,
+    )
+    text = tabulate(table.rows(), headers=table.headers(), floatfmt=".1f") + "\n"
+    if args.output is None:
+        print(f"==> pareto\n{text}")
+    else:
+        (args.output / "pareto.txt").write_text(text, encoding="utf-8")
+
+
+async def _write_flagged(
+    reports: List[Tuple[ReportJob, Report]],
+    args: argparse.Namespace,
+    worker: ParseWorker,
+) -> None:
+    from src.core.anomaly import StopAnomalyDetector, flag_marks, format_flags
+
+    detector = StopAnomalyDetector(
+        method=args.anomaly_method,
+        z=args.anomaly_z,
+        min_shifts=args.anomaly_min_shifts,
+    )
+    reports.sort(key=lambda item: (item[0].link_up, item[0].date, int(item[0].shift)))
+    for job, report in reports:
+        flags = detector.observe(
+            job.link_up, report.stop_columns, shift_id=(job.date, job.shift)
+        )
+        columns = report.stop_columns
+        keys = zip(columns.machine.tolist(), columns.description.tolist())
+        report.stop_frame = report.stop_frame.assign(Flag=flag_marks(list(keys), flags))
+        report.flags = format_flags(flags) + ("\n" if flags else "")
+        await _write(job, report, args.output, args.qr, worker)
+
+
+def _write_deltas(tables, args: argparse.Namespace) -> None:
+    from src.core.delta import stop_deltas
+    from src.core.report import format_delta_table
+
+    # Consecutive reported shifts of each line, oldest first
+    by_line: Dict[str, List[Tuple[str, int, StopStatsColumns]]] = {}
+    for labels, columns in tables:
+        by_line.setdefault(labels["line"], []).append(
+            (labels["date"], int(labels["shift"]), columns)
+        )
+    blocks = []
+    for link_up, shifts in sorted(by_line.items()):
+        shifts.sort(key=lambda item: item[:2])
+        for (day, shift, before), (next_day, next_shift, after) in zip(
+            shifts, shifts[1:]
+        ):
+            table = stop_deltas(before, after, args.delta_metric, args.delta)
+            blocks.append(
+                f"LU{link_up} {day} shift {shift} -> {next_day} shift {next_shift}\n"
+                f"{format_delta_table(table, ('stops', 'downtime'))}\n\n"
+            )
+    text = "".join(blocks)
+    if args.output is None:
+        print(f"==> delta\n{text}")
+    else:
+        (args.output / "delta.txt").write_text(text, encoding="utf-8")
+
+
+def _write_windows(
+    loss_trees: Dict[Tuple[str, str], List[Tuple[datetime, TypedLossTree]]],
+    args: argparse.Namespace,
+) -> None:
+    from tabulate import tabulate
+
+    from src.core.rolling import KPIS, RollingKPIs, ShiftSample
+
+    rolling = RollingKPIs(args.windows)
+    for (link_up, location), shifts in sorted(loss_trees.items()):
+        title = report_title(location, link_up)
+        for start, tree in sorted(shifts, key=lambda item: item[0]):
+            rolling.add(title, ShiftSample.from_tree(tree, start))
+    labels = dict(zip(args.windows, args.window_labels))
+    rows = [
+        [line, labels[window], *values] for line, window, *values in rolling.table()
+    ]
+    text = (
+        tabulate(rows, headers=["", "Window", "Shifts", *KPIS], floatfmt=".3g") + "\n"
+    )
+    if args.output is None:
+        print(f"==> windows\n{text}")
+    else:
+        (args.output / "windows.txt").write_text(text, encoding="utf-8")
+
+
+def _write_rollup(
+    loss_trees: Dict[Tuple[str, str], List[Tuple[datetime, TypedLossTree]]],
+    args: argparse.Namespace,
+) -> None:
+    from src.core.python_spa.rollup import rollup_loss_trees
+
+    blocks = []
+    for (link_up, location), shifts in sorted(loss_trees.items()):
+        trees = [tree for _, tree in shifts]
+        tree = rollup_loss_trees(trees)
+        # Targets are set per shift, so the roll-up only shows the actuals
+        blocks.append(
+            f"{tree.period} ({len(trees)} shifts)\n"
+            + format_result(report_title(location, link_up), typed_actual(tree), None)
+        )
+    text = "".join(blocks)
+    if args.output is None:
+        print(f"==> rollup\n{text}")
+    else:
+        (args.output / "rollup.txt").write_text(text, encoding="utf-8")
+
+
+def _write_history(
+    history: HistoryStore, jobs: Sequence[ReportJob], args: argparse.Namespace
+) -> None:
+    from tabulate import tabulate
+
+    from src.core.rolling import KPIS
+
+    dates = sorted({job.date for job in jobs})
+    lines = sorted({job.link_up for job in jobs})
+    rows = [
+        [report_title(row["location"], row["line"]), row["date"], row["shifts"]]
+        + [row[kpi] for kpi in KPIS]
+        for line in lines
+        for row in history.daily_kpis(line, None, dates[0], dates[-1])
+    ]
+    blocks = [
+        tabulate(rows, headers=["", "Date", "Shifts", *KPIS], floatfmt=".3g") + "\n"
+    ]
+    for week in sorted({week_of(day) for day in dates}):
+        for line in lines:
+            for location in args.locations:
+                reasons = history.top_reasons(line, location, week)
+                if reasons:
+                    blocks.append(
+                        f"\nTop reasons {report_title(location, line)} week of {week}\n"
+                        + tabulate(
+                            [list(reason.values()) for reason in reasons],
+                            headers=["Machine", "Description", "Stops", "Downtime"],
+                            floatfmt="g",
+                        )
+                        + "\n"
+                    )
+    text = "".join(blocks)
+    if args.output is None:
+        print(f"==> history\n{text}")
+    else:
+        (args.output / "history.txt").write_text(text, encoding="utf-8")
+
+
+async def _write(
+    job: ReportJob,
+    report: Report,
+    output: Optional[Path],
+    qr: bool,
+    worker: ParseWorker,
+) -> None:
+    if output is None:
+        print(f"==> {job.name}\n{report.text}")
+    else:
+        (output / f"{job.name}.txt").write_text(report.text, encoding="utf-8")
+    if qr:
+        from src.utils.qrimage import render_qr_image
+
+        image = await worker.run(
+            WORKER_KEY, render_qr_image, report.summary, "black", "orange"
+        )
+        image.save((output or Path.cwd()) / f"{job.name}.png")
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Generate daily reports without the GUI.",
+    )
+    parser.add_argument(
+        "--lines", nargs="+", help="link-ups, e.g. LU18 LU21 (default: config.ini)"
+    )
+    parser.add_argument("--dates", nargs="+", required=True, help="YYYY-MM-DD")
+    parser.add_argument(
+        "--shifts", nargs="+", type=int, choices=[1, 2, 3], default=[1, 2, 3]
+    )
+    parser.add_argument(
+        "--locations",
+        nargs="+",
+        choices=FUNCTIONAL_LOCATIONS,
+        default=FUNCTIONAL_LOCATIONS,
+    )
+    parser.add_argument(
+        "--stop-fields",
+        nargs="+",
+        choices=list(STOP_COLUMN_HEADERS),
+        default=list(DEFAULT_FIELDS),
+        help="stop table columns; without downtime/OEE/rejects a day is one request",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="write one .txt per report here instead of stdout"
+    )
+    parser.add_argument("--qr", action="store_true", help="also write QR code PNGs")
+    parser.add_argument(
+        "--pareto", type=int, metavar="N", help="also rank the top N stop reasons"
+    )
+    parser.add_argument(
+        "--pareto-by",
+        nargs="*",
+        choices=["line", "date", "shift", "machine"],
+        default=["line"],
+        help="rank the reasons within each of these (none: over everything)",
+    )
+    parser.add_argument(
+        "--pareto-metric", choices=["stops", "downtime_min"], default="stops"
+    )
+    parser.add_argument(
+        "--delta",
+        type=int,
+        metavar="N",
+        help="also list the N biggest stop reason changes between consecutive shifts",
+    )
+    parser.add_argument(
+        "--delta-metric", choices=["stops", "downtime"], default="downtime"
+    )
+    parser.add_argument(
+        "--windows",
+        nargs="+",
+        metavar="WINDOW",
+        help="also print PR/MTBF/... over trailing windows, e.g. 7d 30d 24h 3s (shifts)",
+    )
+    parser.add_argument(
+        "--anomalies",
+        action="store_true",
+        help="flag stop reasons far above their usual level in the earlier shifts",
+    )
+    parser.add_argument("--anomaly-method", choices=["ewma", "zscore"], default="ewma")
+    parser.add_argument(
+        "--anomaly-z", type=float, default=3.0, help="flag above this z-score"
+    )
+    parser.add_argument(
+        "--anomaly-min-shifts",
+        type=int,
+        default=ANOMALY_MIN_SHIFTS,
+        help="shifts of a line learned before anything is flagged",
+    )
+    parser.add_argument(
+        "--rollup",
+        action="store_true",
+        help="also combine the shifts of each line into one block (needs OTS pages)",
+    )
+    parser.add_argument(
+        "--history",
+        nargs="?",
+        const=HISTORY_FILE,
+        metavar="PATH",
+        help=f"store the shifts in a SQLite history (default {HISTORY_FILE})",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="reports fetched at once"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="parser workers")
+    parser.add_argument(
+        "--processes", action="store_true", help="parse in processes, not threads"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+    try:
+        windows = [(parse_window(window), window) for window in args.windows or []]
+    except ValueError as e:
+        parser.error(str(e))
+    # Windows are told apart by length, so "3s" and "1d" are one window
+    labels = dict(reversed(windows))
+    args.windows = list(dict.fromkeys(length for length, _ in windows))
+    args.window_labels = [labels[length] for length in args.windows]
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    return asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
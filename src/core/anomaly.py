@@ -0,0 +1,238 @@
+"""
+Streaming detection of stop reasons that run above their usual level.
+
+Every (line, machine, reason) keeps a running mean and variance of its stops
+and downtime per shift, either over all shifts ("zscore", Welford) or
+exponentially weighted towards the recent ones ("ewma"). A shift in which a
+reason does not appear counts as zero for it; those zeros are applied when
+the reason shows up again, so a shift only touches the reasons it lists.
+"""
+
+import math
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Hashable, List, Optional, Sequence
+
+from src.core.delta import ReasonKey, ReasonTotals, reason_totals
+
+METRICS = ("stops", "downtime")
+METHODS = ("ewma", "zscore")
+# Below this spread every small change would be flagged
+MIN_STD = {"stops": 1.0, "downtime": 5.0}
+FLAG_LABELS = {"stops": "stops", "downtime": "DT"}
+
+
+@dataclass(slots=True)
+class AnomalyFlag:
+    line: Hashable
+    reason: ReasonKey
+    metric: str
+    value: float
+    expected: float
+    score: float
+
+    def text(self) -> str:
+        machine, description = self.reason
+        return (
+            f"{machine} {description}: {FLAG_LABELS[self.metric]} "
+            f"{self.value:g} (usual {self.expected:.3g}, z {self.score:.1f})"
+        )
+
+
+class _ReasonStats:
+    """Per-metric count, mean and spread (M2 for zscore, variance for ewma)."""
+
+    __slots__ = ("n", "mean", "spread", "shift")
+
+    def __init__(self, shift: int) -> None:
+        self.n = 0
+        self.mean = [0.0] * len(METRICS)
+        self.spread = [0.0] * len(METRICS)
+        # Index of the next shift not yet applied
+        self.shift = shift
+
+
+class _LineState:
+    __slots__ = ("shifts", "shift_id", "pending", "committed", "reasons")
+
+    def __init__(self) -> None:
+        self.shifts = 0
+        self.shift_id: Hashable = None
+        self.pending: Optional[ReasonTotals] = None
+        self.committed: Deque[Hashable] = deque(maxlen=64)
+        self.reasons: "OrderedDict[ReasonKey, _ReasonStats]" = OrderedDict()
+
+
+class StopAnomalyDetector:
+    """
+    Flags reasons whose stops or downtime in a shift exceed their usual band.
+
+    Feed it every result of a line with ``observe``. Results with the same
+    ``shift_id`` (refreshes of a running shift) are scored but only the last
+    one is learned, once a different shift arrives.
+
+    Args:
+        method: "ewma" (recent shifts weigh more) or "zscore" (all shifts).
+        z: Flag when (value - mean) / std exceeds this.
+        alpha: EWMA weight of the newest shift.
+        min_shifts: Shifts a line needs before anything is flagged.
+        max_reasons: Reasons remembered per line; the longest unseen go first.
+    """
+
+    def __init__(
+        self,
+        method: str = "ewma",
+        z: float = 3.0,
+        alpha: float = 0.2,
+        min_shifts: int = 5,
+        max_reasons: int = 2000,
+    ) -> None:
+        if method not in METHODS:
+            raise ValueError(f"method must be one of {METHODS}, not {method!r}")
+        self.method = method
+        self.z = z
+        self.alpha = alpha
+        self.min_shifts = min_shifts
+        self.max_reasons = max_reasons
+        # Zero shifts after which an EWMA state has decayed to nothing
+        self._horizon = (
+            math.ceil(math.log(1e-6) / math.log(1 - alpha)) if 0 < alpha < 1 else 1
+        )
+        self._lines: Dict[Hashable, _LineState] = {}
+
+    def observe(
+        self, line: Hashable, source: Any, shift_id: Hashable = None
+    ) -> List[AnomalyFlag]:
+        """
+        Score one result of ``line`` and queue it to be learned.
+
+        ``source`` is anything ``reason_totals`` accepts: a stop table, an
+        extracted StopStatistics, a loss tree or its Unplanned section.
+        Without ``shift_id`` every call is a new shift.
+        """
+        state = self._lines.get(line)
+        if state is None:
+            state = self._lines[line] = _LineState()
+        if shift_id is None or shift_id != state.shift_id:
+            self._commit(state)
+        state.shift_id = shift_id
+        state.pending = (
+            source if isinstance(source, ReasonTotals) else reason_totals(source)
+        )
+        return self._score(line, state)
+
+    def _commit(self, state: _LineState) -> None:
+        totals = state.pending
+        state.pending = None
+        # Browsing back to a shift already learned must not count it twice
+        if totals is None or (
+            state.shift_id is not None and state.shift_id in state.committed
+        ):
+            return
+        values = zip(totals.keys, totals.stops.tolist(), totals.downtime.tolist())
+        for key, stops, downtime in values:
+            stats = self._stats(state, key)
+            self._update(stats, (stops, downtime))
+        state.shifts += 1
+        if state.shift_id is not None:
+            state.committed.append(state.shift_id)
+        while len(state.reasons) > self.max_reasons:
+            state.reasons.popitem(last=False)
+
+    def _stats(self, state: _LineState, key: ReasonKey) -> _ReasonStats:
+        stats = state.reasons.get(key)
+        if stats is None:
+            # Never seen (or forgotten): zero in every shift so far
+            stats = state.reasons[key] = _ReasonStats(0)
+        else:
+            state.reasons.move_to_end(key)
+        self._skip(stats, state.shifts - stats.shift)
+        stats.shift = state.shifts
+        return stats
+
+    def _skip(self, stats: _ReasonStats, shifts: int) -> None:
+        """Apply ``shifts`` shifts in which the reason did not occur."""
+        if shifts <= 0:
+            return
+        if self.method == "zscore":
+            # Merge a group of zeros (Chan et al.)
+            total = stats.n + shifts
+            for i, mean in enumerate(stats.mean):
+                stats.spread[i] += mean * mean * stats.n * shifts / total
+                stats.mean[i] = mean * stats.n / total
+            stats.n = total
+            return
+        if shifts >= self._horizon:
+            stats.mean = [0.0] * len(METRICS)
+            stats.spread = [0.0] * len(METRICS)
+        else:
+            for _ in range(shifts):
+                self._update(stats, (0.0,) * len(METRICS), count=False)
+        stats.n += shifts
+
+    def _update(
+        self, stats: _ReasonStats, values: Sequence[float], count: bool = True
+    ) -> None:
+        if count:
+            stats.n += 1
+            stats.shift += 1
+        for i, value in enumerate(values):
+            if value != value:
+                # Unknown (e.g. downtime of a split equipment page)
+                continue
+            diff = value - stats.mean[i]
+            if self.method == "zscore":
+                stats.mean[i] += diff / stats.n
+                stats.spread[i] += diff * (value - stats.mean[i])
+            else:
+                step = self.alpha * diff
+                stats.mean[i] += step
+                stats.spread[i] = (1 - self.alpha) * (stats.spread[i] + diff * step)
+
+    def _std(self, stats: _ReasonStats, i: int) -> float:
+        if self.method == "zscore":
+            variance = stats.spread[i] / (stats.n - 1) if stats.n > 1 else 0.0
+        else:
+            variance = stats.spread[i]
+        return math.sqrt(max(variance, 0.0))
+
+    def _score(self, line: Hashable, state: _LineState) -> List[AnomalyFlag]:
+        totals = state.pending
+        if state.shifts < self.min_shifts or totals is None:
+            return []
+        flags = []
+        columns = (totals.stops.tolist(), totals.downtime.tolist())
+        for row, key in enumerate(totals.keys):
+            stats = state.reasons.get(key)
+            if stats is not None:
+                self._skip(stats, state.shifts - stats.shift)
+                stats.shift = state.shifts
+            for i, metric in enumerate(METRICS):
+                value = columns[i][row]
+                if value != value:
+                    continue
+                mean = stats.mean[i] if stats is not None else 0.0
+                std = self._std(stats, i) if stats is not None else 0.0
+                score = (value - mean) / max(std, MIN_STD[metric])
+                if score > self.z:
+                    flags.append(AnomalyFlag(line, key, metric, value, mean, score))
+        flags.sort(key=lambda flag: -flag.score)
+        return flags
+
+    def forget(self, line: Hashable) -> None:
+        self._lines.pop(line, None)
+
+
+def flag_marks(keys: Sequence[ReasonKey], flags: Sequence[AnomalyFlag]) -> List[str]:
+    """Flag column for table rows keyed by (machine, description)."""
+    marks: Dict[ReasonKey, List[str]] = {}
+    for flag in flags:
+        marks.setdefault(flag.reason, []).append(FLAG_LABELS[flag.metric])
+    return [f"⚠ {', '.join(marks[key])}" if key in marks else "" for key in keys]
+
+
+def format_flags(flags: Sequence[AnomalyFlag]) -> str:
+    """Flags as report lines; empty when nothing is unusual."""
+    if not flags:
+        return ""
+    return "Unusual stops:\n" + "".join(f"⚠ {flag.text()}\n" for flag in flags)
@@ -0,0 +1,219 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.python_spa.stop_stats import (
+    STOP_COLUMN_HEADERS,
+    StopStatsColumns,
+    stop_columns,
+)
+from src.core.python_spa.typed_struct import (
+    TypedLossTree,
+    TypedStopReason,
+    TypedUnplanned,
+)
+
+METRICS = ("stops", "downtime", "uptime_loss")
+METRIC_HEADERS = {"stops": "Stops", "downtime": "DT [min]", "uptime_loss": "UL [%]"}
+
+# (causing equipment or machine, description)
+ReasonKey = Tuple[Hashable, Hashable]
+
+
+@dataclass(slots=True)
+class ReasonTotals:
+    """Stop reasons of one result, one row per distinct key."""
+
+    keys: List[ReasonKey]
+    stops: np.ndarray
+    downtime: np.ndarray
+    uptime_loss: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def _totals(rows: Iterable[Tuple[ReasonKey, float, float, float]]) -> ReasonTotals:
+    # Reasons listed twice (e.g. after a roll-up by description only) are summed
+    index: Dict[ReasonKey, int] = {}
+    values: List[List[float]] = []
+    for key, stops, downtime, uptime_loss in rows:
+        i = index.get(key)
+        if i is None:
+            index[key] = len(values)
+            values.append([stops, downtime, uptime_loss])
+        else:
+            row = values[i]
+            row[0] += stops
+            row[1] += downtime
+            row[2] += uptime_loss
+    matrix = np.array(values, dtype=np.float64).reshape(len(values), 3)
+    return ReasonTotals(list(index), matrix[:, 0], matrix[:, 1], matrix[:, 2])
+
+
+def _number(value: Optional[float]) -> float:
+    return np.nan if value is None else float(value)
+
+
+def reason_totals(source: Any) -> ReasonTotals:
+    """
+    Key the stop reasons of a result by (equipment, description).
+
+    ``source`` may be a loss tree (its unplanned reasons are used), an
+    Unplanned section, a list of stop reasons of either parser, StopStatsColumns,
+    an extracted StopStatistics or a stop table DataFrame as shown in the GUI.
+    Equipment pages have no uptime loss, so that column is NaN for them.
+    """
+    if hasattr(source, "columns"):
+        return _frame_totals(source)
+    if isinstance(source, TypedLossTree):
+        source = source.unplanned.updt_reason if source.unplanned else []
+    elif isinstance(source, TypedUnplanned):
+        source = source.updt_reason
+    elif not isinstance(source, (StopStatsColumns, list, tuple)):
+        source = stop_columns(source)
+
+    if isinstance(source, StopStatsColumns):
+        return _totals(
+            zip(
+                zip(source.machine.tolist(), source.description.tolist()),
+                source.stops.tolist(),
+                source.downtime_min.tolist(),
+                [np.nan] * len(source),
+            )
+        )
+
+    def rows():
+        for reason in source:
+            if not isinstance(reason, TypedStopReason):
+                reason = TypedStopReason.from_raw(reason)
+            yield (
+                (reason.causing_equipment or "", reason.description or ""),
+                _number(reason.stops),
+                _number(reason.downtime),
+                _number(reason.uptime_loss),
+            )
+
+    return _totals(rows())
+
+
+def _frame_totals(df) -> ReasonTotals:
+    def column(name: str) -> List[Any]:
+        header = STOP_COLUMN_HEADERS[name]
+        if header not in df.columns:
+            return [np.nan] * len(df)
+        return df[header].astype(float).tolist()
+
+    return _totals(
+        zip(
+            zip(
+                df[STOP_COLUMN_HEADERS["machine"]].tolist(),
+                df[STOP_COLUMN_HEADERS["description"]].tolist(),
+            ),
+            column("stops"),
+            column("downtime_min"),
+            [np.nan] * len(df),
+        )
+    )
+
+
+@dataclass(slots=True)
+class DeltaTable:
+    """Per reason values before and after, sorted by the largest move."""
+
+    metric: str
+    reason: List[ReasonKey]
+    before: Dict[str, np.ndarray]
+    after: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.reason)
+
+    def delta(self, metric: str) -> np.ndarray:
+        return self.after[metric] - self.before[metric]
+
+    def rows(self, metrics: Sequence[str] = METRICS) -> List[List[Any]]:
+        columns = [self.reason]
+        for metric in metrics:
+            columns += [
+                self.before[metric].tolist(),
+                self.after[metric].tolist(),
+                self.delta(metric).tolist(),
+            ]
+        return [[*reason, *values] for reason, *values in zip(*columns)]
+
+    def headers(self, metrics: Sequence[str] = METRICS) -> List[str]:
+        headers = ["Machine", "Description"]
+        for metric in metrics:
+            label = METRIC_HEADERS[metric]
+            headers += [label, f"{label} after", "Δ"]
+        return headers
+
+    def to_frame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.rows(), columns=self.headers())
+
+
+def stop_deltas(
+    before: Any,
+    after: Any,
+    metric: str = "downtime",
+    top: Optional[int] = None,
+) -> DeltaTable:
+    """
+    Compare the stop reasons of two results, e.g. consecutive shifts.
+
+    Reasons are hash-joined on their key in one pass over each side; a
+    reason present on one side only counts as zero on the other.
+
+    Args:
+        before: The earlier result, anything ``reason_totals`` accepts.
+        after: The later result.
+        metric: "stops", "downtime" or "uptime_loss"; rows are sorted by the
+            absolute change of this metric, largest first.
+        top: Keep only this many rows.
+
+    Returns:
+        DeltaTable: Values of both sides and their change per reason.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS}, not {metric!r}")
+    if not isinstance(before, ReasonTotals):
+        before = reason_totals(before)
+    if not isinstance(after, ReasonTotals):
+        after = reason_totals(after)
+
+    # Join: the union keeps the order of ``before`` followed by new reasons
+    position = {key: i for i, key in enumerate(before.keys)}
+    keys = list(before.keys)
+    after_index = np.empty(len(after), dtype=np.int64)
+    for j, key in enumerate(after.keys):
+        i = position.get(key)
+        if i is None:
+            i = position[key] = len(keys)
+            keys.append(key)
+        after_index[j] = i
+
+    n = len(keys)
+    sides: Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]] = ({}, {})
+    for name in METRICS:
+        # A reason missing on one side had no stops there, hence zero, but an
+        # unknown value (NaN) stays unknown
+        sides[0][name] = np.zeros(n)
+        sides[0][name][: len(before)] = getattr(before, name)
+        sides[1][name] = np.zeros(n)
+        sides[1][name][after_index] = getattr(after, name)
+
+    change = np.abs(sides[1][metric] - sides[0][metric])
+    # Stable sort, NaN last
+    order = np.argsort(-np.nan_to_num(change, nan=-np.inf), kind="stable")
+    if top is not None:
+        order = order[:top]
+    return DeltaTable(
+        metric=metric,
+        reason=[keys[i] for i in order.tolist()],
+        before={name: values[order] for name, values in sides[0].items()},
+        after={name: values[order] for name, values in sides[1].items()},
+    )
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from typing import Any, Hashable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from src.utils.constants import GREEN, RED, TARGET_KPIS
+from src.utils.csvhandle import parse_target_value
+
+# KPIs where a value above target is good; every other KPI is a loss
+HIGHER_IS_BETTER = frozenset({"PR", "MTBF"})
+
+
+def to_float_matrix(
+    records: Sequence[Mapping[str, Any]], kpis: Sequence[str] = TARGET_KPIS
+) -> np.ndarray:
+    """
+    Parse a list of ``{KPI: value}`` mappings into a (records x KPI) float array.
+
+    Values may be floats or SPA strings such as "65.0%" or "4.9"; missing or
+    unparsable values become NaN.
+    """
+    matrix = np.full((len(records), len(kpis)), np.nan)
+    for i, record in enumerate(records):
+        if not record:
+            continue
+        for j, kpi in enumerate(kpis):
+            value = record.get(kpi)
+            if value is None or value == "":
+                continue
+            matrix[i, j] = (
+                float(value)
+                if isinstance(value, (int, float))
+                else parse_target_value(value)
+            )
+    return matrix
+
+
+@dataclass(slots=True)
+class Scorecard:
+    """Target vs actual for many (line, location, shift) rows at once."""
+
+    keys: List[Hashable]
+    kpis: List[str]
+    target: np.ndarray
+    actual: np.ndarray
+    delta: np.ndarray
+    met: np.ndarray
+    valid: np.ndarray
+
+    def flags(self) -> np.ndarray:
+        """GREEN/RED marker per cell, empty where target or actual is missing."""
+        return np.where(self.valid, np.where(self.met, GREEN, RED), "")
+
+    def index(self, key: Hashable) -> int:
+        return self.keys.index(key)
+
+    def rows(self, index: int = 0, actual_labels: Optional[Mapping] = None):
+        """Rows of ``[KPI, TARGET, ACTUAL, flag]`` for one scorecard entry."""
+        flags = self.flags()[index]
+        rows = []
+        for j, kpi in enumerate(self.kpis):
+            target = self.target[index, j]
+            actual = self.actual[index, j]
+            if actual_labels is not None and kpi in actual_labels:
+                actual_text = str(actual_labels[kpi])
+            else:
+                actual_text = f"{actual:g}" if actual == actual else ""
+            rows.append(
+                [
+                    kpi,
+                    f"{target:g}" if target == target else "",
+                    actual_text,
+                    str(flags[j]),
+                ]
+            )
+        return rows
+
+
+def evaluate(
+    targets: Sequence[Mapping[str, Any]],
+    actuals: Sequence[Mapping[str, Any]],
+    keys: Optional[Sequence[Hashable]] = None,
+    kpis: Sequence[str] = TARGET_KPIS,
+) -> Scorecard:
+    """
+    Compare targets and actuals of every line/shift in one batched call.
+
+    Args:
+        targets: ``{KPI: value}`` per row, e.g. from the target cache
+        actuals: ``{KPI: value}`` per row, e.g. from ``_extract_actual``
+        keys: Optional row labels such as ``(location, lu, shift)``
+        kpis: KPI column order
+
+    Returns:
+        Scorecard with float arrays for target, actual and delta plus the
+        boolean attainment mask
+    """
+    if len(targets) != len(actuals):
+        raise ValueError("targets and actuals must have the same length")
+
+    kpis = list(kpis)
+    target = to_float_matrix(targets, kpis)
+    actual = to_float_matrix(actuals, kpis)
+    return evaluate_arrays(
+        target,
+        actual,
+        list(keys) if keys is not None else list(range(len(target))),
+        kpis,
+    )
+
+
+def evaluate_arrays(
+    target: np.ndarray,
+    actual: np.ndarray,
+    keys: List[Hashable],
+    kpis: Sequence[str] = TARGET_KPIS,
+) -> Scorecard:
+    """Vectorized core of ``evaluate`` for already-parsed float arrays."""
+    kpis = list(kpis)
+    higher = np.array([kpi in HIGHER_IS_BETTER for kpi in kpis])
+    delta = actual - target
+    valid = ~(np.isnan(target) | np.isnan(actual))
+    with np.errstate(invalid="ignore"):
+        met = np.where(higher, delta >= 0, delta <= 0) & valid
+    return Scorecard(
+        keys=keys,
+        kpis=kpis,
+        target=target,
+        actual=actual,
+        delta=delta,
+        met=met,
+        valid=valid,
+    )
@@ -0,0 +1,415 @@
+"""
+Local history of parsed loss trees in SQLite, with daily and weekly roll-ups.
+
+Every ingested shift is stored once (its additive totals, unplanned reasons
+and BDE/PF categories) and added to the materialized tables in the same
+transaction: KPI totals per day and per week, reasons per week and
+categories per day. Ingesting a shift again first subtracts what it added
+before, so a refreshed running shift is counted once. Queries read only the
+materialized rows of the requested days or weeks.
+
+Machine, description and category texts are stored once in ``labels``; the
+other tables keep their integer codes.
+
+Only ``cli.py --history`` fills the store so far. The GUI, the Dashboard
+included, still fetches and parses the pages it shows.
+"""
+
+import sqlite3
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.core.python_spa.typed_struct import TypedLossTree
+from src.core.python_spa.vocabulary import Vocabulary
+from src.core.rolling import TOTALS, ShiftSample, kpis_of
+
+CATEGORY_KINDS = ("bde", "pf")
+REASON_METRICS = ("stops", "downtime")
+
+_TOTAL_COLUMNS = ", ".join(f"{name} REAL NOT NULL" for name in TOTALS)
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS labels (
+    code INTEGER PRIMARY KEY, text TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS shifts (
+    line TEXT NOT NULL, location TEXT NOT NULL, date TEXT NOT NULL,
+    shift INTEGER NOT NULL, week TEXT NOT NULL, {_TOTAL_COLUMNS},
+    PRIMARY KEY (line, location, date, shift)
+);
+CREATE TABLE IF NOT EXISTS shift_reasons (
+    line TEXT NOT NULL, location TEXT NOT NULL, date TEXT NOT NULL,
+    shift INTEGER NOT NULL, machine INTEGER NOT NULL,
+    description INTEGER NOT NULL, stops REAL NOT NULL, downtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS shift_reasons_shift
+    ON shift_reasons (line, location, date, shift);
+CREATE TABLE IF NOT EXISTS shift_categories (
+    line TEXT NOT NULL, location TEXT NOT NULL, date TEXT NOT NULL,
+    shift INTEGER NOT NULL, kind TEXT NOT NULL, category INTEGER NOT NULL,
+    stops REAL NOT NULL, downtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS shift_categories_shift
+    ON shift_categories (line, location, date, shift);
+
+CREATE TABLE IF NOT EXISTS daily_kpis (
+    line TEXT NOT NULL, location TEXT NOT NULL, date TEXT NOT NULL,
+    shifts INTEGER NOT NULL, {_TOTAL_COLUMNS},
+    PRIMARY KEY (line, location, date)
+);
+CREATE TABLE IF NOT EXISTS weekly_kpis (
+    line TEXT NOT NULL, location TEXT NOT NULL, week TEXT NOT NULL,
+    shifts INTEGER NOT NULL, {_TOTAL_COLUMNS},
+    PRIMARY KEY (line, location, week)
+);
+CREATE TABLE IF NOT EXISTS weekly_reasons (
+    line TEXT NOT NULL, location TEXT NOT NULL, week TEXT NOT NULL,
+    machine INTEGER NOT NULL, description INTEGER NOT NULL,
+    stops REAL NOT NULL, downtime REAL NOT NULL,
+    PRIMARY KEY (line, location, week, machine, description)
+);
+CREATE INDEX IF NOT EXISTS weekly_reasons_stops
+    ON weekly_reasons (line, location, week, stops DESC);
+CREATE INDEX IF NOT EXISTS weekly_reasons_downtime
+    ON weekly_reasons (line, location, week, downtime DESC);
+CREATE TABLE IF NOT EXISTS daily_categories (
+    line TEXT NOT NULL, location TEXT NOT NULL, date TEXT NOT NULL,
+    kind TEXT NOT NULL, category INTEGER NOT NULL,
+    stops REAL NOT NULL, downtime REAL NOT NULL,
+    PRIMARY KEY (line, location, date, kind, category)
+);
+"""
+
+# (line, location, date, shift)
+ShiftKey = Tuple[str, str, str, int]
+
+
+def week_of(day: Union[str, date]) -> str:
+    """The Monday of ``day``'s week, which keys the weekly tables."""
+    if isinstance(day, str):
+        day = date.fromisoformat(day[:10])
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def _upsert(table: str, keys: Sequence[str], values: Sequence[str]) -> str:
+    columns = [*keys, *values]
+    updates = ", ".join(f"{name} = {name} + excluded.{name}" for name in values)
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {updates}"
+    )
+
+
+_ADD_DAILY = _upsert("daily_kpis", ("line", "location", "date"), ("shifts", *TOTALS))
+_ADD_WEEKLY = _upsert("weekly_kpis", ("line", "location", "week"), ("shifts", *TOTALS))
+_ADD_REASON = _upsert(
+    "weekly_reasons",
+    ("line", "location", "week", "machine", "description"),
+    REASON_METRICS,
+)
+_ADD_CATEGORY = _upsert(
+    "daily_categories",
+    ("line", "location", "date", "kind", "category"),
+    REASON_METRICS,
+)
+
+
+class HistoryStore:
+    """
+    Shift results of many lines in one SQLite file.
+
+    Args:
+        path: Database file; ":memory:" keeps it in memory.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        self.path = path
+        self.db = sqlite3.connect(str(path))
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(_SCHEMA)
+        self.labels = Vocabulary(
+            text for (text,) in self.db.execute("SELECT text FROM labels ORDER BY code")
+        )
+
+    def _encode(self, texts: Sequence[str]) -> List[int]:
+        """Codes of ``texts``; new labels are stored right away."""
+        known = len(self.labels)
+        codes = [self.labels.code(text) for text in texts]
+        if len(self.labels) > known:
+            with self.db:
+                self.db.executemany(
+                    "INSERT INTO labels VALUES (?, ?)",
+                    enumerate(self.labels.labels[known:], known),
+                )
+        return codes
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def ingest(
+        self,
+        line: str,
+        location: str,
+        tree: TypedLossTree,
+        day: Optional[Union[str, date]] = None,
+        shift: Optional[int] = None,
+    ) -> None:
+        """
+        Store one shift's loss tree and add it to the roll-ups.
+
+        ``day`` and ``shift`` default to the tree's period.
+        """
+        day = str(day or tree.date)[:10]
+        shift = int(shift or tree.shift or 0)
+        if not day or day == "None":
+            raise ValueError(f"loss tree {tree.period!r} has no date")
+        key: ShiftKey = (line, location, day, shift)
+        week = week_of(day)
+        # Only the totals are kept; the start would need a calendar time
+        totals = ShiftSample.from_tree(tree, start=datetime.min).totals
+        stop_reasons = tree.unplanned.updt_reason if tree.unplanned else []
+        updts = []
+        for kind in CATEGORY_KINDS:
+            category = ""
+            for updt in getattr(tree.unplanned, kind) if tree.unplanned else []:
+                losses = updt.losses
+                time = losses.raw_value("time") if losses is not None else None
+                # The truncated section summary rows ("Brea", "Process failures
+                # (> 1") have no time and a "%" downtime; they are not categories
+                if not time or losses.downtime is None:
+                    continue
+                # A stop continuing the one before it has no category cell and
+                # shows its time there instead
+                if updt.category and updt.category != time:
+                    category = updt.category
+                updts.append((kind, category, losses))
+        codes = iter(
+            self._encode(
+                [
+                    text
+                    for r in stop_reasons
+                    for text in (r.causing_equipment or "", r.description or "")
+                ]
+                + [category for _, category, _ in updts]
+            )
+        )
+        reasons = [
+            (next(codes), next(codes), r.stops or 0, r.downtime or 0.0)
+            for r in stop_reasons
+        ]
+        categories = [
+            (kind, next(codes), losses.stops or 0, losses.downtime or 0.0)
+            for kind, _, losses in updts
+        ]
+        with self.db:
+            self._remove(key, week)
+            self.db.execute(
+                f"INSERT INTO shifts VALUES ({', '.join('?' * (5 + len(TOTALS)))})",
+                (*key, week, *totals.tolist()),
+            )
+            self.db.executemany(
+                "INSERT INTO shift_reasons VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*key, *reason) for reason in reasons],
+            )
+            self.db.executemany(
+                "INSERT INTO shift_categories VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*key, *category) for category in categories],
+            )
+            self._materialize(key, week, 1, totals, reasons, categories)
+
+    def _remove(self, key: ShiftKey, week: str) -> None:
+        """Subtract a previously ingested shift from the roll-ups and drop it."""
+        where = "line = ? AND location = ? AND date = ? AND shift = ?"
+        row = self.db.execute(
+            f"SELECT {', '.join(TOTALS)} FROM shifts WHERE {where}", key
+        ).fetchone()
+        if row is None:
+            return
+        reasons = self.db.execute(
+            f"SELECT machine, description, stops, downtime FROM shift_reasons "
+            f"WHERE {where}",
+            key,
+        ).fetchall()
+        categories = self.db.execute(
+            f"SELECT kind, category, stops, downtime FROM shift_categories "
+            f"WHERE {where}",
+            key,
+        ).fetchall()
+        self._materialize(
+            key,
+            week,
+            -1,
+            -np.array(tuple(row), dtype=np.float64),
+            [(m, d, -s, -t) for m, d, s, t in reasons],
+            [(k, c, -s, -t) for k, c, s, t in categories],
+        )
+        for table in ("shifts", "shift_reasons", "shift_categories"):
+            self.db.execute(f"DELETE FROM {table} WHERE {where}", key)
+
+    def _materialize(
+        self,
+        key: ShiftKey,
+        week: str,
+        shifts: int,
+        totals: np.ndarray,
+        reasons: Sequence[Tuple[int, int, float, float]],
+        categories: Sequence[Tuple[str, int, float, float]],
+    ) -> None:
+        line, location, day, _ = key
+        values = totals.tolist()
+        self.db.execute(_ADD_DAILY, (line, location, day, shifts, *values))
+        self.db.execute(_ADD_WEEKLY, (line, location, week, shifts, *values))
+        self.db.executemany(
+            _ADD_REASON, [(line, location, week, *reason) for reason in reasons]
+        )
+        self.db.executemany(
+            _ADD_CATEGORY,
+            [(line, location, day, *category) for category in categories],
+        )
+
+    def daily_kpis(
+        self,
+        line: Optional[str] = None,
+        location: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """PR, MTBF, MTTR, UPDT, PDT and NATR per line, location and day."""
+        return self._kpis("daily_kpis", "date", line, location, date_from, date_to)
+
+    def weekly_kpis(
+        self,
+        line: Optional[str] = None,
+        location: Optional[str] = None,
+        week_from: Optional[str] = None,
+        week_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Like ``daily_kpis`` per week; weeks are keyed by their Monday."""
+        return self._kpis(
+            "weekly_kpis",
+            "week",
+            line,
+            location,
+            week_of(week_from) if week_from else None,
+            week_of(week_to) if week_to else None,
+        )
+
+    def _kpis(
+        self,
+        table: str,
+        period: str,
+        line: Optional[str],
+        location: Optional[str],
+        start: Optional[str],
+        end: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        where, params = _filters(line, location)
+        if start:
+            where.append(f"{period} >= ?")
+            params.append(start)
+        if end:
+            where.append(f"{period} <= ?")
+            params.append(end)
+        rows = self.db.execute(
+            f"SELECT line, location, {period}, shifts, {', '.join(TOTALS)} "
+            f"FROM {table} {_where(where)} ORDER BY line, location, {period}",
+            params,
+        ).fetchall()
+        return [
+            {
+                "line": row["line"],
+                "location": row["location"],
+                period: row[period],
+                "shifts": row["shifts"],
+                **kpis_of(np.array([row[name] for name in TOTALS], dtype=np.float64)),
+            }
+            for row in rows
+        ]
+
+    def top_reasons(
+        self,
+        line: str,
+        location: str,
+        week: Union[str, date],
+        metric: str = "downtime",
+        top: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """The ``top`` unplanned reasons of a line's week by stops or downtime."""
+        if metric not in REASON_METRICS:
+            raise ValueError(f"metric must be one of {REASON_METRICS}, not {metric!r}")
+        rows = self.db.execute(
+            "SELECT machine, description, stops, downtime FROM weekly_reasons "
+            "WHERE line = ? AND location = ? AND week = ? AND stops > 0 "
+            f"ORDER BY {metric} DESC LIMIT ?",
+            (line, location, week_of(week), top),
+        ).fetchall()
+        label = self.labels.label
+        return [
+            {
+                "machine": label(row["machine"]),
+                "description": label(row["description"]),
+                "stops": row["stops"],
+                "downtime": row["downtime"],
+            }
+            for row in rows
+        ]
+
+    def category_downtime(
+        self,
+        kind: str,
+        line: Optional[str] = None,
+        location: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Stops and downtime per BDE or PF category over the given days."""
+        if kind not in CATEGORY_KINDS:
+            raise ValueError(f"kind must be one of {CATEGORY_KINDS}, not {kind!r}")
+        where, params = _filters(line, location)
+        where.append("kind = ?")
+        params.append(kind)
+        if date_from:
+            where.append("date >= ?")
+            params.append(date_from)
+        if date_to:
+            where.append("date <= ?")
+            params.append(date_to)
+        rows = self.db.execute(
+            "SELECT category, SUM(stops) AS stops, SUM(downtime) AS downtime "
+            f"FROM daily_categories {_where(where)} "
+            "GROUP BY category ORDER BY downtime DESC",
+            params,
+        ).fetchall()
+        label = self.labels.label
+        return [
+            {
+                "category": label(row["category"]),
+                "stops": row["stops"],
+                "downtime": row["downtime"],
+            }
+            for row in rows
+        ]
+
+
+def _filters(line: Optional[str], location: Optional[str]) -> Tuple[List[str], List]:
+    where, params = [], []
+    if line:
+        where.append("line = ?")
+        params.append(line)
+    if location:
+        where.append("location = ?")
+        params.append(location)
+    return where, params
+
+
+def _where(conditions: Sequence[str]) -> str:
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
@@ -1,17 +1,24 @@
-import asyncio
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 import numpy as np
 import pandas as pd
-import spa_scraper_pyo3
 
-from src.gui.toast import create_toast
+from src.core.python_spa.stop_stats import StopStatsColumns, stop_columns
+from src.core.python_spa.typed_struct import TypedLossTree
+from src.core.worker import PARSE_WORKER, ParseWorker
 from src.utils.constants import HEADERS, NTLM_AUTH
-from src.utils.csvhandle import load_targets_df
+from src.utils.csvhandle import TARGETS
 
+try:
+    from spa_scraper_pyo3 import extract_loss_tree, extract_stop_stats
+except ImportError:
+    # The Rust parser is only built for Windows; same attributes, pure Python
+    from src.core.python_spa.losstree import extract_loss_tree
+    from src.core.python_spa.stop_stats import extract_stop_stats
 
-def _extract_actual(data: spa_scraper_pyo3.SPALossTree) -> Tuple[Dict[str, Any], Any]:
+
+def _extract_actual(data: Any) -> Tuple[Dict[str, Any], Any]:
     """Helper to extract actual values from spa_scraper_pyo3 result."""
 
     return {
@@ -24,48 +31,136 @@ def _extract_actual(data: spa_scraper_pyo3.SPALossTree) -> Tuple[Dict[str, Any],
     }, data.time_range.calendar_time
 
 
-async def fetch_data(url: str, client: httpx.AsyncClient) -> Tuple[Dict[str, Any], Any]:
+def parse_loss_tree(html: str) -> Tuple[Dict[str, Any], Any]:
+    """Parse a loss tree page into its actual KPIs (runs in the parse worker)."""
+    return _extract_actual(extract_loss_tree(html))
+
+
+def parse_typed_loss_tree(html: str) -> TypedLossTree:
+    """Parse a loss tree page into numbers, e.g. for ``rollup_loss_trees``."""
+    return TypedLossTree.from_raw(extract_loss_tree(html))
+
+
+def _display(value: Optional[float]) -> Any:
+    if value is None:
+        return 0
+    return f"{value:.3g}" if abs(value) < 1000 else f"{value:.0f}"
+
+
+def typed_actual(tree: TypedLossTree) -> Dict[str, Any]:
+    """The actual KPIs of ``parse_loss_tree`` from a typed (e.g. rolled-up) tree."""
+    natr = tree.rate_loss.get("natr")
+    pdt = tree.planned.pdt if tree.planned else None
+    updt = tree.unplanned.updt if tree.unplanned else None
+    return {
+        "PR": _display(tree.time_range.pr if tree.time_range else None),
+        "MTBF": _display(tree.time_range.mtbf if tree.time_range else None),
+        "NATR": _display(natr.uptime_loss if natr else None),
+        "PDT": _display(pdt.uptime_loss if pdt else None),
+        "STOP": updt.stops if updt and updt.stops is not None else 0,
+        "UPDT": _display(updt.uptime_loss if updt else None),
+    }
+
+
+def is_service_response(response: httpx.Response) -> bool:
+    """True if the page came pre-parsed as JSON from the report service."""
+    return response.headers.get("content-type", "").startswith("application/json")
+
+
+async def read_loss_tree(
+    response: httpx.Response,
+    worker: ParseWorker = PARSE_WORKER,
+    key: str = "result",
+    generation: Optional[int] = None,
+) -> Tuple[Dict[str, Any], Any]:
+    """Actual KPIs and calendar time of a loss tree page or its service JSON."""
+    if is_service_response(response):
+        payload = response.json()
+        return payload["actual"], payload["calendar_time"]
+    return await worker.run(key, parse_loss_tree, response.text, generation=generation)
+
+
+async def read_typed_loss_tree(
+    response: httpx.Response,
+    worker: ParseWorker = PARSE_WORKER,
+    key: str = "result",
+    generation: Optional[int] = None,
+) -> TypedLossTree:
+    """Typed loss tree of an OTS page; the report service only serves KPIs."""
+    if is_service_response(response):
+        raise ValueError("the report service does not serve full loss trees")
+    return await worker.run(
+        key, parse_typed_loss_tree, response.text, generation=generation
+    )
+
+
+async def read_equipment(
+    response: httpx.Response,
+    worker: ParseWorker = PARSE_WORKER,
+    key: str = "equipment",
+    generation: Optional[int] = None,
+) -> Tuple[str, pd.DataFrame]:
+    """Time period and stop table of an equipment page or its service JSON."""
+    if is_service_response(response):
+        payload = response.json()
+        df = pd.DataFrame(payload["rows"], columns=payload["columns"])
+        return payload["time_period"], df
+    return await worker.run(
+        key, parse_equipment_page, response.text, generation=generation
+    )
+
+
+async def read_equipment_columns(
+    response: httpx.Response,
+    worker: ParseWorker = PARSE_WORKER,
+    key: str = "equipment",
+    generation: Optional[int] = None,
+) -> Tuple[str, StopStatsColumns]:
+    """Time period and stop columns (with the per-shift counts) of an OTS equipment page."""
+    return await worker.run(
+        key, parse_equipment_columns, response.text, generation=generation
+    )
+
+
+async def fetch_data(
+    url: str,
+    client: httpx.AsyncClient,
+    worker: ParseWorker = PARSE_WORKER,
+    key: str = "result",
+) -> Tuple[Dict[str, Any], Any]:
     response = await client.get(url, headers=HEADERS, auth=NTLM_AUTH)
     response.raise_for_status()
-    data: spa_scraper_pyo3.SPALossTree = spa_scraper_pyo3.extract_loss_tree(
-        response.text
-    )
-    return _extract_actual(data)
+    return await read_loss_tree(response, worker, key)
 
 
 async def post_data(
-    url: str, client: httpx.AsyncClient, parameter: str
+    url: str,
+    client: httpx.AsyncClient,
+    parameter: str,
+    worker: ParseWorker = PARSE_WORKER,
+    key: str = "result",
 ) -> Tuple[Dict[str, Any], Any]:
     full_url = f"{url}&{parameter}"
     response = await client.post(full_url, headers=HEADERS, auth=NTLM_AUTH)
     response.raise_for_status()
-    data: spa_scraper_pyo3.SPALossTree = spa_scraper_pyo3.extract_loss_tree(
-        response.text
-    )
-    return _extract_actual(data)
+    return await read_loss_tree(response, worker, key)
 
 
-async def read_csv(file_path: str, shift=1):
+def get_targets(lu: str, func_location: str, shift=1):
+    """Look up the targets of a line and shift from the in-memory target cache."""
     try:
-        # pandas bukan async, jadi kita jalankan di executor untuk I/O-bound task
-        loop = asyncio.get_event_loop()
-        df = await loop.run_in_executor(None, load_targets_df, file_path)
-
-        # df = df[
-        #     f"{datetime.datetime.strptime(date, '%Y-%m-%d').strftime('%a')}_{shift}"
-        # ]
-        df = df[f"Shift {shift}"]
-        list_target = df.astype(str).str.replace("%", "").values
-        return dict(zip(["STOP", "PR", "MTBF", "UPDT", "PDT", "NATR"], list_target))
-
+        return TARGETS.get(func_location, lu, shift)
     except Exception as e:
-        create_toast(f"Error reading Excel: {e}", "danger")
+        # Imported here so headless callers never load tkinter
+        from src.gui.toast import create_toast
+
+        create_toast(f"Error reading targets: {e}", "danger")
         return None
 
 
 def get_time_period(response: httpx.Response):
     # df = pd.read_html(response.content)
-    data = spa_scraper_pyo3.extract_stop_stats(response.text)
+    data = extract_stop_stats(response.text)
     time_period = data.time_period
     return time_period
     # return str(df[3][1][2])
@@ -114,17 +209,17 @@ def extract_dataframe(response: httpx.Response):
 
 
 def get_data_spa(response: httpx.Response):
-    stop_stats = spa_scraper_pyo3.extract_stop_stats(response.text)
-
-    data = [
-        [
-            machine.machine_type.split("-")[1],
-            stop_reason.description,
-            int(stop_reason.stops),
-            float(stop_reason.downtime_min),
-        ]
-        for machine in stop_stats.machines
-        for stop_reason in machine.stop_reasons
-    ]
-
-    return pd.DataFrame(data, columns=["Machine", "Description", "Stops", "DT [min]"])
+    stop_stats = extract_stop_stats(response.text)
+    return stop_columns(stop_stats).to_frame()
+
+
+def parse_equipment_columns(html: str) -> Tuple[str, StopStatsColumns]:
+    """Parse the period equipment page into its time period and stop columns."""
+    stop_stats = extract_stop_stats(html)
+    return stop_stats.time_period, stop_columns(stop_stats)
+
+
+def parse_equipment_page(html: str) -> Tuple[str, pd.DataFrame]:
+    """Parse the period equipment page once into its time period and stop table."""
+    time_period, columns = parse_equipment_columns(html)
+    return time_period, columns.to_frame()
@@ -0,0 +1,246 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from src.core.python_spa.stop_stats import StopStatsColumns, stop_columns
+
+# Page labels every stacked stop table carries, e.g. {"line": "18", ...}
+LABEL_FIELDS = ("line", "date", "shift")
+METRICS = ("stops", "downtime_min")
+
+
+def encode(values: Iterable[Hashable]) -> Tuple[np.ndarray, List[Hashable]]:
+    """Dictionary-encode ``values`` into int32 codes and the labels they index."""
+    vocabulary: Dict[Hashable, int] = {}
+    codes = np.fromiter(
+        (vocabulary.setdefault(value, len(vocabulary)) for value in values),
+        dtype=np.int32,
+    )
+    return codes, list(vocabulary)
+
+
+@dataclass(slots=True)
+class StopFrame:
+    """
+    Stop reasons of many pages stacked into columns.
+
+    Every text column (line, date, shift, machine, description) is stored as
+    int32 codes into its own label list, so grouping never compares strings.
+    """
+
+    codes: Dict[str, np.ndarray]
+    labels: Dict[str, List[Hashable]]
+    stops: np.ndarray
+    downtime_min: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.stops)
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(self.codes)
+
+
+def stack_stop_tables(
+    tables: Iterable[Tuple[Mapping[str, Any], Any]],
+) -> StopFrame:
+    """
+    Stack ``(labels, stop table)`` pairs into one StopFrame.
+
+    The stop table may be StopStatsColumns or an extracted StopStatistics of
+    either parser; ``labels`` holds the LABEL_FIELDS of that page.
+    """
+    columns: List[StopStatsColumns] = []
+    page_labels: List[Mapping[str, Any]] = []
+    for labels, table in tables:
+        if not isinstance(table, StopStatsColumns):
+            table = stop_columns(table)
+        columns.append(table)
+        page_labels.append(labels)
+
+    sizes = [len(table) for table in columns]
+    codes: Dict[str, np.ndarray] = {}
+    labels: Dict[str, List[Hashable]] = {}
+    for name in LABEL_FIELDS:
+        # One code per page, repeated over its rows
+        page_codes, labels[name] = encode(page.get(name) for page in page_labels)
+        codes[name] = np.repeat(page_codes, sizes)
+    for name in ("machine", "description"):
+        codes[name], labels[name] = encode(
+            value for table in columns for value in getattr(table, name)
+        )
+
+    def concat(name: str, dtype) -> np.ndarray:
+        if not columns:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate([getattr(table, name) for table in columns])
+
+    return StopFrame(
+        codes=codes,
+        labels=labels,
+        stops=concat("stops", np.int64),
+        downtime_min=concat("downtime_min", np.float64),
+    )
+
+
+def _combine(codes: Sequence[np.ndarray], size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group ids of the combined key columns.
+
+    Returns the dense group id of every row and, per group, the index of
+    one row of it (to read the group's labels back).
+    """
+    if not codes:
+        return np.zeros(size, dtype=np.int64), np.zeros(min(size, 1), dtype=np.int64)
+    combined = np.zeros(size, dtype=np.int64)
+    for column in codes:
+        # Re-densify after each step so the product never overflows
+        combined = combined * (int(column.max(initial=0)) + 1) + column
+        _, combined = np.unique(combined, return_inverse=True)
+    _, first, inverse = np.unique(combined, return_index=True, return_inverse=True)
+    return inverse, first
+
+
+@dataclass(slots=True)
+class ParetoTable:
+    """Top reasons per partition with their share of the partition total."""
+
+    partition_by: Tuple[str, ...]
+    reason_by: Tuple[str, ...]
+    metric: str
+    partition: List[Tuple[Hashable, ...]]
+    reason: List[Tuple[Hashable, ...]]
+    stops: np.ndarray
+    downtime_min: np.ndarray
+    share: np.ndarray
+    cumulative_share: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.stops)
+
+    def rows(self) -> List[List[Any]]:
+        return [
+            [*partition, *reason, stops, downtime, share * 100, cumulative * 100]
+            for partition, reason, stops, downtime, share, cumulative in zip(
+                self.partition,
+                self.reason,
+                self.stops.tolist(),
+                self.downtime_min.tolist(),
+                self.share.tolist(),
+                self.cumulative_share.tolist(),
+            )
+        ]
+
+    def headers(self) -> List[str]:
+        return [
+            *self.partition_by,
+            *self.reason_by,
+            "Stops",
+            "DT [min]",
+            "Share [%]",
+            "Cum. [%]",
+        ]
+
+    def to_frame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.rows(), columns=self.headers())
+
+
+def pareto(
+    frame: StopFrame,
+    partition_by: Sequence[str] = (),
+    reason_by: Sequence[str] = ("machine", "description"),
+    metric: str = "stops",
+    top: int = 10,
+) -> ParetoTable:
+    """
+    Top ``top`` reasons by ``metric`` within each partition.
+
+    Args:
+        frame: Stacked stop tables.
+        partition_by: Fields to rank within, e.g. ("line",) or ("line", "shift").
+            Empty ranks over the whole frame.
+        reason_by: Fields that make up a reason.
+        metric: "stops" or "downtime_min".
+        top: Number of reasons kept per partition.
+
+    Returns:
+        ParetoTable: Sorted by partition, then by ``metric`` descending. Shares
+        are relative to the partition total over all its reasons, not only
+        the top ones.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS}, not {metric!r}")
+    partition_by, reason_by = tuple(partition_by), tuple(reason_by)
+    n = len(frame)
+    if n == 0:
+        empty = np.empty(0)
+        return ParetoTable(
+            partition_by,
+            reason_by,
+            metric,
+            [],
+            [],
+            empty.astype(np.int64),
+            empty,
+            empty,
+            empty,
+        )
+
+    part_of_row, _ = _combine([frame.codes[name] for name in partition_by], n)
+    group_of_row, group_first = _combine(
+        [frame.codes[name] for name in (*partition_by, *reason_by)], n
+    )
+    n_groups = len(group_first)
+
+    stops = np.bincount(group_of_row, weights=frame.stops, minlength=n_groups)
+    downtime = np.bincount(group_of_row, weights=frame.downtime_min, minlength=n_groups)
+    group_part = part_of_row[group_first]
+    values = stops if metric == "stops" else downtime
+
+    part_total = np.bincount(group_part, weights=np.nan_to_num(values))
+    order = np.lexsort((-np.nan_to_num(values, nan=-np.inf), group_part))
+    sorted_part = group_part[order]
+
+    # Rank within partition: position minus the partition's first position
+    starts = np.flatnonzero(np.r_[True, sorted_part[1:] != sorted_part[:-1]])
+    part_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    rank = np.arange(len(order)) - part_start
+    sorted_values = np.nan_to_num(values[order])
+    cumulative = np.cumsum(sorted_values)
+    cumulative -= np.repeat(
+        cumulative[starts] - sorted_values[starts],
+        np.diff(np.r_[starts, len(order)]),
+    )
+
+    keep = rank < top
+    order, sorted_part = order[keep], sorted_part[keep]
+    totals = part_total[sorted_part]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        share = np.nan_to_num(values[order]) / totals
+        cumulative_share = cumulative[keep] / totals
+
+    first_rows = group_first[order]
+    return ParetoTable(
+        partition_by=partition_by,
+        reason_by=reason_by,
+        metric=metric,
+        partition=_labels(frame, partition_by, first_rows),
+        reason=_labels(frame, reason_by, first_rows),
+        stops=stops[order].astype(np.int64),
+        downtime_min=downtime[order],
+        share=share,
+        cumulative_share=cumulative_share,
+    )
+
+
+def _labels(
+    frame: StopFrame, fields: Sequence[str], rows: np.ndarray
+) -> List[Tuple[Hashable, ...]]:
+    columns = [
+        [frame.labels[name][code] for code in frame.codes[name][rows].tolist()]
+        for name in fields
+    ]
+    return list(zip(*columns)) if columns else [()] * len(rows)
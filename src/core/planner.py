@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from src.core.python_spa.stop_stats import SHIFT_COUNT, StopStatsColumns
+from src.core.scheduler import shift_bounds
+from src.utils.helpers import get_ots_url
+
+# Fields that can be recovered per shift from a multi-shift page: the page
+# breaks stop counts down per shift, but not downtime, OEE or rejects.
+SPLIT_FIELDS = frozenset({"machine", "description", "stops"})
+DEFAULT_FIELDS = ("machine", "description", "stops", "downtime_min")
+
+# shift -> (time period, stop table of that shift)
+ShiftViews = Dict[int, Tuple[str, StopStatsColumns]]
+
+
+@dataclass(frozen=True, slots=True)
+class EquipmentQuery:
+    """One ``sp_PeriodEquipmentData`` request covering ``shifts`` of a day."""
+
+    date: str
+    shifts: Tuple[int, ...]
+
+    @property
+    def shift_start(self) -> int:
+        return self.shifts[0]
+
+    @property
+    def shift_end(self) -> int:
+        return self.shifts[-1]
+
+    @property
+    def split(self) -> bool:
+        return self.shift_end > self.shift_start
+
+    def url(self, config, link_up: str) -> str:
+        # Always OTS: the report service only serves single-shift pages
+        return get_ots_url(
+            config,
+            "period_equipment_data",
+            link_up,
+            self.date,
+            str(self.shift_start),
+            shift_end=str(self.shift_end),
+        )
+
+    def views(self, time_period: str, columns: StopStatsColumns) -> ShiftViews:
+        """Split the parsed page into the stop table of each requested shift."""
+        if not self.split:
+            return {self.shift_start: (time_period, columns)}
+        return {
+            shift: (_shift_period(self.date, shift), view)
+            for shift, view in split_by_shift(columns, self.shifts).items()
+        }
+
+
+def plan_equipment_queries(
+    dates: Iterable[str],
+    shifts: Iterable[int],
+    fields: Sequence[str] = DEFAULT_FIELDS,
+) -> List[EquipmentQuery]:
+    """
+    Fewest equipment requests that provide ``fields`` for every date and shift.
+
+    If every field can be split per shift, each date is fetched once over
+    all its shifts; otherwise every shift needs its own request. Dates are
+    never merged, since the page only breaks counts down per shift number.
+    """
+    shifts = tuple(sorted({int(shift) for shift in shifts}))
+    if set(fields) <= SPLIT_FIELDS:
+        return [EquipmentQuery(date, shifts) for date in dates]
+    return [EquipmentQuery(date, (shift,)) for date in dates for shift in shifts]
+
+
+def split_by_shift(
+    columns: StopStatsColumns, shifts: Iterable[int]
+) -> Dict[int, StopStatsColumns]:
+    """
+    Per-shift stop tables from a multi-shift page.
+
+    Keeps the reasons that stopped in each shift with that shift's count.
+    Fields that cannot be split (downtime, OEE, rejects) are NaN.
+    """
+    views = {}
+    for shift in shifts:
+        counts = columns.stops_per_shift[:, shift - 1]
+        mask = counts > 0
+        n = int(mask.sum())
+        per_shift = np.full((n, SHIFT_COUNT), np.nan)
+        per_shift[:, shift - 1] = counts[mask]
+        views[shift] = StopStatsColumns(
+            machine=columns.machine[mask],
+            description=columns.description[mask],
+            stops=counts[mask].astype(np.int64),
+            downtime_min=np.full(n, np.nan),
+            oee_percent=np.full(n, np.nan),
+            rejects_percent=np.full(n, np.nan),
+            stops_per_shift=per_shift,
+        )
+    return views
+
+
+def _shift_period(date: str, shift: int) -> str:
+    window = shift_bounds(datetime.strptime(date, "%Y-%m-%d").date(), shift)
+    return f"{window.start:%Y-%m-%d %H:%M} to {window.end:%Y-%m-%d %H:%M}"
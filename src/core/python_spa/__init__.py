@@ -1,3 +1,3 @@
-from . import losstree, stop_stats
+from . import losstree, rollup, stop_stats, typed_struct, units
 
-__all__ = ["losstree", "stop_stats"]
+__all__ = ["losstree", "rollup", "stop_stats", "typed_struct", "units"]
@@ -7,6 +7,7 @@ from .quality_loss import extract_quality_loss
 from .rate_loss import extract_rate_loss
 from .spa_struct import SPALossTree
 from .time_range import extract_time_range
+from .typed_struct import TypedLossTree
 from .unplanned import extract_unplanned_downtime
 
 
@@ -72,3 +73,16 @@ def extract_loss_tree(html: str) -> SPALossTree:
         planned=planned,
         unplanned=unplanned,
     )
+
+
+def extract_typed_loss_tree(html: str) -> TypedLossTree:
+    """
+    Extracts the SPA Loss Tree and parses its values into numbers once
+
+    Args:
+        html: The HTML string containing all SPA data
+
+    Returns:
+        TypedLossTree whose ``raw`` attribute holds the string-valued SPALossTree
+    """
+    return TypedLossTree.from_raw(extract_loss_tree(html))
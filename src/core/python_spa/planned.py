@@ -3,7 +3,9 @@ from typing import List, Optional
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
+from .rows import SECTIONS
 from .spa_struct import Losses, Planned, PlannedStopReason
+from .vocabulary import intern_text
 
 
 def extract_planned_downtime(html: str) -> Planned:
@@ -27,16 +29,12 @@ def extract_planned_downtime(html: str) -> Planned:
     last_description: str = ""
     in_reason_section: bool = False
 
-    for i, row in enumerate(trs):
-        tds: List[Tag] = row.select("td")
-        td_texts: List[str] = [td.get_text(strip=True) for td in tds]
-
+    # Row by row: the reasons end where the unplanned section starts
+    for row in trs:
+        td_texts: List[str] = [td.get_text(strip=True) for td in row.select("td")]
+        found = SECTIONS.classify(td_texts)
         # Find PDT summary
-        if (
-            not pdt
-            and len(tds) >= 11
-            and any("Planned downtime" in text for text in td_texts)
-        ):
+        if not pdt and len(td_texts) >= 11 and "Planned downtime" in found:
             pdt = Losses(
                 stops=td_texts[4],
                 downtime=td_texts[6],
@@ -48,14 +46,14 @@ def extract_planned_downtime(html: str) -> Planned:
 
         # Start extracting planned stop reasons after PDT summary
         if in_reason_section:
-            if any("Unplanned" in text for text in td_texts):
+            if "Unplanned" in found:
                 break
-            if len(tds) >= 14:
+            if len(td_texts) >= 14:
                 description: str = td_texts[4] if td_texts[4] else last_description
                 last_description = description
                 planned_stops_reason.append(
                     PlannedStopReason(
-                        description=description,
+                        description=intern_text(description),
                         time=td_texts[5],
                         stops=td_texts[6],
                         downtime=td_texts[8],
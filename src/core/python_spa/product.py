@@ -3,6 +3,7 @@ from typing import List, Optional, Tuple
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
+from .rows import SECTIONS
 from .spa_struct import ProductByPO, Products
 
 
@@ -25,11 +26,13 @@ def extract_products(html: str) -> ProductByPO:
     start: Optional[int] = None
     end: Optional[int] = None
     for i, row in enumerate(trs):
-        tds: List[Tag] = row.select("td")
-        row_text: str = "".join(td.get_text(strip=True) for td in tds)
-        if start is None and "Theo Production by PO" in row_text:
+        # Matched in the joined row text, as the labels may span cells
+        found = SECTIONS.classify(
+            [td.get_text(strip=True) for td in row.select("td")], separator=""
+        )
+        if start is None and "Theo Production by PO" in found:
             start = i + 1
-        if end is None and "Line performance" in row_text:
+        if end is None and "Line performance" in found:
             end = i
         if start is not None and end is not None:
             break
@@ -1,7 +1,8 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Set
 
 from bs4 import BeautifulSoup
 
+from .rows import SECTIONS
 from .spa_struct import Losses, RateLoss
 
 
@@ -32,13 +33,16 @@ def extract_rate_loss(html: str) -> RateLoss:
     found: Set[str] = set()
     keywords: Set[str] = set(keyword_map.keys())
 
-    for row in soup.select("tr"):
-        tds = row.select("td")
-        if len(tds) < 7:
+    rows = [row.select("td") for row in soup.select("tr")]
+    texts: List[List[str]] = [
+        [td.get_text(strip=True) for td in tds] if len(tds) >= 7 else [] for tds in rows
+    ]
+    # Matched in the space-joined row text, as keywords may span cells
+    for tds, row_keywords in zip(rows, SECTIONS.classify_page(texts, separator=" ")):
+        if not row_keywords:
             continue
-        row_text: str = " ".join(td.get_text(strip=True) for td in tds)
         for keyword in keywords - found:
-            if keyword in row_text:
+            if keyword in row_keywords:
                 attr: str = keyword_map[keyword]
                 setattr(
                     losses,
@@ -0,0 +1,301 @@
+"""
+Roll several shift loss trees up into one day or week tree.
+
+Durations, stops and production are summed. Ratios are recomputed from the
+summed values rather than averaged: uptime losses over valid time, MTBF
+from reference run time per stop, MTTR from downtime per stop, PR from net
+production over the production at target speed. Shares that SPA does not
+derive from listed values (uptime, availability, efficiency, and PR when a
+shift lacks its production) are averaged weighted by each shift's valid
+time.
+"""
+
+from datetime import date
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence
+
+from .typed_struct import (
+    TypedLinePerformance,
+    TypedLosses,
+    TypedLossTree,
+    TypedPlanned,
+    TypedStopReason,
+    TypedTimeRange,
+    TypedUnplanned,
+    TypedUPDT,
+)
+from .units import DateTimeRange
+
+
+def _sum(values: Iterable[Optional[float]]) -> Optional[float]:
+    present = [value for value in values if value is not None]
+    return sum(present) if present else None
+
+
+def _ratio(
+    numerator: Optional[float], denominator: Optional[float], scale: float = 1.0
+) -> Optional[float]:
+    if numerator is None or not denominator:
+        return None
+    return numerator / denominator * scale
+
+
+def _weighted(
+    values: Sequence[Optional[float]], weights: Sequence[Optional[float]]
+) -> Optional[float]:
+    pairs = [(v, w) for v, w in zip(values, weights) if v is not None and w]
+    total = sum(w for _, w in pairs)
+    if not total:
+        return None
+    return sum(v * w for v, w in pairs) / total
+
+
+def rollup_time_range(
+    ranges: Sequence[TypedTimeRange],
+    stops: Optional[float] = None,
+    downtime: Optional[float] = None,
+) -> TypedTimeRange:
+    """
+    Sum the times of several shifts.
+
+    ``stops`` and ``downtime`` are the rolled-up unplanned totals that MTBF
+    and MTTR are derived from.
+    """
+
+    def total(name: str) -> Optional[float]:
+        return _sum(getattr(r, name) for r in ranges)
+
+    def by_valid_time(name: str) -> Optional[float]:
+        return _weighted([getattr(r, name) for r in ranges], valid)
+
+    valid = [r.valid_time for r in ranges]
+    net_production = total("net_production")
+    target_production = total("theo_production_target_speed")
+    has_production = all(
+        r.net_production is not None and r.theo_production_target_speed is not None
+        for r in ranges
+    )
+    calendars = [r.calendar_time for r in ranges if r.calendar_time]
+    reference_run_time = total("reference_run_time")
+    return TypedTimeRange(
+        calendar_time=(
+            DateTimeRange(
+                min(c.start for c in calendars), max(c.end for c in calendars)
+            )
+            if calendars
+            else None
+        ),
+        missing_data_time=total("missing_data_time"),
+        valid_time=total("valid_time"),
+        excluded_time=total("excluded_time"),
+        reference_run_time=reference_run_time,
+        theo_production_run_time=total("theo_production_run_time"),
+        pr=(
+            _ratio(net_production, target_production, 100.0)
+            if has_production
+            else by_valid_time("pr")
+        ),
+        uptime=by_valid_time("uptime"),
+        mtbf=_ratio(reference_run_time, stops),
+        mttr=_ratio(downtime, stops),
+        net_production=net_production,
+        theo_production_target_speed=target_production,
+        theo_production_design_speed=total("theo_production_design_speed"),
+        availability=by_valid_time("availability"),
+        efficiency=by_valid_time("efficiency"),
+    )
+
+
+def rollup_losses(
+    losses: Sequence[Optional[TypedLosses]],
+    valid_time: Optional[float],
+    reference_run_time: Optional[float],
+) -> Optional[TypedLosses]:
+    present = [loss for loss in losses if loss is not None]
+    if not present:
+        return None
+    stops = _sum(loss.stops for loss in present)
+    downtime = _sum(loss.downtime for loss in present)
+    has_mtbf = any(loss.mtbf is not None for loss in present)
+    has_mttr = any(loss.mttr is not None for loss in present)
+    return TypedLosses(
+        stops=None if stops is None else int(stops),
+        downtime=downtime,
+        uptime_loss=_ratio(downtime, valid_time, 100.0),
+        mtbf=_ratio(reference_run_time, stops) if has_mtbf else None,
+        mttr=_ratio(downtime, stops) if has_mttr else None,
+    )
+
+
+def rollup_reasons(
+    reasons: Iterable[TypedStopReason],
+    key: Callable[[TypedStopReason], Hashable],
+    valid_time: Optional[float],
+    reference_run_time: Optional[float],
+) -> List[TypedStopReason]:
+    """Merge stop reasons with the same key, in order of first appearance."""
+    groups: Dict[Hashable, List[TypedStopReason]] = {}
+    for reason in reasons:
+        groups.setdefault(key(reason), []).append(reason)
+
+    merged = []
+    for group in groups.values():
+        losses = rollup_losses(
+            [
+                TypedLosses(
+                    stops=r.stops, downtime=r.downtime, mtbf=r.mtbf, mttr=r.mttr
+                )
+                for r in group
+            ],
+            valid_time,
+            reference_run_time,
+        )
+        merged.append(
+            TypedStopReason(
+                description=group[0].description,
+                stops=losses.stops,
+                downtime=losses.downtime,
+                uptime_loss=losses.uptime_loss,
+                mtbf=losses.mtbf,
+                mttr=losses.mttr,
+                rejects_percent=_weighted(
+                    [r.rejects_percent for r in group], [r.stops for r in group]
+                ),
+                causing_equipment=group[0].causing_equipment,
+            )
+        )
+    return merged
+
+
+def _rollup_updts(
+    lists: Iterable[Sequence[TypedUPDT]],
+    valid_time: Optional[float],
+    reference_run_time: Optional[float],
+) -> List[TypedUPDT]:
+    groups: Dict[Optional[str], List[Optional[TypedLosses]]] = {}
+    for updts in lists:
+        for updt in updts:
+            groups.setdefault(updt.category, []).append(updt.losses)
+    return [
+        TypedUPDT(
+            category=category,
+            losses=rollup_losses(losses, valid_time, reference_run_time),
+        )
+        for category, losses in groups.items()
+    ]
+
+
+def _period(trees: Sequence[TypedLossTree]) -> Optional[str]:
+    periods = [tree.period for tree in trees if tree.period]
+    if not periods:
+        return None
+    if len(periods) == 1:
+        return periods[0]
+    return f"{periods[0]} to {periods[-1]}"
+
+
+def rollup_loss_trees(trees: Iterable[TypedLossTree]) -> TypedLossTree:
+    """
+    Combine shift loss trees of one line into a single tree.
+
+    The trees are ordered by date and shift first, so ``period`` reads from
+    the first to the last shift. The result has no ``raw`` source and no
+    ``shift``; ``date`` is the first day covered.
+    """
+    trees = sorted(
+        trees, key=lambda t: (t.date or date.min, t.shift or 0, t.period or "")
+    )
+    if not trees:
+        return TypedLossTree()
+
+    ranges = [tree.time_range for tree in trees if tree.time_range]
+    valid = _sum(r.valid_time for r in ranges)
+    reference = _sum(r.reference_run_time for r in ranges)
+    planned = [tree.planned for tree in trees if tree.planned]
+    unplanned = [tree.unplanned for tree in trees if tree.unplanned]
+    updt = rollup_losses([u.updt for u in unplanned], valid, reference)
+    time_range = (
+        rollup_time_range(
+            ranges,
+            stops=updt.stops if updt else None,
+            downtime=updt.downtime if updt else None,
+        )
+        if ranges
+        else None
+    )
+
+    performances = [tree.line_performance for tree in trees if tree.line_performance]
+    line_performance = None
+    if performances:
+        line_failure = _sum(p.line_failure for p in performances)
+        run_time = _sum(p.run_time for p in performances)
+        line_performance = TypedLinePerformance(
+            line_failure=None if line_failure is None else int(line_failure),
+            run_time=run_time,
+            line_mtbf=_ratio(run_time, line_failure),
+            reject=_weighted(
+                [p.reject for p in performances],
+                [
+                    tree.time_range.net_production if tree.time_range else None
+                    for tree in trees
+                    if tree.line_performance
+                ],
+            ),
+            total_reject=_sum(p.total_reject for p in performances),
+        )
+
+    rate_names = dict.fromkeys(name for tree in trees for name in tree.rate_loss)
+    rate_loss = {
+        name: losses
+        for name in rate_names
+        if (
+            losses := rollup_losses(
+                [tree.rate_loss.get(name) for tree in trees], valid, reference
+            )
+        )
+    }
+
+    return TypedLossTree(
+        equipment=trees[0].equipment,
+        period=_period(trees),
+        date=trees[0].date,
+        time_range=time_range,
+        line_performance=line_performance,
+        rate_loss=rate_loss,
+        reject_loss=rollup_losses(
+            [tree.reject_loss for tree in trees], valid, reference
+        ),
+        planned=(
+            TypedPlanned(
+                pdt=rollup_losses([p.pdt for p in planned], valid, reference),
+                pdt_reason=rollup_reasons(
+                    (r for p in planned for r in p.pdt_reason),
+                    lambda r: r.description,
+                    valid,
+                    reference,
+                ),
+            )
+            if planned
+            else None
+        ),
+        unplanned=(
+            TypedUnplanned(
+                updt=updt,
+                updt_shift=_rollup_updts(
+                    (u.updt_shift for u in unplanned), valid, reference
+                ),
+                updt_category=_rollup_updts(
+                    (u.updt_category for u in unplanned), valid, reference
+                ),
+                bde=_rollup_updts((u.bde for u in unplanned), valid, reference),
+                pf=_rollup_updts((u.pf for u in unplanned), valid, reference),
+                updt_reason=rollup_reasons(
+                    (r for u in unplanned for r in u.updt_reason),
+                    lambda r: (r.description, r.causing_equipment),
+                    valid,
+                    reference,
+                ),
+            )
+            if unplanned
+            else None
+        ),
+    )
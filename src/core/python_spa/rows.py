@@ -0,0 +1,107 @@
+"""
+Section keywords of the SPA pages, matched in one pass per page.
+
+The extractors find their rows by the labels in them ("Valid time",
+"Not at Target Rate", "Unplanned machine stop reasons", ...). Instead of
+testing every keyword against every cell of every row, ``SECTIONS`` joins
+the rows of a page and runs one compiled alternation of all keywords over
+it. Each row gets the set of keywords contained in one of its cells, or
+in the row's cells joined by ``separator`` for extractors that matched
+keywords across cells.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, List, Sequence
+
+# Never part of a cell text, so a keyword cannot match across cells or rows
+_CELL_SEPARATOR = "\x1f"
+
+TIME_RANGE_KEYWORDS = (
+    "Calendar time",
+    "Valid time",
+    "Missing data time",
+    "Excluded time",
+    "Reference run time",
+    "Theo production run time",
+    "Working time",
+)
+RATE_LOSS_KEYWORDS = (
+    "Design speed loss",
+    "Target rate loss",
+    "Not at Target Rate",
+    "Start-up/Ramp-down",
+)
+PLANNED_KEYWORDS = ("Planned downtime", "Unplanned")
+UNPLANNED_KEYWORDS = (
+    "Unplanned downtime",
+    "Unplanned downtime per Category",
+    "Breakdown & Process Failures",
+    "Process failures",
+    "Low volume events",
+    "Unplanned machine stop reasons",
+)
+PRODUCT_KEYWORDS = ("Theo Production by PO", "Line performance")
+
+
+class RowClassifier:
+    """
+    Finds which of ``keywords`` occur in the cells of each row.
+
+    The alternation is tried at every position (as a lookahead) with the
+    longest keywords first; the keywords contained in a match are added to
+    it, so overlapping keywords are all reported, as with ``in``.
+    """
+
+    __slots__ = ("keywords", "_pattern", "_contained")
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = tuple(dict.fromkeys(keywords))
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile(
+            "(?=(" + "|".join(re.escape(keyword) for keyword in ordered) + "))"
+        )
+        self._contained: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(other for other in self.keywords if other in keyword)
+            for keyword in self.keywords
+        }
+
+    def classify(
+        self, texts: Sequence[str], separator: str = _CELL_SEPARATOR
+    ) -> FrozenSet[str]:
+        """Keywords contained in any of one row's cell texts."""
+        found: FrozenSet[str] = frozenset()
+        for match in self._pattern.finditer(separator.join(texts)):
+            found |= self._contained[match[1]]
+        return found
+
+    def classify_page(
+        self, rows: Sequence[Sequence[str]], separator: str = _CELL_SEPARATOR
+    ) -> List[FrozenSet[str]]:
+        """``classify`` for every row of a page, in one scan."""
+        starts: List[int] = []
+        position = 0
+        for texts in rows:
+            starts.append(position)
+            # Cells, the separators between them and the one ending the row
+            position += (
+                sum(map(len, texts)) + max(len(texts) - 1, 0) * len(separator) + 1
+            )
+        # Rows are always split by the unit separator, so no match spans two
+        text = _CELL_SEPARATOR.join(separator.join(texts) for texts in rows)
+        found: List[FrozenSet[str]] = [frozenset()] * len(rows)
+        for match in self._pattern.finditer(text):
+            row = bisect_right(starts, match.start()) - 1
+            found[row] = found[row] | self._contained[match[1]]
+        return found
+
+
+SECTIONS = RowClassifier(
+    (
+        *TIME_RANGE_KEYWORDS,
+        *RATE_LOSS_KEYWORDS,
+        *PLANNED_KEYWORDS,
+        *UNPLANNED_KEYWORDS,
+        *PRODUCT_KEYWORDS,
+    )
+)
@@ -1,10 +1,127 @@
 import json
-from typing import List, Optional
-
-from pydantic import BaseModel
-
-
-class TimeRange(BaseModel):
+import typing
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+_Validator = Callable[[Any], Any]
+_ACCESSORS: Dict[type, Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]] = {}
+_VALIDATORS: Dict[type, Dict[str, _Validator]] = {}
+
+
+def _dump(value: Any) -> Any:
+    if value is None or type(value) is str:
+        return value
+    if isinstance(value, Struct):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    return value
+
+
+def _accessors(cls: type):
+    accessors = _ACCESSORS.get(cls)
+    if accessors is None:
+        names = tuple(cls.__dataclass_fields__)
+        getter = attrgetter(*names)
+        if len(names) == 1:
+            getter = lambda obj, _get=getter: (_get(obj),)  # noqa: E731
+        accessors = _ACCESSORS[cls] = (names, getter)
+    return accessors
+
+
+class Struct:
+    """
+    Base of the slots-based result objects.
+
+    Extractors build instances directly from strings they just parsed, so
+    construction does no validation. Data coming from outside (JSON, cache
+    files, API requests) goes through ``model_validate`` instead.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        names, getter = _accessors(type(self))
+        return {name: _dump(value) for name, value in zip(names, getter(self))}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    # Kept for callers written against the former pydantic models
+    def model_dump(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    @classmethod
+    def model_construct(cls, **values: Any):
+        """Trusted construction without validation."""
+        return cls(**values)
+
+    @classmethod
+    def model_validate(cls, data: Dict[str, Any]):
+        """
+        Build an instance from untrusted data (e.g. parsed JSON)
+
+        Raises:
+            TypeError: If a field has the wrong type or is unknown
+        """
+        if isinstance(data, cls):
+            return data
+        if not isinstance(data, dict):
+            raise TypeError(f"{cls.__name__} expects a dict, got {type(data).__name__}")
+        validators = _validators(cls)
+        values = {}
+        for name, value in data.items():
+            validator = validators.get(name)
+            if validator is None:
+                raise TypeError(f"Unknown field for {cls.__name__}: {name}")
+            values[name] = validator(value)
+        return cls(**values)
+
+
+def _validators(cls: type) -> Dict[str, _Validator]:
+    validators = _VALIDATORS.get(cls)
+    if validators is None:
+        hints = typing.get_type_hints(cls)
+        validators = _VALIDATORS[cls] = {
+            name: _compile(hints[name], f"{cls.__name__}.{name}")
+            for name in cls.__dataclass_fields__
+        }
+    return validators
+
+
+def _compile(hint: Any, path: str) -> _Validator:
+    """Turn a field annotation into a validation function, once per class."""
+    origin = typing.get_origin(hint)
+    if origin is typing.Union:
+        (inner,) = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        check = _compile(inner, path)
+        return lambda value: None if value is None else check(value)
+    if origin is list:
+        (inner,) = typing.get_args(hint)
+        check = _compile(inner, path)
+
+        def check_list(value):
+            if not isinstance(value, list):
+                raise TypeError(f"{path} must be a list")
+            return [check(item) for item in value]
+
+        return check_list
+    if isinstance(hint, type) and issubclass(hint, Struct):
+        return hint.model_validate
+    if hint is str:
+
+        def check_str(value):
+            if type(value) is not str:
+                raise TypeError(f"{path} must be a string")
+            return value
+
+        return check_str
+    return lambda value: value
+
+
+@dataclass(slots=True)
+class TimeRange(Struct):
     calendar_time: Optional[str] = None
     missing_data_time: Optional[str] = None
     valid_time: Optional[str] = None
@@ -22,17 +139,20 @@ class TimeRange(BaseModel):
     efficiency: Optional[str] = None
 
 
-class Products(BaseModel):
+@dataclass(slots=True)
+class Products(Struct):
     po: Optional[str] = None
     fa_code: Optional[str] = None
     time: Optional[str] = None
 
 
-class ProductByPO(BaseModel):
-    products: List[Products] = []
+@dataclass(slots=True)
+class ProductByPO(Struct):
+    products: Optional[List[Products]] = field(default_factory=list)
 
 
-class LinePerformance(BaseModel):
+@dataclass(slots=True)
+class LinePerformance(Struct):
     line_failure: Optional[str] = None
     run_time: Optional[str] = None
     line_mtbf: Optional[str] = None
@@ -40,7 +160,8 @@ class LinePerformance(BaseModel):
     total_reject: Optional[str] = None
 
 
-class Losses(BaseModel):
+@dataclass(slots=True)
+class Losses(Struct):
     time: Optional[str] = None
     stops: Optional[str] = None
     downtime: Optional[str] = None
@@ -50,18 +171,21 @@ class Losses(BaseModel):
     details: Optional[str] = None
 
 
-class RateLoss(BaseModel):
+@dataclass(slots=True)
+class RateLoss(Struct):
     dsl: Optional[Losses] = None
     trl: Optional[Losses] = None
     natr: Optional[Losses] = None
     ramp_up_down: Optional[Losses] = None
 
 
-class QualityLoss(BaseModel):
+@dataclass(slots=True)
+class QualityLoss(Struct):
     reject_loss: Optional[Losses] = None
 
 
-class PlannedStopReason(BaseModel):
+@dataclass(slots=True)
+class PlannedStopReason(Struct):
     description: Optional[str] = None
     time: Optional[str] = None
     stops: Optional[str] = None
@@ -72,12 +196,14 @@ class PlannedStopReason(BaseModel):
     details: Optional[str] = None
 
 
-class Planned(BaseModel):
+@dataclass(slots=True)
+class Planned(Struct):
     pdt: Optional[Losses] = None
-    pdt_reason: List[PlannedStopReason] = []
+    pdt_reason: Optional[List[PlannedStopReason]] = field(default_factory=list)
 
 
-class UnplannedStopReason(BaseModel):
+@dataclass(slots=True)
+class UnplannedStopReason(Struct):
     description: Optional[str] = None
     stops: Optional[str] = None
     ramp_up: Optional[str] = None
@@ -90,21 +216,24 @@ class UnplannedStopReason(BaseModel):
     causing_equipment: Optional[str] = None
 
 
-class UPDT(BaseModel):
+@dataclass(slots=True)
+class UPDT(Struct):
     category: Optional[str] = None
     losses: Optional[Losses] = None
 
 
-class Unplanned(BaseModel):
-    updt: Losses = Losses()
-    updt_shift: List[UPDT] = []
-    updt_category: List[UPDT] = []
-    bde: List[UPDT] = []
-    pf: List[UPDT] = []
-    updt_reason: List[UnplannedStopReason] = []
+@dataclass(slots=True)
+class Unplanned(Struct):
+    updt: Losses = field(default_factory=Losses)
+    updt_shift: Optional[List[UPDT]] = field(default_factory=list)
+    updt_category: Optional[List[UPDT]] = field(default_factory=list)
+    bde: Optional[List[UPDT]] = field(default_factory=list)
+    pf: Optional[List[UPDT]] = field(default_factory=list)
+    updt_reason: Optional[List[UnplannedStopReason]] = field(default_factory=list)
 
 
-class SPALossTree(BaseModel):
+@dataclass(slots=True)
+class SPALossTree(Struct):
     equipment: Optional[str] = None
     period: Optional[str] = None
     time_range: Optional[TimeRange] = None
@@ -116,39 +245,103 @@ class SPALossTree(BaseModel):
     unplanned: Optional[Unplanned] = None
 
 
-class StopReason(BaseModel):
-    description: Optional[str] = None
-    stops: Optional[str] = None
-    downtime_min: Optional[str] = None
-    oee_percent: Optional[str] = None
-    rejects_percent: Optional[str] = None
-    stops_per_shift: List[str] = []
-
-
-class Machine(BaseModel):
-    id: Optional[str] = None
-    machine_type: Optional[str] = None
-    total_downtime_min: Optional[str] = None
-    total_stops: Optional[str] = None
-    total_run_time_min: Optional[str] = None
-    avg_speed_cig_per_min: Optional[str] = None
-    production_mio_cig: Optional[str] = None
-    total_rejects_percent: Optional[str] = None
-    mtbf_min: Optional[str] = None
-    mttr_min: Optional[str] = None
-    stop_reasons: List[StopReason] = []
-
-    def to_dict(self):
-        return self.model_dump()
-
-
-class StopStatistics(BaseModel):
-    factory: Optional[str] = None
-    line: Optional[str] = None
-    design_speed: Optional[str] = None
-    target_speed: Optional[str] = None
-    time_period: Optional[str] = None
-    machines: List[Machine] = []
-
-    def to_dict(self):
-        return self.model_dump()
+class StopReasonDict(TypedDict):
+    description: str
+    stops: str
+    downtime_min: str
+    oee_percent: str
+    rejects_percent: str
+    stops_per_shift: List[str]
+
+
+@dataclass(slots=True)
+class StopReason(Struct):
+    description: str = ""
+    stops: str = ""
+    downtime_min: str = ""
+    oee_percent: str = ""
+    rejects_percent: str = ""
+    stops_per_shift: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> StopReasonDict:
+        return {
+            "description": self.description,
+            "stops": self.stops,
+            "downtime_min": self.downtime_min,
+            "oee_percent": self.oee_percent,
+            "rejects_percent": self.rejects_percent,
+            "stops_per_shift": list(self.stops_per_shift),
+        }
+
+
+class MachineDict(TypedDict):
+    id: str
+    machine_type: str
+    total_downtime_min: str
+    total_stops: str
+    total_run_time_min: str
+    avg_speed_cig_per_min: str
+    production_mio_cig: str
+    total_rejects_percent: str
+    mtbf_min: str
+    mttr_min: str
+    stop_reasons: List[StopReasonDict]
+
+
+@dataclass(slots=True)
+class Machine(Struct):
+    id: str = ""
+    machine_type: str = ""
+    total_downtime_min: str = ""
+    total_stops: str = ""
+    total_run_time_min: str = ""
+    avg_speed_cig_per_min: str = ""
+    production_mio_cig: str = ""
+    total_rejects_percent: str = ""
+    mtbf_min: str = ""
+    mttr_min: str = ""
+    stop_reasons: List[StopReason] = field(default_factory=list)
+
+    def to_dict(self) -> MachineDict:
+        return {
+            "id": self.id,
+            "machine_type": self.machine_type,
+            "total_downtime_min": self.total_downtime_min,
+            "total_stops": self.total_stops,
+            "total_run_time_min": self.total_run_time_min,
+            "avg_speed_cig_per_min": self.avg_speed_cig_per_min,
+            "production_mio_cig": self.production_mio_cig,
+            "total_rejects_percent": self.total_rejects_percent,
+            "mtbf_min": self.mtbf_min,
+            "mttr_min": self.mttr_min,
+            "stop_reasons": [sr.to_dict() for sr in self.stop_reasons],
+        }
+
+
+class StopStatisticsDict(TypedDict):
+    factory: str
+    line: str
+    design_speed: str
+    target_speed: str
+    time_period: str
+    machines: List[MachineDict]
+
+
+@dataclass(slots=True)
+class StopStatistics(Struct):
+    factory: str = ""
+    line: str = ""
+    design_speed: str = ""
+    target_speed: str = ""
+    time_period: str = ""
+    machines: List[Machine] = field(default_factory=list)
+
+    def to_dict(self) -> StopStatisticsDict:
+        return {
+            "factory": self.factory,
+            "line": self.line,
+            "design_speed": self.design_speed,
+            "target_speed": self.target_speed,
+            "time_period": self.time_period,
+            "machines": [m.to_dict() for m in self.machines],
+        }
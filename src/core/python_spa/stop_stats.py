@@ -1,119 +1,62 @@
-import json
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, TypedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
 from bs4 import BeautifulSoup
 
-
-class StopReasonDict(TypedDict):
-    description: str
-    stops: str
-    downtime_min: str
-    oee_percent: str
-    rejects_percent: str
-    stops_per_shift: List[str]
-
-
-@dataclass(slots=True)
-class StopReason:
-    description: str = ""
-    stops: str = ""
-    downtime_min: str = ""
-    oee_percent: str = ""
-    rejects_percent: str = ""
-    stops_per_shift: List[str] = field(default_factory=list)
-
-    def to_dict(self) -> StopReasonDict:
-        return {
-            "description": self.description,
-            "stops": self.stops,
-            "downtime_min": self.downtime_min,
-            "oee_percent": self.oee_percent,
-            "rejects_percent": self.rejects_percent,
-            "stops_per_shift": self.stops_per_shift,
-        }
-
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict())
-
-
-class MachineDict(TypedDict):
-    id: str
-    machine_type: str
-    total_downtime_min: str
-    total_stops: str
-    total_run_time_min: str
-    avg_speed_cig_per_min: str
-    production_mio_cig: str
-    total_rejects_percent: str
-    mtbf_min: str
-    mttr_min: str
-    stop_reasons: List[StopReasonDict]
+from .spa_struct import (
+    Machine,
+    MachineDict,
+    StopReason,
+    StopReasonDict,
+    StopStatistics,
+    StopStatisticsDict,
+)
+from .typed_struct import TypedStopStatistics
+from .units import parse_float
+from .vocabulary import intern_text
+
+# Column name -> table header used by the GUI
+STOP_COLUMN_HEADERS: Dict[str, str] = {
+    "machine": "Machine",
+    "description": "Description",
+    "stops": "Stops",
+    "downtime_min": "DT [min]",
+    "oee_percent": "OEE [%]",
+    "rejects_percent": "Rejects [%]",
+}
+SHIFT_COUNT = 3
+
+# (machine, description, stops, downtime, oee, rejects, stops per shift)
+StopRow = Tuple[str, str, str, str, str, str, Sequence[str]]
 
 
 @dataclass(slots=True)
-class Machine:
-    id: str = ""
-    machine_type: str = ""
-    total_downtime_min: str = ""
-    total_stops: str = ""
-    total_run_time_min: str = ""
-    avg_speed_cig_per_min: str = ""
-    production_mio_cig: str = ""
-    total_rejects_percent: str = ""
-    mtbf_min: str = ""
-    mttr_min: str = ""
-    stop_reasons: List[StopReason] = field(default_factory=list)
-
-    def to_dict(self) -> MachineDict:
-        return {
-            "id": self.id,
-            "machine_type": self.machine_type,
-            "total_downtime_min": self.total_downtime_min,
-            "total_stops": self.total_stops,
-            "total_run_time_min": self.total_run_time_min,
-            "avg_speed_cig_per_min": self.avg_speed_cig_per_min,
-            "production_mio_cig": self.production_mio_cig,
-            "total_rejects_percent": self.total_rejects_percent,
-            "mtbf_min": self.mtbf_min,
-            "mttr_min": self.mttr_min,
-            "stop_reasons": [sr.to_dict() for sr in self.stop_reasons],
-        }
-
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict())
-
-
-class StopStatisticsDict(TypedDict):
-    factory: str
-    line: str
-    design_speed: str
-    target_speed: str
-    time_period: str
-    machines: List[MachineDict]
-
-
-@dataclass(slots=True)
-class StopStatistics:
-    factory: str = ""
-    line: str = ""
-    design_speed: str = ""
-    target_speed: str = ""
-    time_period: str = ""
-    machines: List[Machine] = field(default_factory=list)
-
-    def to_dict(self) -> StopStatisticsDict:
-        return {
-            "factory": self.factory,
-            "line": self.line,
-            "design_speed": self.design_speed,
-            "target_speed": self.target_speed,
-            "time_period": self.time_period,
-            "machines": [m.to_dict() for m in self.machines],
-        }
-
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+class StopStatsColumns:
+    """Equipment stop reasons as one typed NumPy array per column."""
+
+    machine: np.ndarray
+    description: np.ndarray
+    stops: np.ndarray
+    downtime_min: np.ndarray
+    oee_percent: np.ndarray
+    rejects_percent: np.ndarray
+    stops_per_shift: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.stops)
+
+    def to_frame(
+        self,
+        fields: Sequence[str] = ("machine", "description", "stops", "downtime_min"),
+    ):
+        """Wrap the selected columns in a DataFrame (no row-wise copy)."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {STOP_COLUMN_HEADERS[name]: getattr(self, name) for name in fields},
+            copy=False,
+        )
 
 
 def extract_machines(soup: BeautifulSoup) -> List[List[List[str]]]:
@@ -135,6 +78,92 @@ def extract_machines(soup: BeautifulSoup) -> List[List[List[str]]]:
     return data_stops
 
 
+def _float_or_nan(text: str) -> float:
+    value = parse_float(text)
+    return np.nan if value is None else value
+
+
+def machine_name(machine_type: str) -> str:
+    """Drop the category prefix of a machine type, e.g. "Maker - Hauni PM 100"."""
+    parts = machine_type.split("-", 1)
+    return parts[-1].strip()
+
+
+def build_stop_columns(rows: Sequence[StopRow]) -> StopStatsColumns:
+    """Allocate each column once from a sequence of stop rows."""
+    n = len(rows)
+    per_shift = np.full((n, SHIFT_COUNT), np.nan)
+    for i, row in enumerate(rows):
+        for j, text in enumerate(row[6][:SHIFT_COUNT]):
+            if text:
+                per_shift[i, j] = _float_or_nan(text)
+    return StopStatsColumns(
+        machine=np.array([row[0] for row in rows], dtype=object),
+        description=np.array([row[1] for row in rows], dtype=object),
+        stops=np.fromiter((int(row[2]) for row in rows), dtype=np.int64, count=n),
+        downtime_min=np.fromiter(
+            (float(row[3]) for row in rows), dtype=np.float64, count=n
+        ),
+        oee_percent=np.fromiter(
+            (_float_or_nan(row[4]) for row in rows), dtype=np.float64, count=n
+        ),
+        rejects_percent=np.fromiter(
+            (_float_or_nan(row[5]) for row in rows), dtype=np.float64, count=n
+        ),
+        stops_per_shift=per_shift,
+    )
+
+
+def stop_columns(stop_stats: Any) -> StopStatsColumns:
+    """
+    Columnar view of an already extracted StopStatistics
+
+    Works with both ``python_spa`` and ``spa_scraper_pyo3`` results.
+    """
+    rows: List[StopRow] = [
+        (
+            name,
+            reason.description,
+            reason.stops,
+            reason.downtime_min,
+            reason.oee_percent,
+            reason.rejects_percent,
+            reason.stops_per_shift,
+        )
+        for machine in stop_stats.machines
+        for name in (intern_text(machine_name(machine.machine_type)),)
+        for reason in machine.stop_reasons
+    ]
+    return build_stop_columns(rows)
+
+
+def _stop_rows(machine_data: Iterable[List[List[str]]]) -> List[StopRow]:
+    return [
+        (
+            intern_text(machine_rows[1][2].strip()),
+            intern_text(row[0]),
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            row[5:8],
+        )
+        for machine_rows in machine_data
+        if len(machine_rows) >= 10
+        for row in machine_rows[11:]
+        if len(row) >= 8
+    ]
+
+
+def extract_stop_columns(html: str) -> StopStatsColumns:
+    """
+    Extracts equipment stop reasons straight into columns, without building
+    Machine/StopReason objects.
+    """
+    soup: BeautifulSoup = BeautifulSoup(html, "html.parser")
+    return build_stop_columns(_stop_rows(extract_machines(soup)[::2]))
+
+
 def get_data_machines(soup: BeautifulSoup) -> List[Machine]:
     data: List[List[List[str]]] = extract_machines(soup)
     machine_data: List[List[List[str]]] = data[::2]
@@ -144,7 +173,7 @@ def get_data_machines(soup: BeautifulSoup) -> List[Machine]:
             continue
         equipment: Machine = Machine(
             id=machine_rows[0][0],
-            machine_type=f"{machine_rows[1][1]} - {machine_rows[1][2]}",
+            machine_type=intern_text(f"{machine_rows[1][1]} - {machine_rows[1][2]}"),
             total_downtime_min=machine_rows[2][1],
             total_stops=machine_rows[3][1],
             total_run_time_min=machine_rows[4][1],
@@ -155,7 +184,7 @@ def get_data_machines(soup: BeautifulSoup) -> List[Machine]:
             mttr_min=machine_rows[9][1],
             stop_reasons=[
                 StopReason(
-                    description=row[0],
+                    description=intern_text(row[0]),
                     stops=row[1],
                     downtime_min=row[2],
                     oee_percent=row[3],
@@ -192,3 +221,10 @@ def extract_stop_stats(html: str) -> StopStatistics:
         machines=get_data_machines(soup),
     )
     return stop_statistic
+
+
+def extract_typed_stop_stats(html: str) -> TypedStopStatistics:
+    """
+    Extracts stop statistics with every value parsed into numbers once.
+    """
+    return TypedStopStatistics.from_raw(extract_stop_stats(html))
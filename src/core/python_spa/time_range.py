@@ -1,8 +1,77 @@
-from typing import Callable, Dict, List, Optional, Tuple
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from bs4 import BeautifulSoup
 
+from .rows import SECTIONS
 from .spa_struct import TimeRange
+from .units import UNIT_MULTIPLIERS
+
+# TimeRange fields packed into the last cell of a row, e.g.
+# "Availability =95.3%\xa0 ;\xa0 Op. Efficiency =  93.6%". The value group
+# keeps the text as shown, the number group only its leading number and the
+# unit group the multiplier of production counts ("575 k", "3.744 Mio").
+# Whitespace never spans lines, so cells joined by newlines parse alike.
+_SPACE = r"[^\S\n]*"
+_COUNT_UNIT = rf"(?:{_SPACE}(?P<unit>k|Mio)\b)?"
+
+
+def _packed(label: str, separator: str, rest: str, end: str = "") -> re.Pattern:
+    return re.compile(
+        rf"{label}{_SPACE}{separator}{_SPACE}"
+        rf"(?P<value>(?P<number>[-+]?\d+(?:\.\d+)?)?{rest}){end}",
+        re.MULTILINE,
+    )
+
+
+PACKED_FIELDS: Dict[str, re.Pattern] = {
+    "theo_production_design_speed": _packed("design speed", ":", _COUNT_UNIT),
+    "availability": _packed("Availability", "=", r"[^;\n]*?", rf"{_SPACE}(?:;|$)"),
+    "efficiency": _packed("Efficiency", "=", r"[^;\n]*?", rf"{_SPACE}(?:;|$)"),
+    "theo_production_target_speed": _packed("target speed", ":", _COUNT_UNIT),
+    "net_production": _packed("Net production", ":", _COUNT_UNIT),
+}
+# One match per line, empty groups where the field is missing
+_PACKED_LINES: Dict[str, re.Pattern] = {
+    name: re.compile(rf"^(?:[^\n]*?{pattern.pattern})?[^\n]*$", re.MULTILINE)
+    for name, pattern in PACKED_FIELDS.items()
+}
+_DESIGN_SPEED_FIELDS = ("theo_production_design_speed",)
+_RATIO_FIELDS = ("availability", "efficiency")
+_PRODUCTION_FIELDS = ("theo_production_target_speed", "net_production")
+
+
+def packed_value(name: str, cell: Optional[str]) -> str:
+    """Text of the packed field ``name`` in ``cell``; "" when absent."""
+    match = PACKED_FIELDS[name].search(cell) if cell else None
+    return match["value"] if match else ""
+
+
+def _set_packed(time_range: TimeRange, cell: str, names: Sequence[str]) -> None:
+    for name in names:
+        setattr(time_range, name, packed_value(name, cell))
+
+
+def parse_packed_column(name: str, cells: Sequence[Optional[str]]) -> np.ndarray:
+    """
+    Numbers of the packed field ``name`` in the cells of many pages.
+
+    Scans all cells with one regex pass, e.g. to backfill the availability
+    of stored pages. Production counts are scaled by their unit. NaN where
+    the field is missing.
+    """
+    if not cells:
+        # Joining nothing still gives one (empty) line
+        return np.empty(0, dtype=np.float64)
+    text = "\n".join((cell or "").replace("\n", " ") for cell in cells)
+    matches = list(_PACKED_LINES[name].finditer(text))
+    numbers = np.array([match["number"] or "nan" for match in matches], np.float64)
+    if "unit" in _PACKED_LINES[name].groupindex:
+        numbers *= [
+            UNIT_MULTIPLIERS[(match["unit"] or "").lower()] for match in matches
+        ]
+    return numbers
 
 
 def extract_time_range(html: str) -> TimeRange:
@@ -34,31 +103,14 @@ def extract_time_range(html: str) -> TimeRange:
             lambda tds: (
                 setattr(time_range, "reference_run_time", tds[4]),
                 setattr(time_range, "uptime", tds[7]),
-                setattr(
-                    time_range,
-                    "theo_production_design_speed",
-                    tds[11].split(":")[-1].split(" ")[0].strip() if tds[11] else "",
-                ),
+                _set_packed(time_range, tds[11], _DESIGN_SPEED_FIELDS),
             ),
         ),
         "Theo production run time": (
             12,
             lambda tds: (
                 setattr(time_range, "theo_production_run_time", tds[4]),
-                setattr(
-                    time_range,
-                    "availability",
-                    tds[11].split(";")[0].split("=")[1].strip()
-                    if len(tds[11].split(";")) > 0 and "=" in tds[11].split(";")[0]
-                    else "",
-                ),
-                setattr(
-                    time_range,
-                    "efficiency",
-                    tds[11].split(";")[1].split("=")[1].strip()
-                    if len(tds[11].split(";")) > 1 and "=" in tds[11].split(";")[1]
-                    else "",
-                ),
+                _set_packed(time_range, tds[11], _RATIO_FIELDS),
             ),
         ),
         "Working time": (
@@ -67,30 +119,19 @@ def extract_time_range(html: str) -> TimeRange:
                 setattr(time_range, "pr", tds[7]),
                 setattr(time_range, "mtbf", tds[9]),
                 setattr(time_range, "mttr", tds[10]),
-                setattr(
-                    time_range,
-                    "theo_production_target_speed",
-                    tds[11].split(" ")[8].lstrip(":").strip()
-                    if len(tds[11].split(" ")) > 8
-                    else "",
-                ),
-                setattr(
-                    time_range,
-                    "net_production",
-                    tds[11].split(" ")[1].split(":")[1].lstrip(":").strip()
-                    if len(tds[11].split(" ")) > 1 and ":" in tds[11].split(" ")[1]
-                    else "",
-                ),
+                _set_packed(time_range, tds[11], _PRODUCTION_FIELDS),
             ),
         ),
     }
 
-    for row in trs:
-        tds: List[str] = [td.get_text(strip=True) for td in row.select("td")]
-        if not tds:
+    rows: List[List[str]] = [
+        [td.get_text(strip=True) for td in row.select("td")] for row in trs
+    ]
+    for tds, found in zip(rows, SECTIONS.classify_page(rows)):
+        if not found:
             continue
         for keyword, (min_len, handler) in handlers.items():
-            if len(tds) >= min_len and any(keyword in text for text in tds):
+            if len(tds) >= min_len and keyword in found:
                 handler(tds)
                 break
 
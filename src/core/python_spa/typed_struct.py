@@ -0,0 +1,337 @@
+"""
+Typed counterparts of the ``spa_struct`` models.
+
+Every value is parsed from its SPA string exactly once (in ``from_raw``); the
+original object is kept on ``raw`` so the source text stays available through
+``raw_value``. ``from_raw`` reads attributes only, so it accepts results from
+``python_spa`` as well as from ``spa_scraper_pyo3``.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from .units import (
+    DateTimeRange,
+    parse_count,
+    parse_datetime_range,
+    parse_float,
+    parse_int,
+    parse_percent,
+    parse_period,
+)
+from .vocabulary import intern_text
+
+
+def _get(raw: Any, name: str) -> Any:
+    return getattr(raw, name, None) if raw is not None else None
+
+
+@dataclass(slots=True)
+class _Typed:
+    raw: Any = field(default=None, repr=False, compare=False)
+
+    def raw_value(self, name: str) -> Optional[str]:
+        """Return the unparsed SPA string of a field."""
+        return _get(self.raw, name)
+
+
+@dataclass(slots=True)
+class TypedTimeRange(_Typed):
+    calendar_time: Optional[DateTimeRange] = None
+    missing_data_time: Optional[float] = None
+    valid_time: Optional[float] = None
+    excluded_time: Optional[float] = None
+    reference_run_time: Optional[float] = None
+    theo_production_run_time: Optional[float] = None
+    pr: Optional[float] = None
+    uptime: Optional[float] = None
+    mtbf: Optional[float] = None
+    mttr: Optional[float] = None
+    net_production: Optional[float] = None
+    theo_production_target_speed: Optional[float] = None
+    theo_production_design_speed: Optional[float] = None
+    availability: Optional[float] = None
+    efficiency: Optional[float] = None
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> Optional["TypedTimeRange"]:
+        if raw is None:
+            return None
+        return cls(
+            raw=raw,
+            calendar_time=parse_datetime_range(_get(raw, "calendar_time")),
+            missing_data_time=parse_float(_get(raw, "missing_data_time")),
+            valid_time=parse_float(_get(raw, "valid_time")),
+            excluded_time=parse_float(_get(raw, "excluded_time")),
+            reference_run_time=parse_float(_get(raw, "reference_run_time")),
+            theo_production_run_time=parse_float(_get(raw, "theo_production_run_time")),
+            pr=parse_percent(_get(raw, "pr")),
+            uptime=parse_percent(_get(raw, "uptime")),
+            mtbf=parse_float(_get(raw, "mtbf")),
+            mttr=parse_float(_get(raw, "mttr")),
+            net_production=parse_count(_get(raw, "net_production")),
+            theo_production_target_speed=parse_count(
+                _get(raw, "theo_production_target_speed")
+            ),
+            theo_production_design_speed=parse_count(
+                _get(raw, "theo_production_design_speed")
+            ),
+            availability=parse_percent(_get(raw, "availability")),
+            efficiency=parse_percent(_get(raw, "efficiency")),
+        )
+
+
+@dataclass(slots=True)
+class TypedLinePerformance(_Typed):
+    line_failure: Optional[int] = None
+    run_time: Optional[float] = None
+    line_mtbf: Optional[float] = None
+    reject: Optional[float] = None
+    total_reject: Optional[float] = None
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> Optional["TypedLinePerformance"]:
+        if raw is None:
+            return None
+        return cls(
+            raw=raw,
+            line_failure=parse_int(_get(raw, "line_failure")),
+            run_time=parse_float(_get(raw, "run_time")),
+            line_mtbf=parse_float(_get(raw, "line_mtbf")),
+            reject=parse_percent(_get(raw, "reject")),
+            total_reject=parse_count(_get(raw, "total_reject")),
+        )
+
+
+@dataclass(slots=True)
+class TypedLosses(_Typed):
+    stops: Optional[int] = None
+    downtime: Optional[float] = None
+    uptime_loss: Optional[float] = None
+    mtbf: Optional[float] = None
+    mttr: Optional[float] = None
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> Optional["TypedLosses"]:
+        if raw is None:
+            return None
+        return cls(
+            raw=raw,
+            stops=parse_int(_get(raw, "stops")),
+            downtime=parse_float(_get(raw, "downtime")),
+            uptime_loss=parse_percent(_get(raw, "uptime_loss")),
+            mtbf=parse_float(_get(raw, "mtbf")),
+            mttr=parse_float(_get(raw, "mttr")),
+        )
+
+
+@dataclass(slots=True)
+class TypedUPDT(_Typed):
+    category: Optional[str] = None
+    losses: Optional[TypedLosses] = None
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "TypedUPDT":
+        return cls(
+            raw=raw,
+            category=intern_text(_get(raw, "category")),
+            losses=TypedLosses.from_raw(_get(raw, "losses")),
+        )
+
+
+@dataclass(slots=True)
+class TypedStopReason(_Typed):
+    """A planned or unplanned stop reason of the loss tree."""
+
+    description: Optional[str] = None
+    stops: Optional[int] = None
+    downtime: Optional[float] = None
+    uptime_loss: Optional[float] = None
+    mtbf: Optional[float] = None
+    mttr: Optional[float] = None
+    rejects_percent: Optional[float] = None
+    causing_equipment: Optional[str] = None
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "TypedStopReason":
+        return cls(
+            raw=raw,
+            description=intern_text(_get(raw, "description")),
+            stops=parse_int(_get(raw, "stops")),
+            downtime=parse_float(_get(raw, "downtime")),
+            uptime_loss=parse_percent(_get(raw, "uptime_loss")),
+            mtbf=parse_float(_get(raw, "mtbf")),
+            mttr=parse_float(_get(raw, "mttr")),
+            rejects_percent=parse_percent(_get(raw, "rejects_percent")),
+            causing_equipment=intern_text(_get(raw, "causing_equipment")),
+        )
+
+
+@dataclass(slots=True)
+class TypedPlanned(_Typed):
+    pdt: Optional[TypedLosses] = None
+    pdt_reason: List[TypedStopReason] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> Optional["TypedPlanned"]:
+        if raw is None:
+            return None
+        return cls(
+            raw=raw,
+            pdt=TypedLosses.from_raw(_get(raw, "pdt")),
+            pdt_reason=[
+                TypedStopReason.from_raw(r) for r in _get(raw, "pdt_reason") or []
+            ],
+        )
+
+
+@dataclass(slots=True)
+class TypedUnplanned(_Typed):
+    updt: Optional[TypedLosses] = None
+    updt_shift: List[TypedUPDT] = field(default_factory=list)
+    updt_category: List[TypedUPDT] = field(default_factory=list)
+    bde: List[TypedUPDT] = field(default_factory=list)
+    pf: List[TypedUPDT] = field(default_factory=list)
+    updt_reason: List[TypedStopReason] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> Optional["TypedUnplanned"]:
+        if raw is None:
+            return None
+
+        def updts(name: str) -> List[TypedUPDT]:
+            return [TypedUPDT.from_raw(u) for u in _get(raw, name) or []]
+
+        return cls(
+            raw=raw,
+            updt=TypedLosses.from_raw(_get(raw, "updt")),
+            updt_shift=updts("updt_shift"),
+            updt_category=updts("updt_category"),
+            bde=updts("bde"),
+            pf=updts("pf"),
+            updt_reason=[
+                TypedStopReason.from_raw(r) for r in _get(raw, "updt_reason") or []
+            ],
+        )
+
+
+@dataclass(slots=True)
+class TypedLossTree(_Typed):
+    equipment: Optional[str] = None
+    period: Optional[str] = None
+    date: Optional[date] = None
+    shift: Optional[int] = None
+    time_range: Optional[TypedTimeRange] = None
+    line_performance: Optional[TypedLinePerformance] = None
+    rate_loss: Dict[str, TypedLosses] = field(default_factory=dict)
+    reject_loss: Optional[TypedLosses] = None
+    planned: Optional[TypedPlanned] = None
+    unplanned: Optional[TypedUnplanned] = None
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "TypedLossTree":
+        period = _get(raw, "period")
+        date_shift = parse_period(period)
+        rate_loss = _get(raw, "rate_loss")
+        return cls(
+            raw=raw,
+            equipment=_get(raw, "equipment"),
+            period=period,
+            date=date_shift[0] if date_shift else None,
+            shift=date_shift[1] if date_shift else None,
+            time_range=TypedTimeRange.from_raw(_get(raw, "time_range")),
+            line_performance=TypedLinePerformance.from_raw(
+                _get(raw, "line_performance")
+            ),
+            rate_loss={
+                name: losses
+                for name in ("dsl", "trl", "natr", "ramp_up_down")
+                if (losses := TypedLosses.from_raw(_get(rate_loss, name)))
+            },
+            reject_loss=TypedLosses.from_raw(
+                _get(_get(raw, "quality_loss"), "reject_loss")
+            ),
+            planned=TypedPlanned.from_raw(_get(raw, "planned")),
+            unplanned=TypedUnplanned.from_raw(_get(raw, "unplanned")),
+        )
+
+
+@dataclass(slots=True)
+class TypedEquipmentStop(_Typed):
+    """A stop reason of the period equipment page."""
+
+    description: Optional[str] = None
+    stops: Optional[int] = None
+    downtime_min: Optional[float] = None
+    oee_percent: Optional[float] = None
+    rejects_percent: Optional[float] = None
+    stops_per_shift: List[Optional[int]] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "TypedEquipmentStop":
+        return cls(
+            raw=raw,
+            description=intern_text(_get(raw, "description")),
+            stops=parse_int(_get(raw, "stops")),
+            downtime_min=parse_float(_get(raw, "downtime_min")),
+            oee_percent=parse_percent(_get(raw, "oee_percent")),
+            rejects_percent=parse_percent(_get(raw, "rejects_percent")),
+            stops_per_shift=[parse_int(s) for s in _get(raw, "stops_per_shift") or []],
+        )
+
+
+@dataclass(slots=True)
+class TypedMachine(_Typed):
+    id: Optional[str] = None
+    machine_type: Optional[str] = None
+    total_downtime_min: Optional[float] = None
+    total_stops: Optional[int] = None
+    total_run_time_min: Optional[float] = None
+    avg_speed_cig_per_min: Optional[float] = None
+    production_mio_cig: Optional[float] = None
+    total_rejects_percent: Optional[float] = None
+    mtbf_min: Optional[float] = None
+    mttr_min: Optional[float] = None
+    stop_reasons: List[TypedEquipmentStop] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "TypedMachine":
+        return cls(
+            raw=raw,
+            id=_get(raw, "id"),
+            machine_type=intern_text(_get(raw, "machine_type")),
+            total_downtime_min=parse_float(_get(raw, "total_downtime_min")),
+            total_stops=parse_int(_get(raw, "total_stops")),
+            total_run_time_min=parse_float(_get(raw, "total_run_time_min")),
+            avg_speed_cig_per_min=parse_float(_get(raw, "avg_speed_cig_per_min")),
+            production_mio_cig=parse_float(_get(raw, "production_mio_cig")),
+            total_rejects_percent=parse_percent(_get(raw, "total_rejects_percent")),
+            mtbf_min=parse_float(_get(raw, "mtbf_min")),
+            mttr_min=parse_float(_get(raw, "mttr_min")),
+            stop_reasons=[
+                TypedEquipmentStop.from_raw(r) for r in _get(raw, "stop_reasons") or []
+            ],
+        )
+
+
+@dataclass(slots=True)
+class TypedStopStatistics(_Typed):
+    factory: Optional[str] = None
+    line: Optional[str] = None
+    design_speed: Optional[float] = None
+    target_speed: Optional[float] = None
+    time_period: Optional[DateTimeRange] = None
+    machines: List[TypedMachine] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "TypedStopStatistics":
+        return cls(
+            raw=raw,
+            factory=_get(raw, "factory"),
+            line=_get(raw, "line"),
+            design_speed=parse_float(_get(raw, "design_speed")),
+            target_speed=parse_float(_get(raw, "target_speed")),
+            time_period=parse_datetime_range(_get(raw, "time_period")),
+            machines=[TypedMachine.from_raw(m) for m in _get(raw, "machines") or []],
+        )
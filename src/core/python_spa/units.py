@@ -0,0 +1,82 @@
+import re
+from datetime import date, datetime
+from typing import NamedTuple, Optional, Tuple
+
+# Multipliers used by SPA for production and reject counts ("62.39 k cig.")
+UNIT_MULTIPLIERS = {
+    "": 1.0,
+    "k": 1e3,
+    "m": 1e6,
+    "mio": 1e6,
+}
+
+_NUMBER = re.compile(r"^\s*([-+]?\d+(?:\.\d+)?)")
+_COUNT = re.compile(
+    r"^\s*([-+]?\d+(?:\.\d+)?)\s*(k|m|mio)?\b\.?\s*(.*)$", re.IGNORECASE
+)
+_DATETIME_RANGE = re.compile(
+    r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2})\s*to\s*(\d{4}-\d{2}-\d{2} \d{2}:\d{2})"
+)
+_PERIOD = re.compile(r"(\d{4}-\d{2}-\d{2})\s+shift\s+(\d+)", re.IGNORECASE)
+
+
+class DateTimeRange(NamedTuple):
+    start: datetime
+    end: datetime
+
+    @property
+    def minutes(self) -> float:
+        return (self.end - self.start).total_seconds() / 60
+
+
+def parse_float(text: Optional[str]) -> Optional[float]:
+    """Parse the leading number of an SPA cell ("89.7%", "9.63", "-"). None if absent."""
+    if text is None:
+        return None
+    match = _NUMBER.match(str(text))
+    if not match:
+        return None
+    return float(match.group(1))
+
+
+def parse_int(text: Optional[str]) -> Optional[int]:
+    """Parse a stop count; SPA sometimes renders counts as "0.0"."""
+    value = parse_float(text)
+    return None if value is None else int(round(value))
+
+
+def parse_percent(text: Optional[str]) -> Optional[float]:
+    """Parse "89.7%" or "89.7" to 89.7 (percentage points, not a fraction)."""
+    return parse_float(text)
+
+
+def parse_count(text: Optional[str]) -> Optional[float]:
+    """Parse a count with an optional unit multiplier, e.g. "62.39 k cig." -> 62390.0."""
+    if text is None:
+        return None
+    match = _COUNT.match(str(text))
+    if not match:
+        return None
+    multiplier = UNIT_MULTIPLIERS[(match.group(2) or "").lower()]
+    return float(match.group(1)) * multiplier
+
+
+def parse_datetime_range(text: Optional[str]) -> Optional[DateTimeRange]:
+    """Parse "2025-07-13 14:00 to 2025-07-13 18:48" into a DateTimeRange."""
+    if not text:
+        return None
+    match = _DATETIME_RANGE.search(text)
+    if not match:
+        return None
+    start, end = (datetime.strptime(s, "%Y-%m-%d %H:%M") for s in match.groups())
+    return DateTimeRange(start, end)
+
+
+def parse_period(text: Optional[str]) -> Optional[Tuple[date, int]]:
+    """Parse "2025-07-13 shift 2" into ``(date, shift)``."""
+    if not text:
+        return None
+    match = _PERIOD.search(text)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), "%Y-%m-%d").date(), int(match.group(2))
@@ -1,8 +1,10 @@
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
 
 from bs4 import BeautifulSoup, Tag
 
+from .rows import SECTIONS
 from .spa_struct import UPDT, Losses, Unplanned, UnplannedStopReason
+from .vocabulary import intern_text
 
 
 def extract_unplanned_downtime(html: str) -> Unplanned:
@@ -32,30 +34,30 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
     bde: List[UPDT] = []
     pf: List[UPDT] = []
     updt_reason: List[UnplannedStopReason] = []
+    # Cells, their texts and section keywords of every row, computed once
+    cells: List[List[Tag]] = [row.select("td") for row in trs]
+    texts: List[List[str]] = [[td.get_text(strip=True) for td in tds] for tds in cells]
+    keywords = SECTIONS.classify_page(texts)
 
     # Helper to find start/end indices
     def find_range(
         keyword_start: Optional[str],
         keyword_end: Optional[str],
         min_len: int = 0,
-        class_check: Optional[Callable[[List[Tag], List[str]], bool]] = None,
+        class_check: Optional[
+            Callable[[List[Tag], List[str], FrozenSet[str]], bool]
+        ] = None,
     ) -> Tuple[int, int]:
         start: Optional[int] = None
         end: Optional[int] = None
-        for i, row in enumerate(trs):
-            tds: List[Tag] = row.select("td")
-            td_texts: List[str] = [td.get_text(strip=True) for td in tds]
+        for i, (tds, td_texts, found) in enumerate(zip(cells, texts, keywords)):
             if start is None:
                 if class_check:
-                    if class_check(tds, td_texts):
+                    if class_check(tds, td_texts, found):
                         start = i
-                elif keyword_start and any(keyword_start in text for text in td_texts):
+                elif keyword_start and keyword_start in found:
                     start = i + 1
-            elif (
-                end is None
-                and keyword_end
-                and any(keyword_end in text for text in td_texts)
-            ):
+            elif end is None and keyword_end and keyword_end in found:
                 end = i
                 break
         if start is None:
@@ -65,10 +67,8 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
         return start, end
 
     # Extract updt
-    for row in trs:
-        tds: List[Tag] = row.select("td")
-        if len(tds) >= 11:
-            td_texts: List[str] = [td.get_text(strip=True) for td in tds]
+    for td_texts in texts:
+        if len(td_texts) >= 11:
             if "Unplanned downtime" in td_texts:
                 updt.stops = td_texts[4]
                 updt.downtime = td_texts[6]
@@ -78,7 +78,9 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
                 break
 
     # updt_shift
-    def shift_class_check(tds: List[Tag], td_texts: List[str]) -> bool:
+    def shift_class_check(
+        tds: List[Tag], td_texts: List[str], found: FrozenSet[str]
+    ) -> bool:
         return any("shift" in text.lower() for text in td_texts) and any(
             "doctext" in (td.get("class") or []) for td in tds
         )
@@ -87,12 +89,11 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
         None, "Unplanned downtime per Category", class_check=shift_class_check
     )
     for i in range(start, end):
-        tds: List[Tag] = trs[i].select("td")
-        if len(tds) >= 11:
-            td_texts: List[str] = [td.get_text(strip=True) for td in tds]
+        td_texts: List[str] = texts[i]
+        if len(td_texts) >= 11:
             updt_shift.append(
                 UPDT(
-                    category=td_texts[3],
+                    category=intern_text(td_texts[3]),
                     losses=Losses(
                         stops=td_texts[4],
                         downtime=td_texts[6],
@@ -108,12 +109,11 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
         "Unplanned downtime per Category", "Breakdown & Process Failures"
     )
     for i in range(start, end):
-        tds: List[Tag] = trs[i].select("td")
-        if len(tds) >= 11:
-            td_texts: List[str] = [td.get_text(strip=True) for td in tds]
+        td_texts: List[str] = texts[i]
+        if len(td_texts) >= 11:
             updt_category.append(
                 UPDT(
-                    category=td_texts[3],
+                    category=intern_text(td_texts[3]),
                     losses=Losses(
                         stops=td_texts[4],
                         downtime=td_texts[6],
@@ -125,18 +125,19 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
             )
 
     # bde
-    def bde_start_check(tds: List[Tag], td_texts: List[str]) -> bool:
+    def bde_start_check(
+        tds: List[Tag], td_texts: List[str], found: FrozenSet[str]
+    ) -> bool:
         return len(tds) >= 4 and "Breakdown" in td_texts
 
     start, end = find_range(None, "Process failures", class_check=bde_start_check)
     for i in range(start, end):
-        tds: List[Tag] = trs[i].select("td")
-        if len(tds) >= 14:
-            td_texts: List[str] = [td.get_text(strip=True) for td in tds]
+        td_texts: List[str] = texts[i]
+        if len(td_texts) >= 14:
             category: str = td_texts[3][:-5] if len(td_texts[3]) >= 5 else td_texts[3]
             bde.append(
                 UPDT(
-                    category=category,
+                    category=intern_text(category),
                     losses=Losses(
                         time=td_texts[5],
                         stops=td_texts[6],
@@ -150,22 +151,23 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
             )
 
     # pf
-    def pf_start_check(tds: List[Tag], td_texts: List[str]) -> bool:
-        return len(tds) >= 4 and any("Process failures" in text for text in td_texts)
+    def pf_start_check(
+        tds: List[Tag], td_texts: List[str], found: FrozenSet[str]
+    ) -> bool:
+        return len(tds) >= 4 and "Process failures" in found
 
     start, end = find_range(None, "Low volume events", class_check=pf_start_check)
     temp_categories: List[str] = []
     for i in range(start, end):
-        tds: List[Tag] = trs[i].select("td")
-        if len(tds) >= 14:
-            td_texts: List[str] = [td.get_text(strip=True) for td in tds]
+        td_texts: List[str] = texts[i]
+        if len(td_texts) >= 14:
             category: str = td_texts[3][:-6] if len(td_texts[3]) >= 6 else td_texts[3]
             if not category and temp_categories:
                 category = temp_categories[-1]
             temp_categories.append(category)
             pf.append(
                 UPDT(
-                    category=category,
+                    category=intern_text(category),
                     losses=Losses(
                         time=td_texts[5],
                         stops=td_texts[6],
@@ -182,27 +184,22 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
     index: int = next(
         (
             i + 1
-            for i, row in enumerate(trs)
-            if any(
-                "Unplanned machine stop reasons" in td.get_text(strip=True)
-                for td in row.select("td")
-            )
+            for i, found in enumerate(keywords)
+            if "Unplanned machine stop reasons" in found
         ),
         0,
     )
     for i in range(index, len(trs)):
-        row: Tag = trs[i]
-        tds: List[Tag] = row.select("td")
-        if not tds or len(tds) < 16:
+        td_texts: List[str] = texts[i]
+        if not td_texts or len(td_texts) < 16:
             continue
-        td_texts: List[str] = [td.get_text(strip=True) for td in tds]
         if "Unplanned downtime" in td_texts:
             break
         if "Unplanned machine stop reasons" in td_texts:
             continue
         updt_reason.append(
             UnplannedStopReason(
-                description=td_texts[3],
+                description=intern_text(td_texts[3]),
                 stops=td_texts[4],
                 ramp_up=td_texts[5],
                 downtime=td_texts[6],
@@ -211,7 +208,7 @@ def extract_unplanned_downtime(html: str) -> Unplanned:
                 mttr=td_texts[10],
                 rejects_percent=td_texts[11],
                 stops_per_shift=td_texts[12],
-                causing_equipment=td_texts[15],
+                causing_equipment=intern_text(td_texts[15]),
             )
         )
 
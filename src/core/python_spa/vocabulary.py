@@ -0,0 +1,70 @@
+"""
+One shared vocabulary for the text cells that repeat on every page.
+
+Stop descriptions, machine types, categories and causing equipment are the
+same few thousand strings across machines, shifts and days. The extractors
+pass them through ``intern_text`` so every result holds the same string
+object instead of a fresh copy, which also lets dict lookups and equality
+checks stop at the identity test. Stores that keep many results (the pareto
+frames, the SQLite history) keep ``code`` integers and the labels instead.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class Vocabulary:
+    """Append-only mapping between strings and dense int codes."""
+
+    __slots__ = ("labels", "_codes", "_lock")
+
+    def __init__(self, labels: Iterable[str] = ()) -> None:
+        self.labels: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for label in labels:
+            self.code(label)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __contains__(self, text: object) -> bool:
+        return text in self._codes
+
+    def code(self, text: str) -> int:
+        """Code of ``text``, added to the vocabulary when new."""
+        code = self._codes.get(text)
+        if code is None:
+            # Parser threads may add the same new label at once
+            with self._lock:
+                code = self._codes.get(text)
+                if code is None:
+                    # Label first: lock-free readers may use the code at once
+                    code = len(self.labels)
+                    self.labels.append(text)
+                    self._codes[text] = code
+        return code
+
+    def intern(self, text: str) -> str:
+        """The vocabulary's own copy of ``text``."""
+        return self.labels[self.code(text)]
+
+    def label(self, code: int) -> str:
+        return self.labels[code]
+
+    def encode(self, texts: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self.code(text) for text in texts), dtype=np.int32)
+
+    def decode(self, codes: Iterable[int]) -> List[str]:
+        labels = self.labels
+        return [labels[code] for code in codes]
+
+
+VOCABULARY = Vocabulary()
+
+
+def intern_text(text: Optional[str]) -> Optional[str]:
+    """``text`` from the shared vocabulary; empty and None pass through."""
+    return VOCABULARY.intern(text) if text else text
@@ -0,0 +1,53 @@
+from typing import Any, Mapping, Optional, Sequence
+
+from tabulate import tabulate
+
+from src.core.evaluation import evaluate
+
+
+def report_title(func_location: str, link_up: str) -> str:
+    """Heading of a result block, e.g. "P_18" for PACKER on LU18."""
+    return f"{func_location[0]}_{link_up[-2:]}"
+
+
+def format_result(
+    title: str,
+    actual: Mapping[str, Any],
+    targets: Optional[Mapping[str, Any]],
+) -> str:
+    """
+    Target vs actual block of the report.
+
+    Each line is wrapped in backticks so it stays monospaced when the report
+    is pasted into a chat.
+    """
+    scorecard = evaluate([targets or {}], [actual])
+    txt = tabulate(
+        scorecard.rows(0, actual_labels=actual),
+        tablefmt="pretty",
+        headers=[title, "TARGET", "ACTUAL", ""],
+        numalign="left",
+        stralign="left",
+    )
+    return "`" + txt.replace("\n", "`\n`") + "`\n\n"
+
+
+def format_stop_table(df) -> str:
+    """Stop reasons of the period equipment page as a plain-text table."""
+    return tabulate(
+        df.values.tolist(),
+        headers=df.columns.to_list(),
+        tablefmt="simple",
+        floatfmt="g",
+    )
+
+
+def format_delta_table(table, metrics: Optional[Sequence[str]] = None) -> str:
+    """Biggest movers between two results, from ``stop_deltas``."""
+    metrics = metrics or ("stops", "downtime", "uptime_loss")
+    return tabulate(
+        table.rows(metrics),
+        headers=table.headers(metrics),
+        tablefmt="simple",
+        floatfmt=("g", "g", *("g", "g", "+g") * len(metrics)),
+    )
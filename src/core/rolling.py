@@ -0,0 +1,220 @@
+"""
+Rolling-window KPIs over per-shift results.
+
+Each shift is reduced to additive totals (times, stops, downtimes), and every
+window keeps the running sum of the shifts inside it. Adding a shift adds
+its totals and subtracts those of the shifts that fell out of the window, so
+the cost per shift does not depend on the window length. The KPIs are
+ratios of the sums, which weighs every shift by its time exactly as SPA does
+for a longer period.
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.python_spa.typed_struct import TypedLossTree
+from src.utils.csvhandle import parse_target_value
+
+KPIS = ("PR", "MTBF", "MTTR", "UPDT", "PDT", "NATR")
+# Additive totals of one shift, in this order
+TOTALS = (
+    "valid_time",
+    "reference_run_time",
+    "pr_time",
+    "stops",
+    "updt_downtime",
+    "pdt_downtime",
+    "natr_downtime",
+)
+_VALID, _REFERENCE, _PR, _STOPS, _UPDT, _PDT, _NATR = range(len(TOTALS))
+
+
+def _value(value: Any) -> float:
+    if value is None or value == "":
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    parsed = parse_target_value(value)
+    return 0.0 if parsed != parsed else parsed
+
+
+@dataclass(slots=True)
+class ShiftSample:
+    """Additive totals of one shift; times are in minutes."""
+
+    start: datetime
+    totals: np.ndarray
+
+    @classmethod
+    def from_tree(
+        cls, tree: TypedLossTree, start: Optional[datetime] = None
+    ) -> "ShiftSample":
+        """Totals of a typed loss tree; ``start`` defaults to its calendar time."""
+        time_range = tree.time_range
+        if start is None:
+            if time_range is None or time_range.calendar_time is None:
+                raise ValueError(f"loss tree {tree.period!r} has no calendar time")
+            start = time_range.calendar_time.start
+        valid = (time_range.valid_time or 0.0) if time_range else 0.0
+        natr = tree.rate_loss.get("natr")
+        pdt = tree.planned.pdt if tree.planned else None
+        updt = tree.unplanned.updt if tree.unplanned else None
+        totals = np.array(
+            [
+                valid,
+                (time_range.reference_run_time or 0.0) if time_range else 0.0,
+                (time_range.pr or 0.0) * valid / 100 if time_range else 0.0,
+                (updt.stops or 0) if updt else 0,
+                (updt.downtime or 0.0) if updt else 0.0,
+                (pdt.downtime or 0.0) if pdt else 0.0,
+                (natr.downtime or 0.0) if natr else 0.0,
+            ],
+            dtype=np.float64,
+        )
+        return cls(start, totals)
+
+    @classmethod
+    def from_actual(
+        cls,
+        start: datetime,
+        actual: Mapping[str, Any],
+        valid_time: float,
+        reference_run_time: Optional[float] = None,
+    ) -> "ShiftSample":
+        """
+        Totals recovered from the actual KPIs of ``parse_loss_tree``.
+
+        Percentages are turned back into minutes of ``valid_time``. The run
+        time behind MTBF is MTBF x stops; a shift without stops needs its
+        ``reference_run_time``, otherwise it adds no run time.
+        """
+        stops = _value(actual.get("STOP"))
+        if reference_run_time is None:
+            reference_run_time = _value(actual.get("MTBF")) * stops
+        totals = np.array(
+            [
+                valid_time,
+                reference_run_time,
+                _value(actual.get("PR")) * valid_time / 100,
+                stops,
+                _value(actual.get("UPDT")) * valid_time / 100,
+                _value(actual.get("PDT")) * valid_time / 100,
+                _value(actual.get("NATR")) * valid_time / 100,
+            ],
+            dtype=np.float64,
+        )
+        return cls(start, totals)
+
+
+def kpis_of(totals: np.ndarray) -> Dict[str, float]:
+    """KPIs of summed shift totals; NaN where the denominator is zero."""
+    valid, stops = totals[_VALID], totals[_STOPS]
+
+    def ratio(numerator: float, denominator: float, scale: float = 1.0) -> float:
+        return float(numerator / denominator * scale) if denominator else float("nan")
+
+    return {
+        "PR": ratio(totals[_PR], valid, 100.0),
+        "MTBF": ratio(totals[_REFERENCE], stops),
+        "MTTR": ratio(totals[_UPDT], stops),
+        "UPDT": ratio(totals[_UPDT], valid, 100.0),
+        "PDT": ratio(totals[_PDT], valid, 100.0),
+        "NATR": ratio(totals[_NATR], valid, 100.0),
+    }
+
+
+class _Window:
+    __slots__ = ("length", "samples", "total")
+
+    def __init__(self, length: timedelta) -> None:
+        self.length = length
+        self.samples: Deque[ShiftSample] = deque()
+        self.total = np.zeros(len(TOTALS))
+
+    def add(self, sample: ShiftSample) -> None:
+        self.samples.append(sample)
+        self.total += sample.totals
+        cutoff = sample.start - self.length
+        while self.samples[0].start <= cutoff:
+            self.total -= self.samples.popleft().totals
+
+    def replace_last(self, sample: ShiftSample) -> None:
+        self.total += sample.totals - self.samples[-1].totals
+        self.samples[-1] = sample
+
+
+def parse_window(text: str) -> timedelta:
+    """Window length from e.g. "7d", "30d", "24h" or "3s" (three shifts)."""
+    match = re.fullmatch(r"\s*(\d+)\s*([dhs])\s*", text.lower())
+    if match is None or int(match.group(1)) == 0:
+        raise ValueError(f"window must look like 7d, 24h or 3s, not {text!r}")
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        return timedelta(days=count)
+    if unit == "h":
+        return timedelta(hours=count)
+    return count * timedelta(hours=8)
+
+
+class RollingKPIs:
+    """
+    KPIs of several trailing windows for many lines, updated per shift.
+
+    A window of length W ending at the latest shift of a line holds the
+    shifts that started less than W before it. Shifts of a line must be
+    added in order; adding the latest shift again (e.g. a refreshed running
+    shift) replaces it.
+    """
+
+    def __init__(self, windows: Sequence[timedelta]) -> None:
+        self.windows = tuple(windows)
+        self._lines: Dict[Hashable, Tuple[_Window, ...]] = {}
+
+    def add(self, line: Hashable, sample: ShiftSample) -> None:
+        windows = self._lines.get(line)
+        if windows is None:
+            windows = self._lines[line] = tuple(_Window(w) for w in self.windows)
+        last = windows[0].samples[-1] if windows[0].samples else None
+        if last is not None and sample.start < last.start:
+            raise ValueError(
+                f"{line}: shift at {sample.start} is older than {last.start}"
+            )
+        for window in windows:
+            if last is not None and sample.start == last.start:
+                window.replace_last(sample)
+            else:
+                window.add(sample)
+
+    def kpis(self, line: Hashable, window: timedelta) -> Dict[str, float]:
+        windows = self._lines.get(line)
+        if windows is None:
+            return kpis_of(np.zeros(len(TOTALS)))
+        return kpis_of(windows[self.windows.index(window)].total)
+
+    def shifts(self, line: Hashable, window: timedelta) -> int:
+        """Number of shifts currently in a line's window."""
+        windows = self._lines.get(line)
+        if windows is None:
+            return 0
+        return len(windows[self.windows.index(window)].samples)
+
+    @property
+    def lines(self) -> List[Hashable]:
+        return list(self._lines)
+
+    def table(self) -> List[List[Any]]:
+        """Rows of ``[line, window, shifts, *KPIS]`` for every line and window."""
+        rows = []
+        for line in self._lines:
+            for window in self.windows:
+                kpis = self.kpis(line, window)
+                rows.append(
+                    [line, window, self.shifts(line, window)]
+                    + [kpis[name] for name in KPIS]
+                )
+        return rows
@@ -0,0 +1,98 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Optional, Tuple
+
+from src.core.python_spa.units import (
+    DateTimeRange,
+    parse_datetime_range,
+    parse_period,
+)
+
+# Shift 1 starts at 06:00, shifts are 8 hours long (see db_ShiftStart/End)
+SHIFT_START = time(6, 0)
+SHIFT_LENGTH = timedelta(hours=8)
+SHIFT_COUNT = 3
+
+
+def shift_bounds(day: date, shift: int) -> DateTimeRange:
+    """Start and end of a shift; shift 3 runs past midnight."""
+    start = datetime.combine(day, SHIFT_START) + (int(shift) - 1) * SHIFT_LENGTH
+    return DateTimeRange(start, start + SHIFT_LENGTH)
+
+
+def current_shift(now: datetime) -> Tuple[date, int]:
+    """The production date and shift number running at ``now``."""
+    elapsed = now - datetime.combine(now.date(), SHIFT_START)
+    day = now.date()
+    if elapsed < timedelta(0):
+        # Before 06:00 is still shift 3 of the previous production day
+        day -= timedelta(days=1)
+        elapsed += timedelta(days=1)
+    return day, min(int(elapsed // SHIFT_LENGTH) + 1, SHIFT_COUNT)
+
+
+def shift_window(
+    calendar_time: Optional[str] = None, period: Optional[str] = None
+) -> Optional[DateTimeRange]:
+    """
+    Boundaries of the shift an SPA page covers.
+
+    ``period`` ("2025-07-13 shift 2") names the shift directly. A running
+    shift's ``calendar_time`` ends at the time of the request, so only its
+    start is used and the end is one shift length later.
+    """
+    date_shift = parse_period(period)
+    if date_shift is not None:
+        return shift_bounds(*date_shift)
+    calendar = parse_datetime_range(calendar_time)
+    if calendar is None:
+        return None
+    return DateTimeRange(calendar.start, calendar.start + SHIFT_LENGTH)
+
+
+def content_hash(*parts: Any) -> str:
+    """Digest of parsed page content, used to tell whether a refetch changed anything."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(repr(part).encode())
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class RefreshSchedule:
+    """
+    Refresh delays for monitoring one running shift.
+
+    Every fetch is reported to ``observe``. Changed content resets the delay
+    to ``interval``; unchanged content or a failed fetch multiplies it by
+    ``factor`` up to ``max_interval``. The last refresh lands on the shift
+    end, after which ``next_delay`` returns None.
+    """
+
+    window: DateTimeRange
+    interval: float = 60.0
+    max_interval: float = 600.0
+    factor: float = 2.0
+    delay: float = 0.0
+    digest: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.delay = self.interval
+
+    def observe(self, digest: Optional[str]) -> bool:
+        """Record a fetch (``None`` if it failed); True if the content changed."""
+        changed = digest is not None and digest != self.digest
+        if changed:
+            self.digest = digest
+            self.delay = self.interval
+        else:
+            self.delay = min(self.delay * self.factor, self.max_interval)
+        return changed
+
+    def next_delay(self, now: datetime) -> Optional[float]:
+        """Seconds until the next refresh, or None once the shift has ended."""
+        remaining = (self.window.end - now).total_seconds()
+        if remaining <= 0:
+            return None
+        return min(self.delay, remaining)
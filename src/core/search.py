@@ -0,0 +1,257 @@
+"""
+Full-text index over saved shift reports.
+
+Every save appends one JSON line (date, shift, line, user, report text and
+the stop descriptions of the table) to ``report_index.jsonl`` next to
+DB.xlsx, and adds the document to the in-memory inverted index. Opening the
+index replays the log; the first time it imports the Data sheet instead.
+
+Queries are words that must all occur, e.g. ``filter rod jam``. A word
+ending in ``*`` matches every word with that prefix, and a "quoted phrase"
+must occur as written.
+"""
+
+import json
+import re
+import sys
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_WORD = re.compile(r"[0-9a-z]+(?:[._][0-9a-z]+)*")
+_PHRASE = re.compile(r'"([^"]*)"')
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+@dataclass(slots=True)
+class ReportDoc:
+    date: str
+    shift: str
+    line: str
+    user: str
+    text: str
+    stops: List[str] = field(default_factory=list)
+    """Stop descriptions of the table shown when the report was saved."""
+
+    def snippet(self, terms: Iterable[str], width: int = 80) -> str:
+        """The first report or stop line that contains one of ``terms``."""
+        terms = [term.rstrip("*") for term in terms]
+        for line in [*self.text.splitlines(), *self.stops]:
+            lowered = line.lower()
+            if any(term in lowered for term in terms):
+                return line.strip("` ")[:width]
+        return ""
+
+
+@dataclass(slots=True)
+class SearchHit:
+    doc_id: int
+    doc: ReportDoc
+    snippet: str
+
+
+class ReportIndex:
+    """Inverted index of report words and of the date, shift, line and user."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.docs: List[ReportDoc] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self._fields: Dict[str, Dict[str, Set[int]]] = {
+            "date": {},
+            "shift": {},
+            "line": {},
+            "user": {},
+        }
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    @classmethod
+    def open(cls, path: Path, workbook: Optional[Path] = None) -> "ReportIndex":
+        """
+        Load the index log at ``path``.
+
+        Without a log, the reports already in ``workbook``'s Data sheet are
+        imported and written to a new log.
+        """
+        index = cls(path)
+        if index.path.exists():
+            index._replay()
+        elif workbook is not None and Path(workbook).exists():
+            try:
+                docs = read_workbook_reports(workbook)
+            except Exception as e:
+                # Retried on the next start, as no log has been written
+                print(
+                    f"warning: reports of {workbook} not indexed: {e}", file=sys.stderr
+                )
+                docs = []
+            for doc in docs:
+                index.add(doc)
+        return index
+
+    def _replay(self) -> None:
+        """Index the documents of the log, skipping lines that do not parse."""
+        skipped = 0
+        last = ""
+        with open(self.path, encoding="utf-8", errors="replace") as f:
+            for last in f:
+                if not last.strip():
+                    continue
+                try:
+                    doc = ReportDoc(**json.loads(last))
+                except (ValueError, TypeError):
+                    # A line cut short by a crash, or from another version
+                    skipped += 1
+                    continue
+                self._add(doc)
+        if skipped:
+            print(
+                f"warning: {skipped} unreadable lines skipped in {self.path}",
+                file=sys.stderr,
+            )
+        if last and not last.endswith("\n"):
+            # Keep the next appended document off the partial line
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n")
+
+    def add(self, doc: ReportDoc) -> int:
+        """Index ``doc`` and append it to the log; returns its id."""
+        if self.path is not None:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(doc), ensure_ascii=False) + "\n")
+        return self._add(doc)
+
+    def _add(self, doc: ReportDoc) -> int:
+        doc_id = len(self.docs)
+        self.docs.append(doc)
+        words = set(tokenize(doc.text))
+        for stop in doc.stops:
+            words.update(tokenize(stop))
+        for word in words:
+            postings = self._postings.get(word)
+            if postings is None:
+                self._postings[word] = [doc_id]
+                self._vocabulary_dirty = True
+            else:
+                postings.append(doc_id)
+        for name, values in self._fields.items():
+            values.setdefault(normalize_field(name, getattr(doc, name)), set()).add(
+                doc_id
+            )
+        return doc_id
+
+    def _prefixed(self, prefix: str) -> Set[int]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        ids: Set[int] = set()
+        i = bisect_left(self._vocabulary, prefix)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(prefix):
+            ids.update(self._postings[self._vocabulary[i]])
+            i += 1
+        return ids
+
+    def search(
+        self,
+        query: str,
+        line: Optional[str] = None,
+        shift: Optional[str] = None,
+        user: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[SearchHit]:
+        """
+        Reports matching every word of ``query`` and the given fields.
+
+        Dates are "YYYY-MM-DD" and inclusive. Hits are newest saved first.
+        """
+        phrases = [phrase.lower() for phrase in _PHRASE.findall(query)]
+        words = tokenize(_PHRASE.sub(" ", query))
+        for phrase in phrases:
+            words += tokenize(phrase)
+        terms = list(dict.fromkeys(words))
+        prefixes = [
+            word for word in re.findall(r"(\S+)\*", query.lower()) if tokenize(word)
+        ]
+
+        candidates: List[Set[int]] = []
+        for term in terms:
+            if term in prefixes:
+                candidates.append(self._prefixed(term))
+            else:
+                candidates.append(set(self._postings.get(term, ())))
+        for name, value in (("line", line), ("shift", shift), ("user", user)):
+            if value:
+                candidates.append(
+                    self._fields[name].get(normalize_field(name, value), set())
+                )
+        if date_from or date_to:
+            candidates.append(
+                {
+                    doc_id
+                    for day, ids in self._fields["date"].items()
+                    if (not date_from or day >= date_from)
+                    and (not date_to or day <= date_to)
+                    for doc_id in ids
+                }
+            )
+        if not candidates:
+            ids: Iterable[int] = range(len(self.docs))
+        else:
+            candidates.sort(key=len)
+            ids = set(candidates[0]).intersection(*candidates[1:])
+
+        hits = []
+        for doc_id in sorted(ids, reverse=True):
+            doc = self.docs[doc_id]
+            if phrases:
+                text = "\n".join([doc.text, *doc.stops]).lower()
+                if not all(phrase in text for phrase in phrases):
+                    continue
+            hits.append(SearchHit(doc_id, doc, doc.snippet(terms)))
+            if len(hits) >= limit:
+                break
+        return hits
+
+
+def normalize_field(name: str, value: object) -> str:
+    """Field values as stored: "LU18" -> "18", "Shift 2" -> "2"."""
+    text = str(value or "").strip()
+    if name == "line":
+        return text.upper().removeprefix("LU")
+    if name == "shift":
+        return text.removeprefix("Shift ").strip()
+    if name == "user":
+        return text.lower()
+    return text[:10]
+
+
+def read_workbook_reports(workbook: Path) -> List[ReportDoc]:
+    """Reports of the DB.xlsx Data sheet (No, date, shift, line, user, text)."""
+    import openpyxl
+
+    wb = openpyxl.load_workbook(workbook, read_only=True)
+    try:
+        rows: Iterable[Tuple] = wb["Data"].iter_rows(min_row=2, values_only=True)
+        return [
+            ReportDoc(
+                date=str(row[1] or "")[:10],
+                shift=str(row[2] or ""),
+                line=str(row[3] or ""),
+                user=str(row[4] or ""),
+                text=str(row[5] or ""),
+            )
+            for row in rows
+            if len(row) >= 6 and row[5]
+        ]
+    finally:
+        wb.close()
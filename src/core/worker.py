@@ -0,0 +1,96 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class Superseded(Exception):
+    """Raised when a newer request for the same key replaced this one."""
+
+
+class ParseWorker:
+    """
+    Runs HTML parsing in an executor so the Tk event loop stays responsive.
+
+    Work is grouped by key (e.g. "equipment" or "result"). Claiming a key
+    cancels the task that claimed it before, and a parse result that arrives
+    after a newer request for the same key is discarded with ``Superseded``.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: int = 2,
+        use_processes: bool = False,
+    ) -> None:
+        self._executor = executor
+        self._max_workers = max_workers
+        self._use_processes = use_processes
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._generation: Dict[Hashable, int] = {}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            pool = ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor
+            self._executor = pool(max_workers=self._max_workers)
+        return self._executor
+
+    def claim(self, key: Hashable) -> int:
+        """Make the current task the owner of ``key``, cancelling the previous one."""
+        current = asyncio.current_task()
+        previous = self._tasks.get(key)
+        if previous is not None and previous is not current and not previous.done():
+            previous.cancel()
+        self._tasks[key] = current
+        generation = self._generation.get(key, 0) + 1
+        self._generation[key] = generation
+        return generation
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Cancel the owner of ``key`` and discard its pending results.
+
+        Unlike ``claim`` it records no new owner, so it is safe to call from
+        synchronous Tk callbacks, where the current task is the main loop.
+        """
+        previous = self._tasks.pop(key, None)
+        if previous is not None and previous is not asyncio.current_task():
+            if not previous.done():
+                previous.cancel()
+        self._generation[key] = self._generation.get(key, 0) + 1
+
+    def is_current(self, key: Hashable, generation: int) -> bool:
+        return self._generation.get(key, 0) == generation
+
+    async def run(
+        self,
+        key: Hashable,
+        func: Callable[..., Any],
+        *args: Any,
+        generation: Optional[int] = None,
+    ) -> Any:
+        """
+        Run ``func(*args)`` in the executor and return its result
+
+        Raises:
+            Superseded: If a newer request claimed ``key`` while parsing
+        """
+        if generation is None:
+            generation = self._generation.get(key, 0)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, partial(func, *args))
+        if not self.is_current(key, generation):
+            raise Superseded(key)
+        return result
+
+    def shutdown(self) -> None:
+        for task in self._tasks.values():
+            if task is not None and not task.done():
+                task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+PARSE_WORKER = ParseWorker()
@@ -0,0 +1,156 @@
+import asyncio
+from typing import Callable, Dict, List, Tuple
+
+import ttkbootstrap as ttk
+from async_tkinter_loop import async_handler
+from ttkbootstrap.constants import *
+
+from src.gui.toast import create_toast
+from src.utils.constants import FUNCTIONAL_LOCATIONS, TARGET_KPIS
+
+TILE_COLUMNS = 4
+
+
+class KpiTile(ttk.Labelframe):
+    """Target vs actual of one line and functional location."""
+
+    def __init__(self, master, title: str) -> None:
+        super().__init__(master, text=title, padding=(10, 5), bootstyle=SUCCESS)
+        self.status = ttk.Label(self, text="", bootstyle=SECONDARY)
+        self.status.grid(row=0, column=0, columnspan=4, sticky=W)
+
+        for col, text in enumerate(["", "TARGET", "ACTUAL", ""]):
+            ttk.Label(self, text=text, font=("Consolas", 9, "bold")).grid(
+                row=1, column=col, sticky=W, padx=(0, 8)
+            )
+
+        self.cells: Dict[str, List[ttk.Label]] = {}
+        for row, kpi in enumerate(TARGET_KPIS, start=2):
+            labels = [
+                ttk.Label(self, text=text, font=("Consolas", 9))
+                for text in (kpi, "", "", "")
+            ]
+            for col, label in enumerate(labels):
+                label.grid(row=row, column=col, sticky=W, padx=(0, 8))
+            self.cells[kpi] = labels
+
+    def set_status(self, text: str, bootstyle: str = SECONDARY) -> None:
+        self.status.configure(text=text, bootstyle=bootstyle)
+
+    def show_rows(self, rows: List[List[str]]) -> None:
+        """Rows of ``[KPI, TARGET, ACTUAL, flag]`` as built by ``Scorecard.rows``."""
+        for kpi, target, actual, flag in rows:
+            labels = self.cells.get(kpi)
+            if labels:
+                labels[1].configure(text=target)
+                labels[2].configure(text=actual)
+                labels[3].configure(text=flag)
+
+
+class Dashboard(ttk.Toplevel):
+    """
+    Plant-wide grid of loss-tree KPIs against targets.
+
+    Every (line, functional location) is fetched concurrently and each tile
+    is updated as soon as its own result arrives.
+    """
+
+    def __init__(
+        self,
+        master,
+        link_ups: List[str],
+        url_for: Callable[[str, str, str, str], str],
+        period: Callable[[], Tuple[str, str]],
+    ) -> None:
+        super().__init__(master)
+        self.title("Dashboard")
+        self._url_for = url_for
+        self._period = period
+
+        toolbar = ttk.Frame(self, padding=(10, 10, 10, 0))
+        toolbar.pack(side=TOP, fill=X)
+        self.period_label = ttk.Label(toolbar, text="")
+        self.period_label.pack(side=LEFT)
+        self.progressbar = ttk.Progressbar(
+            toolbar, mode="determinate", bootstyle=SUCCESS
+        )
+        self.progressbar.pack(side=LEFT, fill=X, expand=YES, padx=10)
+        self.btn_refresh = ttk.Button(
+            toolbar, text="Refresh", bootstyle=SUCCESS, command=self.refresh
+        )
+        self.btn_refresh.pack(side=RIGHT)
+
+        grid = ttk.Frame(self, padding=10)
+        grid.pack(side=TOP, fill=BOTH, expand=YES)
+        self.tiles: Dict[Tuple[str, str], KpiTile] = {}
+        keys = [(lu, loc) for lu in link_ups for loc in FUNCTIONAL_LOCATIONS]
+        for i, (lu, loc) in enumerate(keys):
+            tile = KpiTile(grid, f"{loc[0]}_{lu[-2:]}")
+            tile.grid(row=i // TILE_COLUMNS, column=i % TILE_COLUMNS, padx=5, pady=5)
+            self.tiles[(lu, loc)] = tile
+        self.bind("<Destroy>", self._on_destroy)
+
+    def _on_destroy(self, event) -> None:
+        """Stop a running refresh before it updates destroyed tiles."""
+        from src.core.worker import PARSE_WORKER
+
+        if event.widget is self:
+            PARSE_WORKER.invalidate("dashboard")
+
+    @async_handler
+    async def refresh(self):
+        """Fetch every tile concurrently and render each one as it completes."""
+        import httpx
+
+        from src.core.evaluation import evaluate
+        from src.core.logic import fetch_data, get_targets
+        from src.core.worker import PARSE_WORKER, Superseded
+
+        date_entry, shift = self._period()
+        if not shift:
+            create_toast("Select shift first", WARNING)
+            return
+        self.period_label.configure(text=f"{date_entry}, Shift {shift}")
+        generation = PARSE_WORKER.claim("dashboard")
+
+        async def load(lu: str, loc: str):
+            link_up = lu.lstrip("LU")
+            url = self._url_for(link_up, date_entry, shift, loc[0:4])
+            try:
+                result = await fetch_data(url, client, key="dashboard")
+                return lu, loc, link_up, result, None
+            except (Superseded, asyncio.CancelledError):
+                raise
+            except Exception as e:
+                return lu, loc, link_up, None, e
+
+        for tile in self.tiles.values():
+            tile.set_status("loading...")
+        self.progressbar.configure(maximum=len(self.tiles), value=0)
+        self.btn_refresh.configure(state=DISABLED)
+        tasks = []
+        try:
+            async with httpx.AsyncClient(timeout=30) as client:
+                tasks = [asyncio.create_task(load(lu, loc)) for lu, loc in self.tiles]
+                for done in asyncio.as_completed(tasks):
+                    lu, loc, link_up, result, error = await done
+                    if not self.winfo_exists():
+                        return
+                    self.progressbar.step(1)
+                    tile = self.tiles[(lu, loc)]
+                    if error is not None:
+                        tile.set_status(f"error: {error}", DANGER)
+                        continue
+
+                    actual, calendar_time = result
+                    targets = get_targets(link_up, loc, shift=shift) or {}
+                    scorecard = evaluate([targets], [actual])
+                    tile.show_rows(scorecard.rows(0, actual_labels=actual))
+                    tile.set_status(str(calendar_time or ""), SUCCESS)
+        except (Superseded, asyncio.CancelledError):
+            return
+        finally:
+            for task in tasks:
+                task.cancel()
+            if PARSE_WORKER.is_current("dashboard", generation) and self.winfo_exists():
+                self.btn_refresh.configure(state=NORMAL)
@@ -1,9 +1,10 @@
 import ttkbootstrap as ttk
 from ttkbootstrap import Progressbar
 from ttkbootstrap.constants import *
-from ttkbootstrap.tableview import TableRow, Tableview
+from ttkbootstrap.tableview import TableRow
 from ttkbootstrap.toast import ToastNotification
 
+from src.gui.stop_table import StopTableview
 from src.gui.text_editor import TextEditor
 from src.utils.constants import TABLE_HEAD
 
@@ -50,7 +51,7 @@ class MainScreen(ttk.Frame):
         )
 
         # Table for displaying data
-        self.table = Tableview(
+        self.table = StopTableview(
             master=self.content_frame,
             coldata=TABLE_HEAD,
             rowdata=[],
@@ -1,43 +1,48 @@
-import qrcode
+import asyncio
+from collections import OrderedDict
+from typing import Tuple
+
 import ttkbootstrap as ttk
-from PIL import Image, ImageTk
+from PIL import ImageTk
 from ttkbootstrap.constants import *
 
 from src.gui.toast import create_toast
+from src.utils.qrimage import qr_cache_key, remember, render_qr_image
+
+# (sha256 of text, fill, back, size) -> Tk photo of the rendered image
+_photo_cache: "OrderedDict[Tuple[str, str, str, int], ImageTk.PhotoImage]" = (
+    OrderedDict()
+)
 
 
 async def generate_qrcode(
-    text: str, output_label: ttk.Label, fill_color="black", back_color="white"
+    text: str, output_label: ttk.Label, fill_color="black", back_color="orange"
 ):
     """
     Generate a QR code from the given text and display it in the provided label.
 
+    Rendering runs in a worker thread and is memoized by a hash of the text
+    and colors, so reopening the QR window for an unchanged report is instant.
+
     Args:
         text (str): The text to encode in the QR code.
         output_label (ttk.Label): The label where the QR code will be displayed.
         fill_color (str): The color of the QR code. Default is "black".
-        back_color (str): The background color of the QR code. Default is "white".
+        back_color (str): The background color of the QR code. Default is "orange".
 
     Returns:
         bool: True if the QR code was generated successfully, False otherwise.
     """
     try:
-        # Create a QR code object with specified settings
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(text)  # Add data to the QR code
-        qr.make(fit=True)
-
-        # Convert the QR code to a PIL image
-        qr_img = qr.make_image(fill_color=fill_color, back_color="orange")
-        qr_img = qr_img.resize((500, 500), resample=Image.Resampling.LANCZOS)
-
-        # Convert the PIL image to a format compatible with Tkinter
-        photo = ImageTk.PhotoImage(qr_img)
+        key = qr_cache_key(text, fill_color, back_color)
+        photo = _photo_cache.get(key)
+        if photo is None:
+            qr_img = await asyncio.to_thread(
+                render_qr_image, text, fill_color, back_color
+            )
+            # PhotoImage must be created on the Tk thread
+            photo = ImageTk.PhotoImage(qr_img)
+            remember(_photo_cache, key, photo)
 
         # Display the QR code in the provided label
         output_label.config(image=photo)
@@ -45,5 +50,5 @@ async def generate_qrcode(
         return True
     except Exception as e:
         # Display an error message if QR code generation fails
-        create_toast("Error", f"Failed to generate QR code: {e}")
+        create_toast(f"Failed to generate QR code: {e}", DANGER)
         return False
@@ -0,0 +1,78 @@
+from typing import List
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+
+from src.core.search import ReportIndex, SearchHit
+
+RESULT_COLUMNS = ("Date", "Shift", "Line", "User", "Match")
+
+
+class SearchWindow(ttk.Toplevel):
+    """Search the saved reports as you type; the selected report is shown below."""
+
+    def __init__(self, master, index: ReportIndex, link_ups: List[str]) -> None:
+        super().__init__(master)
+        self.title("Search Reports")
+        self.index = index
+        self.hits: List[SearchHit] = []
+
+        toolbar = ttk.Frame(self, padding=(10, 10, 10, 0))
+        toolbar.pack(side=TOP, fill=X)
+        self.query = ttk.StringVar()
+        self.entry = ttk.Entry(toolbar, textvariable=self.query, width=40)
+        self.entry.pack(side=LEFT, fill=X, expand=YES)
+        self.line = ttk.Combobox(
+            toolbar, values=["", *link_ups], width=8, state="readonly"
+        )
+        self.line.pack(side=LEFT, padx=(10, 0))
+        self.count = ttk.Label(toolbar, text="", bootstyle=SECONDARY, width=24)
+        self.count.pack(side=LEFT, padx=(10, 0))
+
+        self.results = ttk.Treeview(
+            self, columns=RESULT_COLUMNS, show=HEADINGS, height=12
+        )
+        for column, width in zip(RESULT_COLUMNS, (90, 60, 60, 90, 420)):
+            self.results.heading(column, text=column, anchor=W)
+            self.results.column(column, width=width, anchor=W)
+        self.results.pack(side=TOP, fill=BOTH, expand=YES, padx=10, pady=10)
+
+        self.preview = ttk.Text(self, height=14, font=("Consolas", 10))
+        self.preview.pack(side=TOP, fill=BOTH, expand=YES, padx=10, pady=(0, 10))
+
+        self.query.trace_add("write", lambda *_: self.search())
+        self.line.bind("<<ComboboxSelected>>", lambda _: self.search())
+        self.results.bind("<<TreeviewSelect>>", self.show_selected)
+        self.entry.focus_set()
+        self.search()
+
+    def search(self) -> None:
+        from time import perf_counter
+
+        start = perf_counter()
+        self.hits = self.index.search(self.query.get(), line=self.line.get() or None)
+        elapsed = (perf_counter() - start) * 1000
+
+        self.results.delete(*self.results.get_children())
+        for i, hit in enumerate(self.hits):
+            doc = hit.doc
+            self.results.insert(
+                "",
+                END,
+                iid=str(i),
+                values=(doc.date, doc.shift, doc.line, doc.user, hit.snippet),
+            )
+        self.count.configure(
+            text=f"{len(self.hits)} of {len(self.index)} reports, {elapsed:.1f} ms"
+        )
+
+    def show_selected(self, _event=None) -> None:
+        selection = self.results.selection()
+        if not selection:
+            return
+        doc = self.hits[int(selection[0])].doc
+        text = doc.text
+        if doc.stops:
+            text += "\n" + "\n".join(doc.stops)
+        self.preview.delete("1.0", END)
+        self.preview.insert("1.0", text)
@@ -4,7 +4,7 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.tooltip import ToolTip
 from ttkwidgets.autocomplete import AutocompleteCombobox
 
-from src.utils.helpers import get_data_from_excel, resource_path
+from src.utils.helpers import resource_path
 
 
 class Sidebar(ttk.Frame):
@@ -103,6 +103,20 @@ class Sidebar(ttk.Frame):
         )
         self.btn_result.pack(side=TOP, padx=10, pady=(5, 5))
 
+        # Auto refresh toggle
+        self.auto_refresh = ttk.BooleanVar(value=False)
+        self.chk_auto_refresh = ttk.Checkbutton(
+            self,
+            text="Auto refresh",
+            variable=self.auto_refresh,
+            bootstyle="success-round-toggle",
+            cursor="hand2",
+        )
+        self.chk_auto_refresh.pack(side=TOP, padx=10, pady=(5, 5))
+        ToolTip(
+            self.chk_auto_refresh, "Refresh the selected shift until it ends", delay=0
+        )
+
         self._add_separator()
 
         # QR Code button
@@ -115,6 +129,18 @@ class Sidebar(ttk.Frame):
         )
         self.btn_target.pack(side=TOP, padx=10, pady=(5, 5))
 
+        # Dashboard button
+        self.btn_dashboard = self._create_button(
+            "Dashboard", INFO, "Show all lines against their targets"
+        )
+        self.btn_dashboard.pack(side=TOP, padx=10, pady=(5, 5))
+
+        # Search button
+        self.btn_search = self._create_button(
+            "Search", INFO, "Search the saved reports"
+        )
+        self.btn_search.pack(side=TOP, padx=10, pady=(5, 5))
+
         self._add_separator()
 
     def _create_user_entry(self):
@@ -123,7 +149,7 @@ class Sidebar(ttk.Frame):
         self.entry_user = AutocompleteCombobox(
             master=self,
             width=12,
-            completevalues=get_data_from_excel(sheet_index=1),
+            completevalues=[],
             cursor="hand2",
         )
         self.entry_user.pack(side=TOP, padx=10, pady=(5, 5))
@@ -0,0 +1,172 @@
+from tkinter import font
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+from ttkbootstrap import utility
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import DOWNARROW, TableRow, Tableview
+
+BATCH_SIZE = 100
+AUTOFIT_SAMPLE = 50
+
+
+def _sample(rows: Sequence[Any], size: int) -> Sequence[Any]:
+    """Evenly spaced sample of at most ``size`` rows."""
+    if len(rows) <= size:
+        return rows
+    step = len(rows) / size
+    return [rows[int(i * step)] for i in range(size)]
+
+
+class StopTableview(Tableview):
+    """
+    Tableview for the equipment stop list.
+
+    ``load_rows`` shows the first batch of rows immediately and appends the
+    rest with ``after`` so the window keeps painting, and column widths are
+    measured on a sample of rows instead of every row.
+
+    Rows are also keyed by ``key_columns`` (Machine, Description) so
+    ``refresh_rows`` can apply only the inserts, updates and deletes between
+    two fetches, keeping the selection and scroll position.
+    """
+
+    def __init__(
+        self,
+        master=None,
+        batch_size: int = BATCH_SIZE,
+        autofit_sample: int = AUTOFIT_SAMPLE,
+        key_columns: Tuple[int, ...] = (0, 1),
+        **kwargs,
+    ) -> None:
+        self._batch_size = batch_size
+        self._autofit_sample = autofit_sample
+        self._key_columns = key_columns
+        self._keyed: Dict[Hashable, TableRow] = {}
+        self._load_job = None
+        super().__init__(master, **kwargs)
+
+    def load_rows(self, coldata: Sequence[Any], rowdata: Sequence[Sequence[Any]]):
+        """Replace the table contents with ``rowdata`` progressively."""
+        self.cancel_load()
+        self.purge_table_data()
+        self._keyed.clear()
+        self._filtered = False
+        self._searchcriteria.set("")
+
+        for i, col in enumerate(coldata):
+            self.insert_column(i, col)
+
+        rows: List[Sequence[Any]] = list(rowdata)
+        if self._autofit:
+            self._autofit_values(_sample(rows, self._autofit_sample))
+        self._append_batch(rows, 0)
+        if self._autoalign:
+            self.autoalign_columns()
+
+    def refresh_rows(
+        self, coldata: Sequence[Any], rowdata: Sequence[Sequence[Any]]
+    ) -> Tuple[int, int, int]:
+        """
+        Update the table to ``rowdata`` touching only the rows that changed.
+
+        Falls back to ``load_rows`` when the columns differ or a load is still
+        in progress.
+
+        Returns:
+            (inserted, updated, deleted) row counts
+        """
+        headers = [col._headertext for col in self.tablecolumns]
+        if self.is_loading or headers != [str(col) for col in coldata]:
+            self.load_rows(coldata, rowdata)
+            return len(rowdata), 0, 0
+
+        first_visible = self.view.yview()[0]
+        wanted: Dict[Hashable, Sequence[Any]] = {}
+        for values in rowdata:
+            wanted[self._row_key(values, wanted)] = values
+
+        stale = [key for key in self._keyed if key not in wanted]
+        if stale:
+            self._forget_rows([self._keyed.pop(key) for key in stale])
+
+        inserted = updated = 0
+        striped = self._stripecolor is not None
+        for key, values in wanted.items():
+            record = self._keyed.get(key)
+            if record is None:
+                record = self.insert_row(END, values)
+                record.show(striped and len(self._viewdata) % 2 == 0)
+                self._viewdata.append(record)
+                self._keyed[key] = record
+                inserted += 1
+            elif list(record.values) != list(values):
+                record.values = list(values)
+                updated += 1
+
+        if self._filtered and (inserted or updated):
+            self._search_table_data(None)
+        self.view.yview_moveto(first_visible)
+        return inserted, updated, len(stale)
+
+    def _row_key(self, values: Sequence[Any], seen: Dict[Hashable, Any]) -> Hashable:
+        """(Machine, Description[, n]) - repeated keys get an occurrence number."""
+        base = tuple(values[i] for i in self._key_columns)
+        key, n = base, 1
+        while key in seen:
+            key = base + (n,)
+            n += 1
+        return key
+
+    def _forget_rows(self, records: List[TableRow]) -> None:
+        """Remove rows without reloading the whole view (unlike TableRow.delete)."""
+        gone = set(map(id, records))
+        for name in ("_tablerows", "_tablerows_filtered", "_viewdata"):
+            rows = getattr(self, name)
+            rows[:] = [row for row in rows if id(row) not in gone]
+        iids = [record.iid for record in records]
+        for iid in iids:
+            self.iidmap.pop(iid, None)
+        self.view.delete(*[iid for iid in iids if self.view.exists(iid)])
+
+    def cancel_load(self) -> None:
+        """Stop appending the remaining batches of a previous load."""
+        if self._load_job is not None:
+            self.after_cancel(self._load_job)
+            self._load_job = None
+
+    @property
+    def is_loading(self) -> bool:
+        return self._load_job is not None
+
+    def autofit_columns(self):
+        """Autofit all columns from a sample of the loaded rows"""
+        self._autofit_values(
+            [row.values for row in _sample(self._tablerows, self._autofit_sample)]
+        )
+
+    def _autofit_values(self, sample: Sequence[Sequence[Any]]) -> None:
+        f = font.nametofont("TkDefaultFont")
+        pad = utility.scale_size(self, 20)
+        col_widths = [
+            f.measure(f"{col._headertext} {DOWNARROW}") + pad
+            for col in self.tablecolumns
+        ]
+        for values in sample:
+            for i, value in enumerate(values[: len(col_widths)]):
+                col_widths[i] = max(col_widths[i], f.measure(str(value)) + pad)
+        for i, width in enumerate(col_widths):
+            self.view.column(i, width=width)
+
+    def _append_batch(self, rows: List[Sequence[Any]], start: int) -> None:
+        end = start + self._batch_size
+        striped = self._stripecolor is not None
+        for i, values in enumerate(rows[start:end], start):
+            record = self.insert_row(END, values)
+            record.show(striped and i % 2 == 0)
+            self._viewdata.append(record)
+            self._keyed[self._row_key(values, self._keyed)] = record
+
+        if end < len(rows):
+            self._load_job = self.after(1, self._append_batch, rows, end)
+        else:
+            self._load_job = None
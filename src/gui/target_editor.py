@@ -7,6 +7,8 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.tooltip import ToolTip
 
 from src.gui.toast import create_toast
+from src.utils.constants import TARGET_KPIS
+from src.utils.csvhandle import TARGETS
 
 
 class EditableTableview(ttk.Frame):
@@ -14,7 +16,7 @@ class EditableTableview(ttk.Frame):
         super().__init__(parent)
 
         # Custom index values
-        self.index_values = ["STOP", "PR", "MTBF", "UPDT", "PDT", "NATR"]
+        self.index_values = list(TARGET_KPIS)
 
         # Add 'Index' column with custom values
         self.columns = [col_tittle] + list(columns)
@@ -194,6 +196,7 @@ class EditableTableview(ttk.Frame):
         try:
             df = pd.DataFrame(data, columns=columns)
             df.to_csv(filename, index=False)
+            TARGETS.store(filename, columns, data)
             create_toast(f"Data successfully saved: {filename}", SUCCESS)
             return True
         except Exception as e:
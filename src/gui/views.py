@@ -1,31 +1,33 @@
 import asyncio
+import importlib
+import sys
+from configparser import ConfigParser
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, NamedTuple
 
-import httpx
-import pandas as pd
 import ttkbootstrap as ttk
 from async_tkinter_loop import async_handler
-from openpyxl import load_workbook
-from openpyxl.styles import Font
-from tabulate import tabulate
 from ttkbootstrap.constants import *
 
-from src.core.logic import (
-    fetch_data,
-    get_data_spa,
-    get_time_period,
-    post_data,
-    read_csv,
-)
-from src.gui.qr import generate_qrcode
-from src.gui.target_editor import EditableTableview
+from src.core.worker import PARSE_WORKER, Superseded
 from src.gui.toast import create_toast
-from src.utils.constants import HEADERS, NTLM_AUTH
-from src.utils.csvhandle import get_targets_file_path, load_targets_df
+from src.utils.constants import (
+    ANOMALY_GUI_MIN_SHIFTS,
+    ANOMALY_METHOD,
+    ANOMALY_Z,
+    HEADERS,
+    REFRESH_INTERVAL_S,
+    REFRESH_MAX_INTERVAL_S,
+    SEARCH_INDEX_FILE,
+    TARGET_POLL_MS,
+)
 from src.utils.helpers import (
+    default_config,
     get_data_from_excel,
     get_excel_filename,
-    get_url_norm_period_loss_tree,
-    get_url_period_equipment_data,
+    get_script_folder,
+    get_url,
     read_config,
     resource_path,
 )
@@ -33,15 +35,92 @@ from src.utils.helpers import (
 from .mainpage import MainScreen
 from .sidebar import Sidebar
 
+# Feature modules (pandas, numpy, openpyxl, tabulate, qrcode, httpx and the
+# SPA parser) are imported inside the methods that need them, and warmed up
+# by load_startup_data in the background, so the window appears first.
+STARTUP_POLL_MS = 50
+WARMUP_MODULES = [
+    "src.core.logic",
+    "src.core.evaluation",
+    "src.core.anomaly",
+    "tabulate",
+    "src.gui.qr",
+]
+
+
+class StartupData(NamedTuple):
+    config: ConfigParser
+    excel_filename: str
+    usernames: List[str]
+    report_index: Any
+
+
+def load_startup_data() -> StartupData:
+    """Read config, workbook and targets, then import the feature modules."""
+    from src.utils.csvhandle import TARGETS
+
+    excel_filename = get_excel_filename()
+    startup = StartupData(
+        config=read_config(),
+        excel_filename=excel_filename,
+        usernames=get_data_from_excel(sheet_index=1),
+        report_index=_open_report_index(excel_filename),
+    )
+    TARGETS.preload()
+    for module in WARMUP_MODULES:
+        importlib.import_module(module)
+    return startup
+
+
+def fallback_startup_data() -> StartupData:
+    """What can still be read after load_startup_data failed; defaults otherwise."""
+    from src.core.search import ReportIndex
+
+    try:
+        config = read_config()
+    except Exception:
+        config = default_config()
+    try:
+        excel_filename = get_excel_filename()
+        usernames = get_data_from_excel(sheet_index=1)
+    except Exception:
+        excel_filename = str(Path(get_script_folder()) / "DB.xlsx")
+        usernames = []
+    return StartupData(
+        config=config,
+        excel_filename=excel_filename,
+        usernames=usernames,
+        report_index=ReportIndex(Path(get_script_folder()) / SEARCH_INDEX_FILE),
+    )
+
+
+def _open_report_index(excel_filename: str):
+    """The saved report index; empty (search only finds new saves) if unreadable."""
+    from src.core.search import ReportIndex
+
+    path = Path(get_script_folder()) / SEARCH_INDEX_FILE
+    try:
+        return ReportIndex.open(path, workbook=excel_filename)
+    except OSError as e:
+        print(f"warning: report index {path} not loaded: {e}", file=sys.stderr)
+        return ReportIndex(path)
+
 
 class View(ttk.Window):
     def __init__(self) -> None:
         super().__init__(themename="superhero")
         self.title("Daily Report")
         self.iconbitmap(resource_path("assets/c5_spa.ico"))
-        self.excelDB = ttk.StringVar(value=get_excel_filename())
-        self.config = read_config()
-
+        self.excelDB = ttk.StringVar(value="")
+        self.config = None
+        self.dashboard = None
+        self.report_index = None
+        self.search_window = None
+        self._refresh_schedule = None
+        self._auto_refresh_job = None
+        self._anomalies = None
+        # Unusual stop lines of the report, per (line, date, shift)
+        self._flags = {}
         # Initialize Sidebar
         self.sidebar = Sidebar(self)
         self._configure_sidebar()
@@ -58,42 +137,94 @@ class View(ttk.Window):
         self.mainscreen = MainScreen(self)
         self.mainscreen.pack(side=LEFT, fill=BOTH, expand=YES)
 
-    def _configure_sidebar(self):
-        """Configure sidebar buttons and dropdowns."""
+        # Config, workbook and targets are read off the UI thread
+        self._set_actions_state(DISABLED)
+        self._startup = PARSE_WORKER.executor.submit(load_startup_data)
+        self.after(STARTUP_POLL_MS, self._finish_startup)
+
+    def _finish_startup(self):
+        """Apply the background startup data once it is ready."""
+        if not self._startup.done():
+            self.after(STARTUP_POLL_MS, self._finish_startup)
+            return
+        try:
+            startup = self._startup.result()
+        except Exception as e:
+            # Keep the app usable; saving or fetching reports the real error
+            create_toast(f"Startup error: {e}\nUsing default settings.", DANGER)
+            startup = fallback_startup_data()
+
+        self.config = startup.config
+        self.excelDB.set(startup.excel_filename)
+        self.report_index = startup.report_index
         self.sidebar.lu.configure(
-            values=sorted(self.config.get("DEFAULT", "link_up").split(","))
+            values=sorted(
+                self.config.get(
+                    "DEFAULT",
+                    "link_up",
+                    fallback=default_config()["DEFAULT"]["link_up"],
+                ).split(",")
+            )
         )
         self.sidebar.lu.current(0)
+        self.sidebar.entry_user.configure(completevalues=startup.usernames)
+        self._set_actions_state(NORMAL)
+        self.after(TARGET_POLL_MS, self._poll_targets)
+
+    def _set_actions_state(self, state):
+        for button in (
+            self.sidebar.btn_get_data,
+            self.sidebar.btn_result,
+            self.sidebar.btn_target,
+            self.sidebar.btn_save,
+            self.sidebar.btn_dashboard,
+            self.sidebar.btn_search,
+            self.sidebar.chk_auto_refresh,
+        ):
+            button.configure(state=state)
 
+    def _configure_sidebar(self):
+        """Configure sidebar buttons and dropdowns."""
         self.sidebar.btn_get_data.configure(command=self.get_data)
         self.sidebar.btn_target.configure(command=self.show_target_editor)
         self.sidebar.btn_qr.configure(command=self.create_qrcode_toplevel)
         self.sidebar.btn_result.configure(command=self.show_result)
         self.sidebar.btn_save.configure(command=self.save_excel)
+        self.sidebar.btn_dashboard.configure(command=self.show_dashboard)
+        self.sidebar.btn_search.configure(command=self.show_search)
+        self.sidebar.chk_auto_refresh.configure(command=self.toggle_auto_refresh)
         # self.sidebar.btn_test.configure(command=self.test_post)
 
+    def _poll_targets(self):
+        """Reload target files edited outside the app."""
+        from src.utils.csvhandle import TARGETS
+
+        try:
+            TARGETS.poll()
+        finally:
+            self.after(TARGET_POLL_MS, self._poll_targets)
+
     def _get_url(
         self, endpoint_type, link_up, date_entry, shift, functional_location="PACK"
     ):
         """Helper method to generate URLs based on environment."""
-        if self.config.get("DEFAULT", "environment") == "production":
-            # For production environment, generate URLs based on endpoint type
-            if endpoint_type not in ["period_equipment_data", "norm_period_loss_tree"]:
-                raise ValueError(f"Invalid endpoint type: {endpoint_type}")
-            if endpoint_type == "period_equipment_data":
-                return get_url_period_equipment_data(link_up, date_entry, shift)
-            elif endpoint_type == "norm_period_loss_tree":
-                return get_url_norm_period_loss_tree(
-                    link_up, date_entry, shift, functional_location
-                )
-        else:
-            # For development or testing environment, use local HTML files
-            return f"http://127.0.0.1:5500/assets/{endpoint_type}.html"
-            # return "http://127.0.0.1:5500/assets/no_pdt.html"
+        return get_url(
+            self.config,
+            endpoint_type,
+            link_up,
+            date_entry,
+            shift,
+            functional_location,
+        )
 
     @async_handler
     async def get_data(self):
         """Fetch and display data based on user input."""
+        import httpx
+
+        from src.core.logic import read_equipment
+        from src.utils.constants import NTLM_AUTH
+
         if not self.sidebar.select_shift.get():
             create_toast("Select shift first", WARNING)
             return
@@ -103,6 +234,7 @@ class View(ttk.Window):
         shift = self.sidebar.select_shift.get().lstrip("Shift ")
         url = self._get_url("period_equipment_data", link_up, date_entry, shift)
 
+        generation = PARSE_WORKER.claim("equipment")
         try:
             self.mainscreen.progressbar.start()
             self.sidebar.btn_get_data.configure(state=DISABLED)
@@ -115,38 +247,80 @@ class View(ttk.Window):
                     auth=NTLM_AUTH,
                 )
             if response.status_code == 200:
-                time_period = get_time_period(response)
-                self.mainscreen.time_period.configure(text=time_period)
-
                 # df = extract_dataframe(response)
-                df = get_data_spa(response)
+                time_period, df = await read_equipment(
+                    response, key="equipment", generation=generation
+                )
+                self.mainscreen.time_period.configure(text=time_period)
 
-                self._populate_table(df)
+                df = self._flag_unusual_stops(df, link_up, date_entry, shift)
+                self._populate_table(df, source=(link_up, date_entry, shift))
 
                 create_toast(f"App setting\n{url}", SUCCESS)
             else:
                 create_toast(
                     f"Error Code {response.status_code}: {response.text}", DANGER
                 )
+        except (Superseded, asyncio.CancelledError):
+            return
         except httpx.HTTPError as e:
             create_toast(f"HTTP Error: {e}", DANGER)
         finally:
-            self.mainscreen.progressbar.stop()
-            self.sidebar.btn_get_data.configure(state=NORMAL)
-
-    def _populate_table(self, df: pd.DataFrame):
-        """Populate the table with data."""
+            if PARSE_WORKER.is_current("equipment", generation):
+                self.mainscreen.progressbar.stop()
+                self.sidebar.btn_get_data.configure(state=NORMAL)
+
+    def _flag_unusual_stops(self, df, link_up, date_entry, shift):
+        """
+        Add the Flag column from the stop anomaly detector of this session.
+
+        The detector starts empty with every session, so it needs only
+        ``anomaly_min_shifts`` shifts of a line (default 2) before flagging.
+        """
+        from src.core.anomaly import StopAnomalyDetector, flag_marks, format_flags
+
+        if self._anomalies is None:
+            self._anomalies = StopAnomalyDetector(
+                method=self.config.get(
+                    "DEFAULT", "anomaly_method", fallback=ANOMALY_METHOD
+                ),
+                z=self.config.getfloat("DEFAULT", "anomaly_z", fallback=ANOMALY_Z),
+                min_shifts=self.config.getint(
+                    "DEFAULT", "anomaly_min_shifts", fallback=ANOMALY_GUI_MIN_SHIFTS
+                ),
+            )
+        flags = self._anomalies.observe(link_up, df, shift_id=(date_entry, shift))
+        keys = list(zip(df["Machine"].tolist(), df["Description"].tolist()))
+        text = format_flags(flags)
+        self._flags[(link_up, date_entry, shift)] = text
+        self._write_flags(text)
+        if flags:
+            create_toast(text, WARNING)
+        return df.assign(Flag=flag_marks(keys, flags))
+
+    def _populate_table(self, df, source=None):
+        """Populate the table with data.
+
+        A refetch of the same line, date and shift only applies the changed rows.
+        """
         head = df.columns.to_list()
         data = df.values.tolist()
 
         self.mainscreen.table.columnconfigure(0, weight=1)
         self.mainscreen.table.columnconfigure(1, weight=1)
-        self.mainscreen.table.build_table_data(head, data)
-        self.mainscreen.table.reset_table()
+        if source is not None and source == getattr(self, "_table_source", None):
+            self.mainscreen.table.refresh_rows(head, data)
+        else:
+            self.mainscreen.table.load_rows(head, data)
+        self._table_source = source
 
     @async_handler
     async def show_result(self):
         """Fetch and display result data."""
+        import httpx
+
+        from src.core.logic import fetch_data, get_targets
+
         if not self.sidebar.select_shift.get():
             create_toast("Select shift first", WARNING)
             return
@@ -165,47 +339,240 @@ class View(ttk.Window):
             functional_location[0:4],
         )
 
-        excel_file = get_targets_file_path(link_up, functional_location)
-
+        generation = PARSE_WORKER.claim("result")
         try:
+            excel_result = get_targets(link_up, functional_location, shift=shift)
             async with httpx.AsyncClient() as client:
-                fetch_task = fetch_data(url, client)
-                read_task = read_csv(excel_file, shift=shift)
-                http_result, excel_result = await asyncio.gather(fetch_task, read_task)
+                http_result = await fetch_data(url, client, key="result")
 
             self._display_result(http_result, excel_result)
+        except (Superseded, asyncio.CancelledError):
+            return
         except Exception as e:
             create_toast(f"Error: {e}", DANGER)
         finally:
-            self.mainscreen.progressbar.stop()
+            if PARSE_WORKER.is_current("result", generation):
+                self.mainscreen.progressbar.stop()
 
-    def _display_result(self, http_result, excel_result):
-        """Display the result data in the UI."""
-        data = [excel_result, http_result[0]]
-        txt = tabulate(
-            pd.DataFrame(data).transpose().reset_index().values.tolist(),
-            tablefmt="pretty",
-            headers=[
-                f"{self.sidebar.func_location.get()[0]}_{self.sidebar.lu.get()[-2:]}",
-                "TARGET",
-                "ACTUAL",
-            ],
-            numalign="left",
-            stralign="left",
+    def show_dashboard(self):
+        """Open the plant-wide dashboard and refresh every line at once."""
+        from src.gui.dashboard import Dashboard
+
+        if self.dashboard is not None and self.dashboard.winfo_exists():
+            self.dashboard.destroy()
+
+        self.dashboard = Dashboard(
+            self,
+            link_ups=sorted(self.config.get("DEFAULT", "link_up").split(",")),
+            url_for=lambda link_up, date_entry, shift, functional_location: (
+                self._get_url(
+                    "norm_period_loss_tree",
+                    link_up,
+                    date_entry,
+                    shift,
+                    functional_location,
+                )
+            ),
+            period=lambda: (
+                self.sidebar.dt.entry.get(),
+                self.sidebar.select_shift.get().lstrip("Shift "),
+            ),
+        )
+        self.dashboard.refresh()
+
+    def show_search(self):
+        """Open the full-text search over the saved reports."""
+        from src.gui.search import SearchWindow
+
+        if self.search_window is not None and self.search_window.winfo_exists():
+            self.search_window.lift()
+            return
+        self.search_window = SearchWindow(
+            self,
+            self.report_index,
+            link_ups=sorted(self.config.get("DEFAULT", "link_up").split(",")),
         )
 
-        value = "`" + txt.replace("\n", "`\n`") + "`\n\n"
+    def _display_result(self, http_result, excel_result, notify=True):
+        """Display the result data in the UI."""
+        from src.core.report import format_result, report_title
+
+        value = format_result(
+            report_title(self.sidebar.func_location.get(), self.sidebar.lu.get()),
+            http_result[0],
+            excel_result,
+        )
 
-        if "+-" in self.mainscreen.inp.get("1.0", "2.0"):
-            self.mainscreen.inp.delete("1.0", "12.0")
-        self.mainscreen.inp.insert("1.0", value)
-        create_toast("Updated", SUCCESS)
+        self._write_report(value)
+        self._write_flags(self._flags.get(self._selection()[:3], ""))
+        if notify:
+            create_toast("Updated", SUCCESS)
 
         self.mainscreen.time_period.configure(text=http_result[1])
 
+    def _write_report(self, value):
+        """Write the result block at the top of the report, rewriting only changed lines."""
+        inp = self.mainscreen.inp
+        if "+-" not in inp.get("1.0", "2.0"):
+            inp.insert("1.0", value)
+            return
+
+        for number, line in enumerate(value.split("\n")[:-1], start=1):
+            start, end = f"{number}.0", f"{number}.end"
+            if inp.get(start, end) != line:
+                inp.delete(start, end)
+                inp.insert(start, line)
+
+    def _write_flags(self, text):
+        """Put the unusual stop lines below the result block, replacing the last ones."""
+        inp = self.mainscreen.inp
+        line = 1
+        while inp.get(f"{line}.0", f"{line}.end").startswith("`"):
+            line += 1
+        if line == 1:
+            # No result block yet; written with it by _display_result
+            return
+        # Below the blank line that ends the block
+        line += 1
+        end = line
+        while inp.get(f"{end}.0", f"{end}.end").startswith(("Unusual stops:", "⚠ ")):
+            end += 1
+        inp.delete(f"{line}.0", f"{end}.0")
+        if text:
+            inp.insert(f"{line}.0", text)
+
+    def _selection(self):
+        """The line, date, shift and functional location selected in the sidebar."""
+        return (
+            self.sidebar.lu.get().lstrip("LU"),
+            self.sidebar.dt.entry.get(),
+            self.sidebar.select_shift.get().lstrip("Shift "),
+            self.sidebar.func_location.get(),
+        )
+
+    def toggle_auto_refresh(self):
+        if self.sidebar.auto_refresh.get():
+            self.start_auto_refresh()
+        else:
+            self.stop_auto_refresh()
+
+    def start_auto_refresh(self):
+        """Keep the selected shift's table and report up to date until it ends."""
+        from src.core.scheduler import RefreshSchedule, current_shift, shift_bounds
+
+        if not self.sidebar.select_shift.get():
+            # Nothing selected: monitor the shift that is running now
+            day, shift = current_shift(datetime.now())
+            self.sidebar.dt.entry.delete(0, END)
+            self.sidebar.dt.entry.insert(0, day.isoformat())
+            self.sidebar.select_shift.set(f"Shift {shift}")
+
+        _, date_entry, shift, _ = self._selection()
+        window = shift_bounds(datetime.strptime(date_entry, "%Y-%m-%d").date(), shift)
+        if window.end <= datetime.now():
+            self.sidebar.auto_refresh.set(False)
+            create_toast("Selected shift has already ended", WARNING)
+            return
+
+        self._refresh_schedule = RefreshSchedule(
+            window,
+            interval=self.config.getint(
+                "DEFAULT", "refresh_interval", fallback=REFRESH_INTERVAL_S
+            ),
+            max_interval=self.config.getint(
+                "DEFAULT", "refresh_max_interval", fallback=REFRESH_MAX_INTERVAL_S
+            ),
+        )
+        self._auto_refresh_selection = self._selection()
+        self._schedule_auto_refresh(0)
+
+    def stop_auto_refresh(self, message=None):
+        if self._auto_refresh_job is not None:
+            self.after_cancel(self._auto_refresh_job)
+            self._auto_refresh_job = None
+        PARSE_WORKER.invalidate("auto")
+        self._refresh_schedule = None
+        self.sidebar.auto_refresh.set(False)
+        if message:
+            create_toast(message, INFO)
+
+    def _schedule_auto_refresh(self, delay):
+        self._auto_refresh_job = self.after(int(delay * 1000), self._auto_refresh_tick)
+
+    @async_handler
+    async def _auto_refresh_tick(self):
+        """Refetch both pages and push them to the UI only if their content changed."""
+        import httpx
+
+        from src.core.logic import fetch_data, get_targets, read_equipment
+        from src.core.scheduler import content_hash, shift_window
+        from src.utils.constants import NTLM_AUTH
+
+        self._auto_refresh_job = None
+        schedule = self._refresh_schedule
+        if schedule is None:
+            return
+        if self._selection() != self._auto_refresh_selection:
+            self.stop_auto_refresh("Auto refresh stopped: selection changed")
+            return
+
+        link_up, date_entry, shift, functional_location = self._auto_refresh_selection
+        generation = PARSE_WORKER.claim("auto")
+        try:
+            async with httpx.AsyncClient(timeout=30) as client:
+                response, http_result = await asyncio.gather(
+                    client.get(
+                        self._get_url(
+                            "period_equipment_data", link_up, date_entry, shift
+                        ),
+                        follow_redirects=True,
+                        headers=HEADERS,
+                        auth=NTLM_AUTH,
+                    ),
+                    fetch_data(
+                        self._get_url(
+                            "norm_period_loss_tree",
+                            link_up,
+                            date_entry,
+                            shift,
+                            functional_location[0:4],
+                        ),
+                        client,
+                        key="auto",
+                    ),
+                )
+            response.raise_for_status()
+            time_period, df = await read_equipment(
+                response, key="auto", generation=generation
+            )
+        except (Superseded, asyncio.CancelledError):
+            return
+        except Exception as e:
+            create_toast(f"Auto refresh error: {e}", DANGER)
+            schedule.observe(None)
+        else:
+            actual, calendar_time = http_result
+            schedule.window = shift_window(calendar_time) or schedule.window
+            if schedule.observe(content_hash(df.values.tolist(), actual)):
+                df = self._flag_unusual_stops(df, link_up, date_entry, shift)
+                self._populate_table(df, source=(link_up, date_entry, shift))
+                excel_result = get_targets(link_up, functional_location, shift=shift)
+                self._display_result(http_result, excel_result, notify=False)
+            self.mainscreen.time_period.configure(text=time_period)
+
+        if self._refresh_schedule is not schedule:
+            return
+        delay = schedule.next_delay(datetime.now())
+        if delay is None:
+            self.stop_auto_refresh("Shift ended, auto refresh stopped")
+        else:
+            self._schedule_auto_refresh(delay)
+
     @async_handler
     async def create_qrcode_toplevel(self):
         """Create a QR code and display it in a new window."""
+        from src.gui.qr import generate_qrcode
+
         width, height = 500, 500
         x = (self.winfo_screenwidth() // 2) - (width // 2)
         y = (self.winfo_screenheight() // 2) - (height // 2)
@@ -233,6 +600,9 @@ class View(ttk.Window):
 
     def show_target_editor(self):
         """Open the target editor window."""
+        from src.gui.target_editor import EditableTableview
+        from src.utils.csvhandle import get_targets_file_path, load_targets_df
+
         try:
             self.target.destroy()
         except AttributeError:
@@ -267,6 +637,9 @@ class View(ttk.Window):
 
     def save_excel(self):
         """Save data to the Excel file."""
+        from openpyxl import load_workbook
+        from openpyxl.styles import Font
+
         try:
             if not self.sidebar.entry_user.get():
                 create_toast("Enter username first", WARNING)
@@ -296,15 +669,50 @@ class View(ttk.Window):
                 self.sidebar.entry_user.configure(completevalues=list_username)
 
             wb.save(file_excel)
+            self._index_report(data)
             create_toast("File is successfully updated.", SUCCESS)
         except PermissionError:
             create_toast(
                 "File is being used by another User.\nPlease try again later.", DANGER
             )
 
+    def _index_report(self, data):
+        """Add a saved Data row and the stops of the current table to the search index."""
+        from src.core.search import ReportDoc
+
+        table = self.mainscreen.table
+        headers = [col._headertext for col in table.tablecolumns]
+        stops = []
+        if "Machine" in headers and "Description" in headers:
+            machine, description = (
+                headers.index("Machine"),
+                headers.index("Description"),
+            )
+            stops = [
+                f"{row.values[machine]} {row.values[description]}"
+                for row in table.tablerows
+            ]
+        try:
+            self.report_index.add(
+                ReportDoc(
+                    date=data[1],
+                    shift=data[2],
+                    line=data[3],
+                    user=data[4],
+                    text=data[5],
+                    stops=stops,
+                )
+            )
+        except OSError as e:
+            create_toast(f"Search index not updated: {e}", WARNING)
+
     @async_handler
     async def test_post(self):
         """Test function to display a message."""
+        import httpx
+
+        from src.core.logic import get_targets, post_data
+
         if not self.sidebar.select_shift.get():
             create_toast("Select shift first", WARNING)
             return
@@ -318,13 +726,12 @@ class View(ttk.Window):
         url = self.config.get("DEFAULT", "url")
         parameter = self.config.get("DEFAULT", "parameter")
 
-        excel_file = get_targets_file_path(link_up)
-
         try:
+            excel_result = get_targets(
+                link_up, self.sidebar.func_location.get(), shift=shift
+            )
             async with httpx.AsyncClient() as client:
-                fetch_task = post_data(url, client, parameter=parameter)
-                read_task = read_csv(excel_file, shift=shift)
-                http_result, excel_result = await asyncio.gather(fetch_task, read_task)
+                http_result = await post_data(url, client, parameter=parameter)
 
             self._display_result(http_result, excel_result)
         except Exception as e:
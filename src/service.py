@@ -0,0 +1,242 @@
+"""
+Shared report service: one OTS fetcher for many operator PCs::
+
+    python service.py --host 0.0.0.0 --port 8765
+
+Serves the parsed pages as JSON and caches them, so a shift change with a
+dozen clients costs one upstream fetch per page. Point the GUI at it with
+``service_url = http://<host>:8765`` in config.ini.
+
+    GET /norm_period_loss_tree?link_up=18&date=2025-07-13&shift=2&location=PACK
+    GET /period_equipment_data?link_up=18&date=2025-07-13&shift=2
+    GET /health
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+from src.core.cache import SingleFlightCache
+from src.core.logic import read_equipment, read_loss_tree
+from src.core.scheduler import shift_bounds
+from src.core.worker import ParseWorker
+from src.utils.constants import (
+    HEADERS,
+    SERVICE_CLOSED_TTL_S,
+    SERVICE_LIVE_TTL_S,
+    SERVICE_PORT,
+)
+from src.utils.helpers import get_ots_url, read_config
+
+WORKER_KEY = "service"
+# OTS keeps booking stops for a while after the shift has ended
+SHIFT_SETTLE_TIME = timedelta(minutes=30)
+
+
+def _json_default(value: Any) -> Any:
+    # numpy scalars from the stop table
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _encode(payload: Any) -> bytes:
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+class ReportService:
+    def __init__(
+        self,
+        config,
+        client: httpx.AsyncClient,
+        worker: ParseWorker,
+        live_ttl: float = SERVICE_LIVE_TTL_S,
+        closed_ttl: float = SERVICE_CLOSED_TTL_S,
+    ) -> None:
+        self.config = config
+        self.client = client
+        self.worker = worker
+        self.live_ttl = live_ttl
+        self.closed_ttl = closed_ttl
+        self.cache = SingleFlightCache()
+        self.upstream = 0
+        self.routes = {
+            "norm_period_loss_tree": self.loss_tree,
+            "period_equipment_data": self.equipment,
+        }
+
+    def ttl(self, date_entry: str, shift: str) -> float:
+        """Short TTL while a shift can still change, long once it has settled."""
+        day = datetime.strptime(date_entry, "%Y-%m-%d").date()
+        window = shift_bounds(day, int(shift))
+        if datetime.now() < window.end + SHIFT_SETTLE_TIME:
+            return self.live_ttl
+        return self.closed_ttl
+
+    async def _fetch(self, endpoint_type: str, params: Dict[str, str]):
+        from src.utils.constants import NTLM_AUTH
+
+        url = get_ots_url(
+            self.config,
+            endpoint_type,
+            params["link_up"],
+            params["date"],
+            params["shift"],
+            params["location"],
+        )
+        self.upstream += 1
+        response = await self.client.get(
+            url, follow_redirects=True, headers=HEADERS, auth=NTLM_AUTH
+        )
+        response.raise_for_status()
+        return response
+
+    async def loss_tree(self, params: Dict[str, str]) -> bytes:
+        async def build() -> bytes:
+            response = await self._fetch("norm_period_loss_tree", params)
+            actual, calendar_time = await read_loss_tree(
+                response, self.worker, WORKER_KEY
+            )
+            return _encode({"actual": actual, "calendar_time": calendar_time})
+
+        key = ("norm_period_loss_tree", *params.values())
+        ttl = self.ttl(params["date"], params["shift"])
+        return await self.cache.get(key, build, ttl)
+
+    async def equipment(self, params: Dict[str, str]) -> bytes:
+        async def build() -> bytes:
+            response = await self._fetch("period_equipment_data", params)
+            time_period, df = await read_equipment(response, self.worker, WORKER_KEY)
+            return _encode(
+                {
+                    "time_period": time_period,
+                    "columns": df.columns.to_list(),
+                    "rows": df.values.tolist(),
+                }
+            )
+
+        # The equipment page does not depend on the functional location
+        params = {**params, "location": ""}
+        key = ("period_equipment_data", *params.values())
+        ttl = self.ttl(params["date"], params["shift"])
+        return await self.cache.get(key, build, ttl)
+
+    async def dispatch(self, method: str, target: str) -> Tuple[HTTPStatus, bytes]:
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, _encode({"error": method})
+
+        parts = urlsplit(target)
+        endpoint = parts.path.strip("/")
+        if endpoint == "health":
+            return HTTPStatus.OK, _encode(
+                {"upstream": self.upstream, **self.cache.stats()}
+            )
+        route = self.routes.get(endpoint)
+        if route is None:
+            return HTTPStatus.NOT_FOUND, _encode({"error": endpoint})
+
+        query = parse_qs(parts.query)
+        try:
+            params = {name: query[name][0] for name in ("link_up", "date", "shift")}
+            params["location"] = query.get("location", ["PACK"])[0]
+            self.ttl(params["date"], params["shift"])
+        except (KeyError, ValueError) as e:
+            return HTTPStatus.BAD_REQUEST, _encode({"error": f"bad parameter {e}"})
+
+        try:
+            return HTTPStatus.OK, await route(params)
+        except httpx.HTTPError as e:
+            return HTTPStatus.BAD_GATEWAY, _encode({"error": str(e)})
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request_line = await reader.readline()
+            # Headers are not needed, just consume them
+            while (await reader.readline()).strip():
+                pass
+            try:
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                status, body = await self.dispatch(method, target)
+            except ValueError:
+                status, body = HTTPStatus.BAD_REQUEST, _encode({"error": "request"})
+            except Exception as e:
+                status, body = (
+                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                    _encode({"error": str(e)}),
+                )
+            head = (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(head.encode("latin-1") + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    config = read_config()
+    worker = ParseWorker(max_workers=args.workers, use_processes=args.processes)
+    try:
+        async with httpx.AsyncClient(timeout=args.timeout) as client:
+            service = ReportService(
+                config,
+                client,
+                worker,
+                live_ttl=args.live_ttl,
+                closed_ttl=args.closed_ttl,
+            )
+            server = await asyncio.start_server(service.handle, args.host, args.port)
+            print(f"Serving on http://{args.host}:{args.port}", file=sys.stderr)
+            async with server:
+                await server.serve_forever()
+    finally:
+        worker.shutdown()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="service.py",
+        description="Serve parsed OTS pages as JSON to the GUI clients.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument(
+        "--live-ttl",
+        type=float,
+        default=SERVICE_LIVE_TTL_S,
+        help="seconds to cache a shift that can still change",
+    )
+    parser.add_argument(
+        "--closed-ttl",
+        type=float,
+        default=SERVICE_CLOSED_TTL_S,
+        help="seconds to cache a settled shift",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="parser workers")
+    parser.add_argument(
+        "--processes", action="store_true", help="parse in processes, not threads"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+    return 0
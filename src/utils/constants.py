@@ -1,5 +1,3 @@
-from httpx_ntlm import HttpNtlmAuth
-
 FILENAME = "DB.xlsx"
 TARGET_FOLDER = "Target"
 MAIN_URL = "http://ots.app.pmi/db.aspx?"
@@ -9,7 +7,6 @@ HEADERS = {
 }
 USERNAME = "f-pmiidkraplu18"
 PASSWORD = "Sampoerna1"
-NTLM_AUTH = HttpNtlmAuth(username=USERNAME, password=PASSWORD)
 
 
 TABLE_HEAD = [
@@ -19,5 +16,47 @@ TABLE_HEAD = [
     "DT [min]",
 ]
 
+FUNCTIONAL_LOCATIONS = ["PACKER", "MAKER"]
+
+# Row order of the target CSV files (one column per shift)
+TARGET_KPIS = ["STOP", "PR", "MTBF", "UPDT", "PDT", "NATR"]
+TARGET_POLL_MS = 5000
+
+# Auto refresh of a running shift, overridable in config.ini
+REFRESH_INTERVAL_S = 60
+REFRESH_MAX_INTERVAL_S = 600
+
+# Unusual stop detection, overridable in config.ini
+ANOMALY_METHOD = "ewma"
+ANOMALY_Z = 3.0
+# Shifts of a line learned before flagging: cli.py reads many dates at once,
+# the GUI learns only from the shifts fetched since it started (nothing is
+# kept between sessions), so it flags from the third shift of a line
+ANOMALY_MIN_SHIFTS = 5
+ANOMALY_GUI_MIN_SHIFTS = 2
+
+# Search index of the saved reports, next to DB.xlsx
+SEARCH_INDEX_FILE = "report_index.jsonl"
+
+# Shift history with daily and weekly roll-ups (cli.py --history)
+HISTORY_FILE = "history.sqlite3"
+
+# Shared report service (service.py)
+SERVICE_PORT = 8765
+SERVICE_LIVE_TTL_S = 30
+SERVICE_CLOSED_TTL_S = 6 * 3600
+
 GREEN = "🟢"
 RED = "🔴"
+
+
+def __getattr__(name):
+    # httpx_ntlm pulls in httpx and spnego; build the auth on first use only
+    if name == "NTLM_AUTH":
+        from httpx_ntlm import HttpNtlmAuth
+
+        auth = globals()["NTLM_AUTH"] = HttpNtlmAuth(
+            username=USERNAME, password=PASSWORD
+        )
+        return auth
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
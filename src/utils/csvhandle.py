@@ -1,7 +1,14 @@
+import csv
+import math
+import os
+import re
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from src.utils.constants import TARGET_FOLDER, TARGET_KPIS
 from src.utils.helpers import get_script_folder
 
 columns = ["Shift 1", "Shift 2", "Shift 3"]
@@ -14,10 +21,12 @@ data = [
     ("4.1%", "4.1%", "4.1%"),
 ]
 
+TARGET_FILE_PATTERN = re.compile(r"^target_(?P<location>[a-z]+)_(?P<lu>\w+)\.csv$")
+
 
 def get_targets_file_path(lu, func_location: str = None):
     script_folder = Path(get_script_folder())
-    target_folder = script_folder / "Target"
+    target_folder = script_folder / TARGET_FOLDER
     target_folder.mkdir(parents=True, exist_ok=True)
 
     filename = target_folder / f"target_{func_location.lower()}_{lu}.csv"
@@ -32,3 +41,149 @@ def load_targets_df(filename=None):
     """Memuat pengaturan dari file CSV"""
 
     return pd.read_csv(filename)
+
+
+def parse_target_value(value: str) -> float:
+    """Convert a target cell such as "65.0%" or "111" to a float (NaN if empty)."""
+    try:
+        return float(str(value).strip().rstrip("%"))
+    except ValueError:
+        return math.nan
+
+
+class TargetCache:
+    """
+    In-memory copy of every ``Target/target_{loc}_{lu}.csv`` file.
+
+    Each file is parsed once into a float matrix of shape (KPI, shift) and a
+    ready-made ``{KPI: value}`` dict per shift, so a lookup is a dict access.
+    ``poll`` compares file mtimes and reloads only the files that changed,
+    and ``store`` lets the target editor write through after saving.
+    """
+
+    def __init__(self, folder: Optional[str] = None) -> None:
+        self._folder: Optional[Path] = Path(folder) if folder else None
+        self._matrices: Dict[Tuple[str, str], np.ndarray] = {}
+        self._shifts: Dict[Tuple[str, str, int], Dict[str, float]] = {}
+        self._mtimes: Dict[Tuple[str, str], float] = {}
+
+    @property
+    def folder(self) -> Path:
+        if self._folder is None:
+            self._folder = Path(get_script_folder()) / TARGET_FOLDER
+        return self._folder
+
+    @staticmethod
+    def key_from_path(file_path: str) -> Optional[Tuple[str, str]]:
+        """Return ``(location, lu)`` for a target file name, or None."""
+        match = TARGET_FILE_PATTERN.match(Path(file_path).name)
+        if not match:
+            return None
+        return match["location"], match["lu"]
+
+    def path_for(self, func_location: str, lu: str) -> Path:
+        return self.folder / f"target_{func_location.lower()}_{lu}.csv"
+
+    def preload(self) -> int:
+        """Load every target file in the folder. Returns the number of files."""
+        self.folder.mkdir(parents=True, exist_ok=True)
+        count = 0
+        for entry in os.scandir(self.folder):
+            key = self.key_from_path(entry.name)
+            if key and entry.is_file():
+                self._load(key, entry.path, entry.stat().st_mtime)
+                count += 1
+        return count
+
+    def poll(self) -> List[Tuple[str, str]]:
+        """Reload files whose mtime changed (or that appeared). Returns their keys."""
+        changed: List[Tuple[str, str]] = []
+        if not self.folder.exists():
+            return changed
+        for entry in os.scandir(self.folder):
+            key = self.key_from_path(entry.name)
+            if not key or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+            if self._mtimes.get(key) != mtime:
+                self._load(key, entry.path, mtime)
+                changed.append(key)
+        return changed
+
+    def get(self, func_location: str, lu: str, shift) -> Dict[str, float]:
+        """Return ``{KPI: target}`` for a line, functional location and shift."""
+        location = func_location.lower()
+        shift_key = (location, lu, int(shift))
+        targets = self._shifts.get(shift_key)
+        if targets is None:
+            self._ensure(location, lu)
+            targets = self._shifts[shift_key]
+        return targets
+
+    def value(self, func_location: str, lu: str, shift, kpi: str) -> float:
+        return self.get(func_location, lu, shift)[kpi]
+
+    def matrix(self, func_location: str, lu: str) -> np.ndarray:
+        """Return the raw (KPI x shift) target matrix of a line."""
+        location = func_location.lower()
+        if (location, lu) not in self._matrices:
+            self._ensure(location, lu)
+        return self._matrices[(location, lu)]
+
+    def store(
+        self, file_path: str, header: Sequence[str], rows: Sequence[Sequence[str]]
+    ) -> bool:
+        """
+        Write-through update after ``file_path`` has been saved with ``rows``.
+
+        Only files in the target folder are cached; a target file saved
+        elsewhere (e.g. a copy) is ignored. Returns whether it was stored.
+        """
+        key = self.key_from_path(file_path)
+        if key is None or Path(file_path).resolve().parent != self.folder.resolve():
+            return False
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except OSError:
+            mtime = None
+        self._set(key, header, rows, mtime)
+        return True
+
+    def _ensure(self, location: str, lu: str) -> None:
+        file_path = self.path_for(location, lu)
+        if not file_path.exists():
+            # Same default content as get_targets_file_path
+            file_path = Path(get_targets_file_path(lu, location))
+        self._load((location, lu), str(file_path), file_path.stat().st_mtime)
+
+    def _load(self, key: Tuple[str, str], file_path: str, mtime: float) -> None:
+        with open(file_path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            rows = list(reader)
+        self._set(key, header, rows, mtime)
+
+    def _set(
+        self,
+        key: Tuple[str, str],
+        header: Sequence[str],
+        rows: Sequence[Sequence[str]],
+        mtime: Optional[float],
+    ) -> None:
+        n_shifts = len(header)
+        matrix = np.full((len(TARGET_KPIS), n_shifts), np.nan)
+        for i, row in enumerate(rows[: len(TARGET_KPIS)]):
+            for j, value in enumerate(row[:n_shifts]):
+                matrix[i, j] = parse_target_value(value)
+
+        location, lu = key
+        for j in range(n_shifts):
+            self._shifts[(location, lu, j + 1)] = dict(
+                zip(TARGET_KPIS, matrix[:, j].tolist())
+            )
+        self._matrices[key] = matrix
+        if mtime is not None:
+            self._mtimes[key] = mtime
+
+
+TARGETS = TargetCache()
@@ -1,15 +1,15 @@
 import sys
 from configparser import ConfigParser
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-import httpx
-import openpyxl
-from openpyxl import Workbook
+from src.utils.constants import HEADERS, MAIN_URL
 
-from src.utils.constants import HEADERS, MAIN_URL, NTLM_AUTH
+if TYPE_CHECKING:
+    import httpx
 
 
-async def get_response(link: str) -> httpx.Response:
+async def get_response(link: str) -> "httpx.Response":
     """
     Send an asynchronous GET request to the specified link.
 
@@ -19,6 +19,10 @@ async def get_response(link: str) -> httpx.Response:
     Returns:
         httpx.Response: The response object.
     """
+    import httpx
+
+    from src.utils.constants import NTLM_AUTH
+
     async with httpx.AsyncClient(
         http2=True,
         limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
@@ -27,7 +31,9 @@ async def get_response(link: str) -> httpx.Response:
         return response
 
 
-def get_url_period_equipment_data(link_up: str, date: str, shift: str) -> str:
+def get_url_period_equipment_data(
+    link_up: str, date: str, shift: str, shift_end: Optional[str] = None
+) -> str:
     """
     Generate a URL for fetching stop data.
 
@@ -35,6 +41,7 @@ def get_url_period_equipment_data(link_up: str, date: str, shift: str) -> str:
         link_up (str): The line identifier.
         date (str): The date for the query.
         shift (str): The shift for the query.
+        shift_end (str, optional): Last shift of a multi-shift query.
 
     Returns:
         str: The generated URL.
@@ -47,7 +54,7 @@ def get_url_period_equipment_data(link_up: str, date: str, shift: str) -> str:
         "db_Line": f"{line_prefix}{link_up}",
         "db_SegmentDateMin": date,
         "db_ShiftStart": shift,
-        "db_ShiftEnd": shift,
+        "db_ShiftEnd": shift_end or shift,
     }
     return MAIN_URL + "&".join(f"{key}={value}" for key, value in params.items())
 
@@ -106,6 +113,83 @@ def get_url_norm_period_loss_tree(
     return MAIN_URL + "&".join(f"{key}={value}" for key, value in params.items())
 
 
+def get_url(
+    config: ConfigParser,
+    endpoint_type: str,
+    link_up: str,
+    date_entry: str,
+    shift: str,
+    functional_location: str = "PACK",
+) -> str:
+    """
+    Build the URL of a page, through the report service if one is configured.
+
+    With ``service_url`` set in config.ini, pages are requested as parsed JSON
+    from the shared service (see service.py) instead of from OTS.
+
+    Args:
+        config (ConfigParser): The configuration object.
+        endpoint_type (str): "period_equipment_data" or "norm_period_loss_tree".
+        link_up (str): The link-up number.
+        date_entry (str): The date in "YYYY-MM-DD" format.
+        shift (str): The shift number.
+        functional_location (str): The first four letters of the functional location.
+
+    Returns:
+        str: The service URL if configured, otherwise the OTS URL.
+    """
+    service_url = config.get("DEFAULT", "service_url", fallback="")
+    if service_url:
+        params = {
+            "link_up": link_up,
+            "date": date_entry,
+            "shift": shift,
+            "location": functional_location,
+        }
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        return f"{service_url.rstrip('/')}/{endpoint_type}?{query}"
+    return get_ots_url(
+        config, endpoint_type, link_up, date_entry, shift, functional_location
+    )
+
+
+def get_ots_url(
+    config: ConfigParser,
+    endpoint_type: str,
+    link_up: str,
+    date_entry: str,
+    shift: str,
+    functional_location: str = "PACK",
+    shift_end: Optional[str] = None,
+) -> str:
+    """
+    Build the URL of an SPA page for the configured environment.
+
+    Args:
+        config (ConfigParser): The configuration object.
+        endpoint_type (str): "period_equipment_data" or "norm_period_loss_tree".
+        link_up (str): The link-up number.
+        date_entry (str): The date in "YYYY-MM-DD" format.
+        shift (str): The shift number.
+        functional_location (str): The first four letters of the functional location.
+        shift_end (str, optional): Last shift of a multi-shift equipment query.
+
+    Returns:
+        str: The SPA URL in production, otherwise the local sample page.
+    """
+    if config.get("DEFAULT", "environment") == "production":
+        # For production environment, generate URLs based on endpoint type
+        if endpoint_type not in ["period_equipment_data", "norm_period_loss_tree"]:
+            raise ValueError(f"Invalid endpoint type: {endpoint_type}")
+        if endpoint_type == "period_equipment_data":
+            return get_url_period_equipment_data(link_up, date_entry, shift, shift_end)
+        return get_url_norm_period_loss_tree(
+            link_up, date_entry, shift, functional_location
+        )
+    # For development or testing environment, use local HTML files
+    return f"http://127.0.0.1:5500/assets/{endpoint_type}.html"
+
+
 def resource_path(relative_path: str) -> str:
     """
     Get the absolute path to a resource, compatible with PyInstaller.
@@ -136,6 +220,8 @@ def create_excel_file() -> None:
     """
     Create an Excel file with predefined sheets if it doesn't already exist.
     """
+    from openpyxl import Workbook
+
     file_path = Path(get_script_folder()) / "DB.xlsx"
     sheets_list = ["Data", "Username", "Link", "DailyTarget"]
 
@@ -177,11 +263,15 @@ def get_data_from_excel(sheet_index: int):
     Returns:
         list: A list of values from the first column of the sheet.
     """
+    import openpyxl
+
     file_path = get_excel_filename()
-    wb = openpyxl.load_workbook(file_path)
+    wb = openpyxl.load_workbook(file_path, read_only=True)
     sheet = wb.worksheets[sheet_index]
 
-    data = [row[0].value for row in sheet.iter_rows() if row[0].value]
+    data = [
+        row[0] for row in sheet.iter_rows(max_col=1, values_only=True) if row and row[0]
+    ]
     wb.close()
     return data
 
@@ -202,9 +292,12 @@ def read_config():
     return config
 
 
-def create_config():
+def default_config() -> ConfigParser:
     """
-    Create a default configuration file.
+    The configuration written by ``create_config``.
+
+    Returns:
+        ConfigParser: The default configuration object.
     """
     config = ConfigParser()
     link_up = ["LU18", "LU21", "LU26", "LU27"]
@@ -215,7 +308,52 @@ def create_config():
         "link_up": ",".join(link_up),
         "url": "http://",
         "parameter": "db_SegmentDateMin=2023-10-01&db_ShiftStart=06:00&db_ShiftEnd=14:00",
+        "refresh_interval": "60",
+        "refresh_max_interval": "600",
+        "service_url": "",
+        "anomaly_method": "ewma",
+        "anomaly_z": "3.0",
+        "anomaly_min_shifts": "2",
     }
+    return config
+
+
+def create_config():
+    """
+    Create a default configuration file.
+    """
+    config = default_config()
     config_path = Path(get_script_folder()) / "config.ini"
     with open(config_path, "w") as f:
         config.write(f)
+
+
+STARTUP_PROFILE_ENV = "MPNS_STARTUP_PROFILE"
+
+
+def report_startup_time(window, start: float) -> None:
+    """
+    Print the time to first window when ``MPNS_STARTUP_PROFILE`` is set.
+
+    With ``MPNS_STARTUP_PROFILE=exit`` the window closes right after, which
+    is what benchmarks/bench_startup.py uses.
+
+    Args:
+        window: The root window.
+        start (float): ``time.perf_counter()`` taken before the first import.
+    """
+    import os
+    import time
+
+    mode = os.environ.get(STARTUP_PROFILE_ENV)
+    if not mode:
+        return
+
+    def first_paint():
+        window.update_idletasks()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"time-to-first-window-ms: {elapsed_ms:.0f}", file=sys.stderr)
+        if mode == "exit":
+            window.destroy()
+
+    window.after_idle(first_paint)
@@ -0,0 +1,62 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+import qrcode
+from PIL import Image
+
+QR_SIZE = 500
+QR_BORDER = 4
+QR_CACHE_SIZE = 16
+
+# (sha256 of text, fill, back, size) -> rendered image
+_image_cache: "OrderedDict[Tuple[str, str, str, int], Image.Image]" = OrderedDict()
+# Worker threads render and store QR images at once
+_cache_lock = threading.Lock()
+
+
+def qr_cache_key(
+    text: str, fill_color: str, back_color: str, size: int = QR_SIZE
+) -> Tuple[str, str, str, int]:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return digest, fill_color, back_color, size
+
+
+def remember(cache: OrderedDict, key, value) -> None:
+    """Store ``value`` in an LRU ``cache`` of at most QR_CACHE_SIZE entries."""
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > QR_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def render_qr_image(
+    text: str, fill_color: str, back_color: str, size: int = QR_SIZE
+) -> Image.Image:
+    """
+    Render a QR code no larger than ``size`` pixels.
+
+    The box size is chosen from the module count so the image is drawn at its
+    final size, with no resampling afterwards. Safe to call from a worker thread.
+    """
+    key = qr_cache_key(text, fill_color, back_color, size)
+    with _cache_lock:
+        image = _image_cache.get(key)
+    if image is not None:
+        return image
+
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=qrcode.ERROR_CORRECT_L,
+        box_size=1,
+        border=QR_BORDER,
+    )
+    qr.add_data(text)
+    qr.make(fit=True)
+    qr.box_size = max(1, size // (qr.modules_count + 2 * QR_BORDER))
+
+    image = qr.make_image(fill_color=fill_color, back_color=back_color).get_image()
+    remember(_image_cache, key, image)
+    return image